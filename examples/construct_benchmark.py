@@ -0,0 +1,154 @@
+import os
+import sys
+import timeit
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from nexon_openapi import _models
+from nexon_openapi._models import construct_type
+from nexon_openapi.resources._maplestory import MapleStoryCharacterItemEquipment
+from nexon_openapi.resources._the_first_descendant import TFDWeaponMetadata
+
+# python examples/construct_benchmark.py
+# compares the constructors compiled once per type with compiling them again for every row. Before they were cached,
+# `construct_type` and `BaseModel.construct` introspected the type of every value, so the recompiled times are a lower
+# bound of what they cost then; tests/test_models.py checks that both construct the same values.
+NUMBER = 50
+
+
+def item_equipment(index: int) -> Dict[str, Any]:
+    option = {"str": "10", "dex": "10", "int": "0", "luk": "0", "max_hp": "0", "max_mp": "0"}
+    option.update(attack_power=str(index), magic_power="0", armor="0", speed="0", jump="0")
+    rates = {"ignore_monster_armor": "10", "max_hp_rate": "0", "max_mp_rate": "0"}
+    return {
+        "item_equipment_part": "무기",
+        "equipment_slot": "무기",
+        "item_name": f"아케인셰이드 투핸드소드 {index}",
+        "item_icon": "",
+        "item_description": None,
+        "item_shape_name": "아케인셰이드 투핸드소드",
+        "item_shape_icon": "",
+        "item_gender": None,
+        "potential_option_grade": "레전드리",
+        "additional_potential_option_grade": "유니크",
+        "potential_option_1": "보스 몬스터 공격 시 데미지 : +40%",
+        "potential_option_2": "공격력 : +12%",
+        "potential_option_3": "공격력 : +9%",
+        "addtional_potential_option_1": "공격력 : +12",
+        "addtional_potential_option_2": "STR : +4%",
+        "addtional_potential_option_3": None,
+        "equipment_level_increase": 0,
+        "growth_exp": 0,
+        "growth_level": 0,
+        "scroll_upgrade": "8",
+        "cuttable_count": "255",
+        "golden_hammer_flag": "1",
+        "scroll_resilience_count": "0",
+        "scroll_upgradeable_count": "0",
+        "soul_name": None,
+        "soul_option": None,
+        "starforce": "22",
+        "starforce_scroll_flag": "0",
+        "special_ring_level": 0,
+        "date_expire": None,
+        "item_total_option": {
+            **option,
+            **rates,
+            "boss_damage": "30",
+            "damage": "0",
+            "all_stat": "6",
+            "equipment_level_decrease": 0,
+        },
+        "item_base_option": {**option, **rates, "boss_damage": "30", "all_stat": "0", "base_equipment_level": 200},
+        "item_exceptional_option": option,
+        "item_add_option": {
+            **option,
+            "boss_damage": "0",
+            "damage": "0",
+            "all_stat": "6",
+            "equipment_level_decrease": 0,
+        },
+        "item_etc_option": option,
+        "item_starforce_option": option,
+    }
+
+
+def item_equipment_page() -> Dict[str, Any]:
+    equipment = [item_equipment(index) for index in range(30)]
+    return {
+        "date": "2024-01-01T00:00+09:00",
+        "character_gender": "남",
+        "character_class": "히어로",
+        "preset_no": 1,
+        "item_equipment": equipment,
+        "item_equipment_preset1": equipment,
+        "title": {
+            "title_name": "칭호",
+            "title_icon": "",
+            "title_description": [],
+            "date_expire": "expired",
+            "date_option_expire": "expired",
+        },
+        "dragon_equipment": [],
+        "mechanic_equipment": [],
+    }
+
+
+def weapon_metadata() -> List[Dict[str, Any]]:
+    return [
+        {
+            "weapon_name": f"weapon{index}",
+            "weapon_id": str(index),
+            "image_url": "",
+            "weapon_type": "Assault Rifle",
+            "weapon_tier": "Ultimate",
+            "weapon_rounds_type": "General Rounds",
+            "base_stat": [{"stat_type": "105000026", "stat_value": stat} for stat in range(8)],
+            "firearm_atk": [
+                {"level": level, "firearm": [{"firearm_atk_type": "105000026", "firearm_atk_value": level * 10}]}
+                for level in range(1, 101)
+            ],
+            "weapon_perk_ability_name": None,
+            "weapon_perk_ability_description": None,
+        }
+        for index in range(50)
+    ]
+
+
+def recompiled(type_: Any, rows: List[Dict[str, Any]]) -> Any:
+    """Construct every row with empty caches."""
+
+    def run() -> Any:
+        constructed: List[Any] = []
+        for row in rows:
+            _models._constructors.clear()
+            _models._model_plans.clear()
+            _models._type_adapters.clear()
+            constructed.append(construct_type(value=row, type_=type_))
+        return constructed
+
+    return run
+
+
+def report(name: str, type_: Any, rows: List[Dict[str, Any]]) -> None:
+    rows_type = List[type_]
+    compiled = min(timeit.repeat(lambda: construct_type(value=rows, type_=rows_type), number=NUMBER, repeat=5))
+    baseline = min(timeit.repeat(recompiled(type_, rows), number=NUMBER, repeat=5))
+    compiled_ms, baseline_ms = compiled / NUMBER * 1000, baseline / NUMBER * 1000
+    print(
+        f"{name:<24} compiled {compiled_ms:8.3f}ms  recompiled {baseline_ms:8.3f}ms  x{baseline_ms / compiled_ms:.1f}"
+    )
+
+
+if __name__ == "__main__":
+    equipment = item_equipment_page()
+    report("10 item equipment pages", MapleStoryCharacterItemEquipment, [equipment] * 10)
+    report("50 weapon metadata", TFDWeaponMetadata, weapon_metadata())
+
+    validate = min(
+        timeit.repeat(lambda: MapleStoryCharacterItemEquipment.model_validate(equipment), number=NUMBER, repeat=5)
+    )
+    print(
+        f"{'1 item equipment page':<24} validated {validate / NUMBER * 1000:7.3f}ms (pydantic validation, for reference)"
+    )
@@ -0,0 +1,85 @@
+import json
+import timeit
+from typing import Any, Dict, List, Callable
+
+# python examples/decode_benchmark.py
+# decodes response bodies with every JSON backend that is installed (`pip install nexon_openapi[orjson]` or
+# `nexon_openapi[msgspec]`), the client uses the first one of orjson, msgspec and the standard library
+NUMBER = 200
+
+
+def ranking_page() -> bytes:
+    rows = [
+        {
+            "date": "2024-01-01",
+            "ranking": index + 1,
+            "character_name": f"캐릭터{index}",
+            "world_name": "스카니아",
+            "class_name": "전사",
+            "sub_class_name": "히어로",
+            "character_level": 300 - index % 100,
+            "character_exp": 1_000_000_000 - index,
+            "character_popularity": index % 1000,
+            "character_guildname": "",
+        }
+        for index in range(200)
+    ]
+    return json.dumps({"ranking": rows}, ensure_ascii=False).encode()
+
+
+def item_equipment() -> bytes:
+    options = {"str": "150", "dex": "150", "int": "0", "luk": "0", "max_hp": "0", "attack_power": "300"}
+    items = [
+        {
+            "item_equipment_part": "무기",
+            "item_equipment_slot": "무기",
+            "item_name": "아케인셰이드 투핸드소드",
+            "item_total_option": options,
+            "item_base_option": options,
+            "item_add_option": options,
+            "item_etc_option": options,
+            "item_starforce_option": options,
+            "potential_option_1": "STR : +12%",
+            "potential_option_2": "STR : +9%",
+            "potential_option_3": "STR : +9%",
+            "starforce": "22",
+            "scroll_upgrade": "8",
+        }
+        for _ in range(30)
+    ]
+    body: Dict[str, Any] = {
+        "date": None,
+        "character_gender": "남",
+        "character_class": "히어로",
+        "item_equipment": items,
+    }
+    return json.dumps(body, ensure_ascii=False).encode()
+
+
+def backends() -> Dict[str, Callable[[bytes], Any]]:
+    decoders: Dict[str, Callable[[bytes], Any]] = {"stdlib": json.loads}
+    try:
+        import orjson
+
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+
+        decoders["msgspec"] = msgspec.json.decode
+    except ImportError:
+        pass
+    return decoders
+
+
+if __name__ == "__main__":
+    payloads: List[Any] = [("200 ranking rows", ranking_page()), ("item equipment", item_equipment())]
+    for name, content in payloads:
+        print(f"{name}, {len(content) / 1024:.0f} KiB")
+        baseline = 0.0
+        for backend, decode in backends().items():
+            seconds = min(timeit.repeat(lambda: decode(content), number=NUMBER, repeat=5)) / NUMBER
+            baseline = baseline or seconds
+            megabytes = len(content) / seconds / 1024 / 1024
+            print(f"  {backend:<8} {seconds * 1_000_000:8.1f}us  {megabytes:7.1f} MiB/s  x{baseline / seconds:.1f}")
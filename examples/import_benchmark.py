@@ -0,0 +1,38 @@
+import os
+import sys
+import subprocess
+from typing import Dict, List
+
+# python examples/import_benchmark.py
+# the cold `import nexon_openapi` time, best of `RUNS` new interpreters, and how much of it httpx, pydantic and anyio
+# take. tests/test_import.py guards which modules the import loads.
+RUNS = 10
+
+
+def import_times() -> Dict[str, int]:
+    """The cumulative import time in microseconds of every module imported by `import nexon_openapi`."""
+    env = {**os.environ, "PYTHONPATH": os.path.join(os.path.dirname(__file__), "..", "src")}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import nexon_openapi"], env=env, capture_output=True, text=True
+    ).stderr
+
+    times: Dict[str, int] = {}
+    for line in output.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+if __name__ == "__main__":
+    # the first run writes the bytecode caches
+    import_times()
+    runs: List[Dict[str, int]] = [import_times() for _ in range(RUNS)]
+
+    best = min(runs, key=lambda times: times["nexon_openapi"])
+    dependencies = sum(best.get(name, 0) for name in ("httpx", "pydantic", "anyio"))
+    print(
+        f"import nexon_openapi: {best['nexon_openapi'] / 1000:.1f}ms (httpx, pydantic, anyio: {dependencies / 1000:.1f}ms)"
+    )
+    for name in sorted(best, key=best.__getitem__, reverse=True)[:10]:
+        print(f"  {name}: {best[name] / 1000:.1f}ms")
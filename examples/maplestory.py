@@ -27,6 +27,9 @@ if __name__ == "__main__":
     character_hexa_matrix_stat = client.maplestory.get_character_hexa_matrix_stat(ocid=ocid)
     character_dojang = client.maplestory.get_character_dojang(ocid=ocid)
 
+    # 캐릭터 정보 일괄 조회 (동시 호출)
+    character_snapshot = client.maplestory.get_character_snapshot(ocid=ocid)
+
     # # 유니온 정보 조회
     user_union = client.maplestory.get_user_union(ocid=ocid)
     user_union_raider = client.maplestory.get_user_union_raider(ocid=ocid)
@@ -73,6 +76,9 @@ if __name__ == "__main__":
         character_hexa_matrix_stat = await client.maplestory.get_character_hexa_matrix_stat(ocid=ocid)
         character_dojang = await client.maplestory.get_character_dojang(ocid=ocid)
 
+        # 캐릭터 정보 일괄 조회 (동시 호출)
+        character_snapshot = await client.maplestory.get_character_snapshot(ocid=ocid)
+
         # 유니온 정보 조회
         user_union = await client.maplestory.get_user_union(ocid=ocid)
         user_union_raider = await client.maplestory.get_user_union_raider(ocid=ocid)
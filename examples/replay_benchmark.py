@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import random
+import asyncio
+
+import httpx
+from nexon_openapi import (
+    NexonOpenAPI,
+    NexonOpenAPIAsync,
+    RateLimiter,
+    MetricsCollector,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+# python examples/replay_benchmark.py record   # records fixtures with NEXON_OPENAPI_API_KEY, spends a few requests
+# python examples/replay_benchmark.py          # replays them offline
+FIXTURES = "fixtures"
+CHARACTER_NAME = ""
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["record"]:
+        client = NexonOpenAPI(http_client=httpx.Client(transport=RecordingTransport(FIXTURES)))
+        ocid = client.maplestory.get_ocid(character_name=CHARACTER_NAME)
+        client.maplestory.get_character_basic(ocid=ocid)
+        client.maplestory.get_overall_ranking(page=1)
+        sys.exit()
+
+    async def async_main():
+        # without recordings, the paginated endpoints are still generated
+        transport = ReplayTransport(
+            FIXTURES if os.path.isdir(FIXTURES) else None,
+            latency=lambda request: random.lognormvariate(-3, 0.5),  # ~50ms median with a long tail
+            error_rate=0.01,
+            rate_limit=500,
+            seed=0,
+        )
+        metrics = MetricsCollector()
+        client = NexonOpenAPIAsync(
+            api_key="offline",
+            http_client=httpx.AsyncClient(transport=transport),
+            rate_limiter=RateLimiter(rate=450),
+            hooks=[metrics],
+        )
+
+        started = time.perf_counter()
+        ranking = [row async for row in client.maplestory.iter_overall_ranking(prefetch=4)]
+        history = client.maplestory.iter_starforce_history(start_date="2024-01-01", end_date="2024-01-07")
+        events = [event async for event in history]
+        print(f"{len(ranking)} ranking rows, {len(events)} starforce events in {time.perf_counter() - started:.2f}s")
+        print(transport.status_counts())
+        print(metrics.report())
+
+    asyncio.run(async_main())
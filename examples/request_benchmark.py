@@ -0,0 +1,53 @@
+import json
+import timeit
+from typing import Callable
+
+import httpx
+from nexon_openapi import NexonOpenAPI
+from nexon_openapi._models import FinalRequestOptions
+
+# python examples/request_benchmark.py
+# the client side cost of a request: building it, fingerprinting it for the caches, and a whole call answered
+# in memory by a mock transport, so that no time is spent on the network
+NUMBER = 2000
+
+BASIC = {
+    "date": "2024-01-01T00:00+09:00",
+    "character_name": "character",
+    "world_name": "스카니아",
+    "character_gender": "남",
+    "character_class": "히어로",
+    "character_class_level": "6",
+    "character_level": 280,
+    "character_exp": 1_000_000,
+    "character_exp_rate": "10.000",
+    "character_guild_name": None,
+    "character_image": "https://open.api.nexon.com/static/maplestory/character/look/example",
+    "character_date_create": "2020-01-01T00:00+09:00",
+    "access_flag": "true",
+    "liberation_quest_clear_flag": "true",
+}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, content=json.dumps(BASIC).encode(), headers={"content-type": "application/json"})
+
+
+def report(name: str, stmt: Callable[[], object]) -> None:
+    seconds = min(timeit.repeat(stmt, number=NUMBER, repeat=5))
+    print(f"{name:<32} {seconds / NUMBER * 1_000_000:8.1f}us")
+
+
+if __name__ == "__main__":
+    client = NexonOpenAPI(api_key="offline", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    options = FinalRequestOptions.construct(
+        method="get",
+        url="maplestory/v1/character/stat",
+        params={"ocid": "e0a4f439e53c369866b55297d2f5f4eb", "date": "2024-01-01"},
+    )
+
+    report("_build_request", lambda: client._build_request(options))
+    report("_request_fingerprint", lambda: client._request_fingerprint(options))
+    report("get_character_basic (model)", lambda: client.maplestory.get_character_basic(ocid="ocid"))
+    as_dict = client.with_options(response_mode="dict")
+    report("get_character_basic (dict)", lambda: as_dict.maplestory.get_character_basic(ocid="ocid"))
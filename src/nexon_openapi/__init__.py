@@ -1 +1,98 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
 from ._client import NexonOpenAPI as NexonOpenAPI, NexonOpenAPIAsync as NexonOpenAPIAsync
+
+if TYPE_CHECKING:
+    from ._types import ResponseMode as ResponseMode
+    from ._response import RawResponse as RawResponse
+    from ._json import JSONDecoder as JSONDecoder
+    from ._rate_limit import (
+        RateLimiter as RateLimiter,
+        TokenBucket as TokenBucket,
+        SharedTokenBucket as SharedTokenBucket,
+        RedisTokenBucket as RedisTokenBucket,
+    )
+    from ._backoff import (
+        Backoff as Backoff,
+        ExponentialBackoff as ExponentialBackoff,
+        DecorrelatedJitterBackoff as DecorrelatedJitterBackoff,
+    )
+    from ._cache import (
+        FOREVER as FOREVER,
+        CacheStats as CacheStats,
+        CachePolicy as CachePolicy,
+        InMemoryCache as InMemoryCache,
+        SQLiteCache as SQLiteCache,
+        ResponseCache as ResponseCache,
+        CachedResponse as CachedResponse,
+    )
+    from ._circuit import RetryBudget as RetryBudget, CircuitBreaker as CircuitBreaker, route_family as route_family
+    from ._exceptions import CircuitOpenError as CircuitOpenError
+    from ._hedging import HedgingPolicy as HedgingPolicy
+    from ._hooks import Hooks as Hooks
+    from ._tracing import OpenTelemetryTracing as OpenTelemetryTracing
+    from ._replay import RecordingTransport as RecordingTransport, ReplayTransport as ReplayTransport
+    from ._metrics import (
+        MetricsCollector as MetricsCollector,
+        EndpointMetrics as EndpointMetrics,
+        LatencyHistogram as LatencyHistogram,
+    )
+    from ._pool import PoolStats as PoolStats
+    from ._key_pool import APIKeyPool as APIKeyPool
+    from ._batch import BatchResult as BatchResult
+    from ._id_index import Name as Name, IdIndex as IdIndex
+
+# only the clients are imported with the package, the optional features are imported once one of their names is used
+_LAZY_IMPORTS: Dict[str, str] = {
+    "ResponseMode": "._types",
+    "RawResponse": "._response",
+    "JSONDecoder": "._json",
+    "RateLimiter": "._rate_limit",
+    "TokenBucket": "._rate_limit",
+    "SharedTokenBucket": "._rate_limit",
+    "RedisTokenBucket": "._rate_limit",
+    "Backoff": "._backoff",
+    "ExponentialBackoff": "._backoff",
+    "DecorrelatedJitterBackoff": "._backoff",
+    "FOREVER": "._cache",
+    "CacheStats": "._cache",
+    "CachePolicy": "._cache",
+    "InMemoryCache": "._cache",
+    "SQLiteCache": "._cache",
+    "ResponseCache": "._cache",
+    "CachedResponse": "._cache",
+    "RetryBudget": "._circuit",
+    "CircuitBreaker": "._circuit",
+    "route_family": "._circuit",
+    "CircuitOpenError": "._exceptions",
+    "HedgingPolicy": "._hedging",
+    "Hooks": "._hooks",
+    "OpenTelemetryTracing": "._tracing",
+    "RecordingTransport": "._replay",
+    "ReplayTransport": "._replay",
+    "MetricsCollector": "._metrics",
+    "EndpointMetrics": "._metrics",
+    "LatencyHistogram": "._metrics",
+    "PoolStats": "._pool",
+    "APIKeyPool": "._key_pool",
+    "BatchResult": "._batch",
+    "Name": "._id_index",
+    "IdIndex": "._id_index",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from random import random, uniform
+from typing import Optional
+from typing_extensions import override
+
+
+class Backoff(ABC):
+    """Decides how long to wait before a request is retried.
+
+    The `Retry-After` header of a response takes precedence over the backoff when it asks for at most 60 seconds.
+    """
+
+    @abstractmethod
+    def delay(self, attempt: int, previous: Optional[float]) -> float:
+        """Return the number of seconds to wait before retry number `attempt`, the first retry is attempt 1.
+
+        `previous` is the delay waited before the previous retry of the same request, `None` for the first retry.
+        """
+
+
+class ExponentialBackoff(Backoff):
+    """Waits `initial * 2 ** attempt` seconds before each retry, capped at `maximum` seconds.
+
+    Each delay is shortened by a random fraction of up to `jitter`, this is the default backoff of the clients.
+    """
+
+    initial: float
+    maximum: float
+    jitter: float
+
+    def __init__(self, initial: float = 0.5, maximum: float = 8.0, *, jitter: float = 0.25) -> None:
+        if initial < 0 or maximum < initial:
+            raise ValueError("expected 0 <= initial <= maximum")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.initial = initial
+        self.maximum = maximum
+        self.jitter = jitter
+
+    @override
+    def delay(self, attempt: int, previous: Optional[float]) -> float:  # noqa: ARG002
+        return min(self.initial * pow(2.0, attempt), self.maximum) * (1 - self.jitter * random())
+
+
+class DecorrelatedJitterBackoff(Backoff):
+    """Picks every delay at random between `base` seconds and three times the previous delay, capped at `maximum`.
+
+    Clients that were rate limited at the same time spread their retries out instead of retrying in lockstep.
+    See https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/
+    """
+
+    base: float
+    maximum: float
+
+    def __init__(self, base: float = 0.5, maximum: float = 8.0) -> None:
+        if base <= 0 or maximum < base:
+            raise ValueError("expected 0 < base <= maximum")
+
+        self.base = base
+        self.maximum = maximum
+
+    @override
+    def delay(self, attempt: int, previous: Optional[float]) -> float:  # noqa: ARG002
+        return min(self.maximum, uniform(self.base, max(previous or self.base, self.base) * 3))
@@ -1,21 +1,32 @@
 from __future__ import annotations
 import asyncio
+import copy
 
 import email
 import email.utils
 import json
 import logging
-from random import random
 import time
 from types import TracebackType
+from contextlib import nullcontext
 from typing import (
+    TYPE_CHECKING,
     TypeVar,
+    ClassVar,
     Union,
     Any,
     Dict,
     Generic,
     Mapping,
+    Sequence,
+    Callable,
+    Iterable,
+    Iterator,
+    ContextManager,
+    Awaitable,
+    AsyncIterator,
     Optional,
+    Tuple,
     Type,
     cast,
 )
@@ -35,13 +46,31 @@ from ._types import (
     RequestOptions,
     PostParser,
     AnyMapping,
+    ResponseMode,
 )
 from .utils import is_given, is_mapping
 from ._models import FinalRequestOptions
 from ._compat import model_dump
-from ._qs import Querystring
+from ._qs import Params, Querystring
 from ._response import APIResponse
-from ._exceptions import APIConnectionError, APIStatusError, APITimeoutError
+from ._resource import SyncAPIResource, AsyncAPIResource
+from ._rate_limit import RateLimiter
+from ._backoff import Backoff, ExponentialBackoff
+from ._circuit import is_failure
+from ._pool import pool_stats
+from ._hooks import Hooks
+from ._cache import CachePolicy, ResponseCache, CachedResponse
+from ._batch import BatchResult, run_batch, arun_batch
+from ._id_index import ID_ROUTES, Name, IdIndex, IdRoute, id_route_for_path
+from ._json import JSONDecoder, default_json_decoder
+from ._exceptions import NexonError, APIConnectionError, APIStatusError, APITimeoutError
+
+if TYPE_CHECKING:
+    from ._pool import PoolStats
+    from ._circuit import RetryBudget, CircuitBreaker
+    from ._hedging import HedgingPolicy
+    from ._tracing import OpenTelemetryTracing
+    from ._key_pool import APIKeyPool
 
 try:
     from httpx._config import DEFAULT_TIMEOUT_CONFIG as HTTPX_DEFAULT_TIMEOUT
@@ -53,14 +82,37 @@ log = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
 _T_co = TypeVar("_T_co", covariant=True)
+_ItemT = TypeVar("_ItemT")
 _HttpxClientT = TypeVar("_HttpxClientT", bound=Union[httpx.Client, httpx.AsyncClient])
 
+_DEFAULT_QUERYSTRING = Querystring()
+
+# bounds the number of merged URLs kept by `_prepare_url`, resource paths are a small, fixed set
+_MAX_PREPARED_URLS = 1024
+
 
 class BaseClient(Generic[_HttpxClientT]):
     _client: _HttpxClientT
     max_retries: int
     timeout: Union[float, httpx.Timeout, None]
+    budget: Optional[float]
     _limits: httpx.Limits
+    _rate_limiter: Optional[RateLimiter]
+    _backoff: Backoff
+    _retry_budget: Optional[RetryBudget]
+    _circuit_breaker: Optional[CircuitBreaker]
+    _cache: Optional[ResponseCache]
+    _cache_policy: CachePolicy
+    _id_index: Optional[IdIndex]
+    response_mode: ResponseMode
+    _json_decoder: JSONDecoder
+    _cached_headers: Optional[httpx.Headers]
+    _prepared_urls: Dict[str, httpx.URL]
+    _key_pool: Optional[APIKeyPool]
+    _hooks: Tuple[Hooks, ...]
+    _tracing: Optional[OpenTelemetryTracing]
+    # the header that carries the API key, required to use a key pool
+    _api_key_header: ClassVar[Optional[str]] = None
 
     def __init__(
         self,
@@ -69,24 +121,83 @@ class BaseClient(Generic[_HttpxClientT]):
         base_url: Union[str, httpx.URL],
         max_retries: int = DEFAULT_MAX_RETRIES,
         timeout: Union[float, httpx.Timeout, None] = DEFAULT_TIMEOUT,
+        budget: Optional[float] = None,
         limits: httpx.Limits = DEFAULT_LIMITS,
         strict_response_validation: bool = True,
         custom_headers: Union[Mapping[str, str], None] = None,
         custom_query: Union[Mapping[str, object], None] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        id_index: Optional[IdIndex] = None,
+        response_mode: ResponseMode = "model",
+        json_decoder: Optional[JSONDecoder] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        tracing: Optional[OpenTelemetryTracing] = None,
     ) -> None:
         self._version = version
         self._base_url = httpx.URL(base_url)
         self.max_retries = max_retries
         self.timeout = timeout
+        self.budget = budget
         self._limits = limits
         self._strict_response_validation = strict_response_validation
         self._custom_headers = custom_headers or {}
         self._custom_query = custom_query or {}
         self._idempotency_header = None
+        self._rate_limiter = rate_limiter
+        self._backoff = backoff or ExponentialBackoff()
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+        self._key_pool = key_pool
+        self._cache = cache
+        self._cache_policy = cache_policy or CachePolicy()
+        self._id_index = id_index
+        self.response_mode = response_mode
+        self._json_decoder = json_decoder or default_json_decoder()
+        # the tracing receives the events of the calls it traces like any other hooks
+        self._hooks = (*(hooks or ()), tracing) if tracing is not None else tuple(hooks or ())
+        self._tracing = tracing
+        self._cached_headers = None
+        self._prepared_urls = {}
 
     @property
     def qs(self) -> Querystring:
-        return Querystring()
+        return _DEFAULT_QUERYSTRING
+
+    def _copy_with_options(
+        self: _T,
+        *,
+        response_mode: Union[ResponseMode, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> _T:
+        """The copy of the client returned by `with_options()`, which the clients type by its response mode.
+
+        The copy shares the connection pool, the rate limiter and the caches of this client.
+        """
+        client = copy.copy(self)
+        # resources that were already constructed are bound to this client
+        for name, value in list(vars(client).items()):
+            if isinstance(value, (SyncAPIResource, AsyncAPIResource)):
+                delattr(client, name)
+
+        if not isinstance(response_mode, NotGiven):
+            client.response_mode = response_mode  # type: ignore[attr-defined]
+        if is_given(budget):
+            client.budget = budget  # type: ignore[attr-defined]
+        return client
+
+    def pool_stats(self) -> Optional[PoolStats]:
+        """A snapshot of the connection pool, `None` if the HTTP client does not use an httpx connection pool."""
+        return pool_stats(self._client)
+
+    def _response_mode(self, options: FinalRequestOptions) -> ResponseMode:
+        # `is_given` would widen the literal to `str`
+        return self.response_mode if isinstance(options.response_mode, NotGiven) else options.response_mode
 
     def _enforce_trailing_slash(self, url: httpx.URL) -> httpx.URL:
         if url.raw_path.endswith(b"/"):
@@ -131,27 +242,65 @@ class BaseClient(Generic[_HttpxClientT]):
     ) -> int:
         return remaining_retries if remaining_retries is not None else options.get_max_retries(self.max_retries)
 
+    def _batch_concurrency(self, concurrency: Optional[int]) -> int:
+        if concurrency is not None:
+            return concurrency
+        # by default, keep every connection of the pool busy
+        return self._limits.max_connections or DEFAULT_LIMITS.max_connections or 1
+
     def _build_headers(self, options: FinalRequestOptions) -> httpx.Headers:
         custom_headers = options.headers or {}
+        if not custom_headers:
+            return self._default_request_headers()
+
         headers_dict = _merge_mappings(self.default_headers, custom_headers)
         self._validate_headers(headers_dict, custom_headers)
 
         # headers are case-insensitive while dictionaries are not.
         return httpx.Headers(headers_dict)
 
+    def _default_request_headers(self) -> httpx.Headers:
+        """The headers of a request without custom headers, built once.
+
+        httpx copies them into every request, so they are never mutated. Call `_invalidate_headers()`
+        when anything `default_headers` depends on changes.
+        """
+        headers = self._cached_headers
+        if headers is None:
+            headers_dict = _merge_mappings(self.default_headers, {})
+            self._validate_headers(headers_dict, {})
+            headers = self._cached_headers = httpx.Headers(headers_dict)
+        return headers
+
+    def _invalidate_headers(self) -> None:
+        self._cached_headers = None
+
     def _prepare_url(self, url: str) -> httpx.URL:
         """
         Merge a URL argument together with any 'base_url' on the client,
         to create the URL used for the outgoing request.
         """
+        prepared = self._prepared_urls.get(url)
+        if prepared is not None:
+            return prepared
+
         # Copied from httpx's `_merge_url` method.
         merge_url = httpx.URL(url)
         if merge_url.is_relative_url:
             merge_raw_path = self.base_url.raw_path + merge_url.raw_path.lstrip(b"/")
-            return self.base_url.copy_with(raw_path=merge_raw_path)
+            merge_url = self.base_url.copy_with(raw_path=merge_raw_path)
 
+        if len(self._prepared_urls) >= _MAX_PREPARED_URLS:
+            self._prepared_urls.clear()
+        self._prepared_urls[url] = merge_url
         return merge_url
 
+    def _request_fingerprint(self, options: FinalRequestOptions) -> str:
+        """Identify the resource a request points to by its method, URL and stringified query params."""
+        params = cast(Params, _merge_mappings(self._custom_query, options.params))
+        query = self.qs.stringify(params) if params else ""
+        return f"{options.method.upper()} {self._prepare_url(options.url)}?{query}"
+
     def _build_request(
         self,
         options: FinalRequestOptions,
@@ -171,18 +320,108 @@ class BaseClient(Generic[_HttpxClientT]):
                 raise RuntimeError(f"Unexpected JSON data type, {type(json_data)}, cannot merge with `extra_body`")
 
         headers = self._build_headers(options)
-        params = _merge_mappings(self._custom_query, options.params)
+        params = cast(Params, _merge_mappings(self._custom_query, options.params))
+
+        url = self._prepare_url(options.url)
+        if params:
+            # appending the encoded query parses the URL once, merging `params=` into it parses it three times.
+            # `stringify` escapes a literal "+" so the remaining ones are spaces, encoded as httpx would
+            query = self.qs.stringify(params).replace("+", "%20")
+            if query:
+                url = httpx.URL(f"{url}{'&' if url.query else '?'}{query}")
 
         return self._client.build_request(
             headers=headers,
-            timeout=self.timeout if isinstance(options.timeout, NotGiven) else options.timeout,
+            timeout=self._attempt_timeout(options),
             method=options.method,
-            url=self._prepare_url(options.url),
-            params=self.qs.stringify(params) if params else None,  # type: ignore
+            url=url,
             json=json_data,
             **kwargs,
         )
 
+    def _cache_ttl(self, options: FinalRequestOptions) -> Optional[float]:
+        if self._cache is None or options.method.lower() != "get":
+            return None
+
+        ttl = self._cache_policy.ttl(options.url, _merge_mappings(self._custom_query, options.params))
+        if ttl is None or ttl <= 0:
+            return None
+        return ttl
+
+    def _cache_key(self, options: FinalRequestOptions) -> Optional[str]:
+        """The key of the response to `options` in the cache, `None` if it must not be cached."""
+        if self._cache_ttl(options) is None:
+            return None
+        return self._request_fingerprint(options)
+
+    def _cached_response(
+        self, options: FinalRequestOptions, cached: Optional[CachedResponse]
+    ) -> Optional[httpx.Response]:
+        stats = cast(ResponseCache, self._cache).stats
+        if cached is None:
+            stats.misses += 1
+            self._emit("on_cache_miss", options.url, source="cache")
+            return None
+
+        stats.hits += 1
+        self._emit("on_cache_hit", options.url, source="cache")
+        log.debug("Serving %s from the response cache", options.url)
+        return cached.to_response(self._build_request(options))
+
+    def _id_route(self, game: str) -> IdRoute:
+        route = ID_ROUTES.get(game)
+        if route is None:
+            raise ValueError(f"Unknown game {game!r}, expected one of {', '.join(ID_ROUTES)}")
+        return route
+
+    def _named_ids(self, options: FinalRequestOptions) -> Optional[Tuple[IdRoute, Dict[str, Name]]]:
+        """The query params of `options` given as a `Name`, to be resolved into ids."""
+        names = {key: value for key, value in options.params.items() if isinstance(value, Name)}
+        if not names:
+            return None
+        return self._id_route(options.url.strip("/").split("/", 1)[0]), names
+
+    def _indexed_name(self, options: FinalRequestOptions) -> Optional[Tuple[IdRoute, str, Optional[str]]]:
+        if self._id_index is None or options.method.lower() != "get":
+            return None
+
+        route = id_route_for_path(options.url)
+        if route is None:
+            return None
+
+        params = _merge_mappings(self._custom_query, options.params)
+        name = params.get(route.name_param)
+        world = params.get(route.world_param) if route.world_param is not None else None
+        if not isinstance(name, str) or not (world is None or isinstance(world, str)):
+            return None
+        return route, name, world
+
+    def _record_index_lookup(self, url: str, id: Optional[str]) -> None:
+        index = cast(IdIndex, self._id_index)
+        if id is None:
+            index.stats.misses += 1
+            self._emit("on_cache_miss", url, source="id_index")
+        else:
+            index.stats.hits += 1
+            self._emit("on_cache_hit", url, source="id_index")
+
+    def _indexed_response(
+        self, options: FinalRequestOptions, route: IdRoute, id: Optional[str]
+    ) -> Optional[httpx.Response]:
+        self._record_index_lookup(options.url, id)
+        if id is None:
+            return None
+
+        log.debug("Serving %s from the id index", options.url)
+        return httpx.Response(200, json={route.id_field: id}, request=self._build_request(options))
+
+    def _indexed_id(self, options: FinalRequestOptions, route: IdRoute, response: httpx.Response) -> Optional[str]:
+        try:
+            return route.read_id(self._json_decoder(response.content))
+        except Exception:
+            log.debug("Could not read the %s of %s, it is not indexed", route.id_field, options.url, exc_info=True)
+            return None
+
     def _process_response(
         self,
         cast_to: Type[ResponseT],
@@ -194,9 +433,32 @@ class BaseClient(Generic[_HttpxClientT]):
             cast_to=cast_to,
             strict_response_validation=self._strict_response_validation,
             options=options,
+            response_mode=self._response_mode(options),
+            json_decoder=self._json_decoder,
         )
 
-        return api_response.parse()
+        if not self._hooks:
+            return api_response.parse()
+
+        started = time.monotonic()
+        parsed = api_response.parse()
+        self._emit("on_parse", options.url, response, elapsed=time.monotonic() - started)
+        return parsed
+
+    def _emit(self, event: str, *args: Any, **kwargs: Any) -> None:
+        for hooks in self._hooks:
+            try:
+                getattr(hooks, event)(*args, **kwargs)
+            except Exception:
+                log.exception("The %s hook of %r failed", event, hooks)
+
+    def _trace(self, options: FinalRequestOptions) -> ContextManager[None]:
+        if self._tracing is None:
+            return nullcontext()
+        return self._tracing.span(options, self._base_url.host)
+
+    def _attempt(self, options: FinalRequestOptions, remaining_retries: int) -> int:
+        return options.get_max_retries(self.max_retries) - remaining_retries + 1
 
     @property
     def custom_auth(self) -> Optional[httpx.Auth]:
@@ -238,51 +500,148 @@ class BaseClient(Generic[_HttpxClientT]):
     @base_url.setter
     def base_url(self, url: Union[httpx.URL, str]) -> None:
         self._base_url = self._enforce_trailing_slash(url if isinstance(url, httpx.URL) else httpx.URL(url))
+        # the URLs merged with the previous base URL are stale, the dict may be shared with `with_options()` copies
+        self._prepared_urls = {}
 
     def _calculate_retry_timeout(
         self,
         remaining_retries: int,
         options: FinalRequestOptions,
         response_headers: Optional[httpx.Headers] = None,
+        previous_delay: Optional[float] = None,
     ) -> float:
         max_retries = options.get_max_retries(self.max_retries)
-        try:
-            # About the Retry-After header: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After
-            #
-            # <http-date>". See https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After#syntax for
-            # details.
-            if response_headers is not None:
-                retry_header = response_headers.get("retry-after")
-                try:
-                    retry_after = float(retry_header)
-                except Exception:
-                    retry_date_tuple = email.utils.parsedate_tz(retry_header)
-                    if retry_date_tuple is None:
-                        retry_after = -1
-                    else:
-                        retry_date = email.utils.mktime_tz(retry_date_tuple)
-                        retry_after = int(retry_date - time.time())
-            else:
-                retry_after = -1
-
-        except Exception:
-            retry_after = -1
+        retry_after = _parse_retry_after(response_headers) if response_headers is not None else -1
 
         # If the API asks us to wait a certain amount of time (and it's a reasonable amount), just do what it says.
         if 0 < retry_after <= 60:
             return retry_after
 
-        initial_retry_delay = 0.5
-        max_retry_delay = 8.0
         nb_retries = max_retries - remaining_retries
+        timeout = self._backoff.delay(nb_retries, previous_delay)
+        return timeout if timeout >= 0 else 0
+
+    def _retry_delay(
+        self,
+        options: FinalRequestOptions,
+        remaining_retries: int,
+        response_headers: Optional[httpx.Headers],
+        previous_delay: Optional[float],
+        *,
+        immediate: bool = False,
+    ) -> Optional[float]:
+        """The number of seconds to wait before retrying the request, `None` if it must not be retried."""
+        if remaining_retries <= 0:
+            return None
+
+        if immediate:
+            delay = 0.0
+        else:
+            delay = self._calculate_retry_timeout(remaining_retries - 1, options, response_headers, previous_delay)
+
+        # sleeping past the deadline only to fail with a timeout would hide the actual error
+        remaining = self._remaining_budget(options)
+        if remaining is not None and delay >= remaining:
+            log.info("Not retrying request to %s, its deadline passes in %.3f seconds", options.url, remaining)
+            return None
+
+        if self._retry_budget is not None and not self._retry_budget.try_retry():
+            log.info("Not retrying request to %s, the retry budget is exhausted", options.url)
+            return None
+
+        return delay
+
+    def _start_deadline(self, options: FinalRequestOptions) -> None:
+        if options.deadline is not None:
+            return
+        budget = options.budget if is_given(options.budget) else self.budget
+        if budget is not None:
+            options.deadline = time.monotonic() + budget
+
+    def _remaining_budget(self, options: FinalRequestOptions) -> Optional[float]:
+        if options.deadline is None:
+            return None
+        return options.deadline - time.monotonic()
+
+    def _check_wait(self, options: FinalRequestOptions, request: httpx.Request, delay: float, reason: str) -> None:
+        remaining = self._remaining_budget(options)
+        if remaining is not None and delay > remaining:
+            raise self._deadline_error(options, request, reason)
+
+    def _deadline_error(self, options: FinalRequestOptions, request: httpx.Request, reason: str) -> APITimeoutError:
+        log.info("Not sending request to %s, waiting for %s would pass its deadline", options.url, reason)
+        return APITimeoutError(request=request)
+
+    def _refresh_attempt_timeout(self, options: FinalRequestOptions, request: httpx.Request) -> None:
+        """Shorten the timeout of `request` to the time left after it waited for its quota."""
+        if options.deadline is not None:
+            extensions = cast(Dict[str, Any], request.extensions)  # pyright: ignore[reportUnknownMemberType]
+            extensions["timeout"] = httpx.Timeout(self._attempt_timeout(options)).as_dict()
+
+    def _attempt_timeout(self, options: FinalRequestOptions) -> Union[float, httpx.Timeout, None]:
+        """The timeout of the next attempt, shortened to the time left until the deadline of the request."""
+        timeout = self.timeout if isinstance(options.timeout, NotGiven) else options.timeout
+        remaining = self._remaining_budget(options)
+        if remaining is None:
+            return timeout
+
+        remaining = max(remaining, 0.0)
+        if isinstance(timeout, httpx.Timeout):
+            return httpx.Timeout(
+                connect=_cap_timeout(timeout.connect, remaining),
+                read=_cap_timeout(timeout.read, remaining),
+                write=_cap_timeout(timeout.write, remaining),
+                pool=_cap_timeout(timeout.pool, remaining),
+            )
+        return _cap_timeout(timeout, remaining)
 
-        # Apply exponential backoff, but not more than the max.
-        sleep_seconds = min(initial_retry_delay * pow(2.0, nb_retries), max_retry_delay)
+    def _before_attempt(
+        self, options: FinalRequestOptions, retry_delay: Optional[float], *, hedge: bool = False
+    ) -> None:
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.before_request(options.url)
 
-        # Apply some jitter, plus-or-minus half a second.
-        jitter = 1 - 0.25 * random()
-        timeout = sleep_seconds * jitter
-        return timeout if timeout >= 0 else 0
+        # only the first attempt of a request has no retry delay, retries are withdrawn from the budget instead.
+        # A hedge is part of the request it hedges
+        if self._retry_budget is not None and retry_delay is None and not hedge:
+            self._retry_budget.record_request()
+
+    def _record_attempt(self, options: FinalRequestOptions, response: Optional[httpx.Response]) -> None:
+        breaker = self._circuit_breaker
+        if breaker is None:
+            return
+
+        if is_failure(response.status_code if response is not None else None):
+            breaker.record_failure(options.url)
+        else:
+            breaker.record_success(options.url)
+
+    def _checkout_key(self, request: httpx.Request) -> Tuple[Optional[str], float]:
+        """Send `request` with the key picked by the key pool, return the key and how long to wait for its quota."""
+        pool = self._key_pool
+        if pool is None or self._api_key_header is None:
+            return None, 0.0
+
+        key, delay = pool.checkout()
+        request.headers[self._api_key_header] = key
+        return key, delay
+
+    def _bench_key(self, key: Optional[str], response: httpx.Response) -> bool:
+        """Bench `key` if `response` says its quota is exhausted, return whether to retry with another key."""
+        pool = self._key_pool
+        if pool is None or key is None:
+            return False
+
+        if response.status_code == 429:
+            retry_after = _parse_retry_after(response.headers)
+            pool.bench(key, retry_after if retry_after > 0 else pool.rate_limit_bench)
+        elif response.status_code == 403:
+            pool.bench(key, pool.forbidden_bench)
+        else:
+            return False
+
+        log.info("Benched an API key after a %i response to %s", response.status_code, response.request.url)
+        return pool.has_active_key()
 
     def _should_retry(self, response: httpx.Response) -> bool:
         # TODO: read response header and decide whether to retry or not
@@ -306,6 +665,41 @@ class BaseClient(Generic[_HttpxClientT]):
         return False
 
 
+def _with_keepalive_expiry(limits: httpx.Limits, keepalive_expiry: Optional[float]) -> httpx.Limits:
+    if keepalive_expiry is None:
+        return limits
+    return httpx.Limits(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+
+
+def _cap_timeout(timeout: Optional[float], limit: float) -> float:
+    return limit if timeout is None else min(timeout, limit)
+
+
+def _parse_retry_after(headers: httpx.Headers) -> float:
+    """The number of seconds the `Retry-After` header asks to wait, `-1` if it is missing or invalid."""
+    # About the Retry-After header: https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After
+    retry_header = headers.get("retry-after")
+    if retry_header is None:
+        return -1
+    try:
+        return float(retry_header)
+    except ValueError:
+        pass
+
+    # <http-date>, see https://developer.mozilla.org/en-US/docs/Web/HTTP/Headers/Retry-After#syntax
+    try:
+        retry_date_tuple = email.utils.parsedate_tz(retry_header)
+        if retry_date_tuple is None:
+            return -1
+        return int(email.utils.mktime_tz(retry_date_tuple) - time.time())
+    except Exception:
+        return -1
+
+
 class SyncHttpxClientWrapper(httpx.Client):
     def __del__(self) -> None:
         try:
@@ -325,11 +719,28 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         limits: httpx.Limits,
         max_retries: int = DEFAULT_MAX_RETRIES,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = None,
+        budget: Optional[float] = None,
         http_client: Union[httpx.Client, None] = None,
         custom_headers: Union[Mapping[str, str], None] = None,
         custom_query: Union[Mapping[str, object], None] = None,
         strict_response_validation: bool,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        id_index: Optional[IdIndex] = None,
+        response_mode: ResponseMode = "model",
+        json_decoder: Optional[JSONDecoder] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        tracing: Optional[OpenTelemetryTracing] = None,
+        http2: bool = False,
+        keepalive_expiry: Optional[float] = None,
     ) -> None:
+        limits = _with_keepalive_expiry(limits, keepalive_expiry)
+
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
             # timeout set then we use that timeout.
@@ -347,22 +758,46 @@ class SyncAPIClient(BaseClient[httpx.Client]):
             version=version,
             limits=limits,
             timeout=timeout,
+            budget=budget,
             base_url=base_url,
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
             strict_response_validation=strict_response_validation,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            key_pool=key_pool,
+            cache=cache,
+            cache_policy=cache_policy,
+            id_index=id_index,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            tracing=tracing,
         )
 
         self._client = http_client or SyncHttpxClientWrapper(
             base_url=base_url,
             timeout=timeout,
             limits=limits,
+            http2=http2,
         )
 
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    def warmup(self, connections: int = 1) -> None:
+        """Open up to `connections` connections to the API ahead of the first requests, so that they do not pay
+        for the TCP and TLS handshakes. Only the connections the pool keeps alive are kept open."""
+        for result in run_batch(self._warmup_connection, range(connections), concurrency=connections):
+            if not result.ok:
+                log.debug("Failed to open a connection to %s: %r", self.base_url, result.error)
+
+    def _warmup_connection(self, _: int) -> None:
+        self._client.request("HEAD", self.base_url, timeout=self.timeout)
+
     def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -402,6 +837,62 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         """
         return None
 
+    def _resolve_names(self, options: FinalRequestOptions) -> None:
+        named = self._named_ids(options)
+        if named is not None:
+            route, names = named
+            ids = {key: self._resolve_id(route, name, name.world) for key, name in names.items()}
+            options.params = {**options.params, **ids}
+
+    def _resolve_id(self, route: IdRoute, name: str, world: Optional[str]) -> str:
+        if self._id_index is not None and not route.id_only:
+            id = self._id_index.get(route.game, str(name), world)
+            self._record_index_lookup(route.path, id)
+            if id is not None:
+                return id
+
+        response = self.get(
+            route.path,
+            cast_to=Dict[str, Any],
+            options={"params": route.params(str(name), world), "response_mode": "dict"},
+        )
+        return route.read_id(response)
+
+    def _load_cached_response(self, options: FinalRequestOptions) -> Optional[httpx.Response]:
+        key = self._cache_key(options)
+        if key is None:
+            return None
+        return self._cached_response(options, cast(ResponseCache, self._cache).get(key))
+
+    def _store_cached_response(self, options: FinalRequestOptions, response: httpx.Response) -> None:
+        ttl = self._cache_ttl(options)
+        if ttl is not None:
+            key = self._request_fingerprint(options)
+            cast(ResponseCache, self._cache).set(key, CachedResponse.from_response(response), ttl)
+
+    def _load_indexed_response(self, options: FinalRequestOptions) -> Optional[httpx.Response]:
+        indexed = self._indexed_name(options)
+        if indexed is None:
+            return None
+
+        route, name, world = indexed
+        if not route.id_only:
+            # the response carries more than the id, names of these routes are looked up by `_resolve_id`
+            return None
+
+        id = cast(IdIndex, self._id_index).get(route.game, name, world)
+        return self._indexed_response(options, route, id)
+
+    def _store_indexed_id(self, options: FinalRequestOptions, response: httpx.Response) -> None:
+        indexed = self._indexed_name(options)
+        if indexed is None:
+            return
+
+        route, name, world = indexed
+        id = self._indexed_id(options, route, response)
+        if id is not None:
+            cast(IdIndex, self._id_index).set(route.game, name, id, world)
+
     def request(
         self,
         *,
@@ -409,11 +900,22 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         options: FinalRequestOptions,
         remaining_retries: Optional[int] = None,
     ) -> ResponseT:
-        return self._request(
-            cast_to=cast_to,
-            options=options,
-            remaining_retries=remaining_retries,
-        )
+        with self._trace(options):
+            self._resolve_names(options)
+            cached = self._load_indexed_response(options) or self._load_cached_response(options)
+            if cached is not None:
+                return self._process_response(cast_to=cast_to, options=options, response=cached)
+
+            self._start_deadline(options)
+            try:
+                return self._request(
+                    cast_to=cast_to,
+                    options=options,
+                    remaining_retries=remaining_retries,
+                )
+            except NexonError as err:
+                self._emit("on_error", options.url, err)
+                raise
 
     def _request(
         self,
@@ -421,6 +923,7 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         cast_to: Type[ResponseT],
         options: FinalRequestOptions,
         remaining_retries: Optional[int],
+        retry_delay: Optional[float] = None,
     ) -> ResponseT:
         self._prepare_options(options)
 
@@ -428,29 +931,43 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         request = self._build_request(options)
         self._prepare_request(request)
 
+        remaining = self._remaining_budget(options)
+        if remaining is not None and remaining <= 0:
+            raise APITimeoutError(request=request)
+
+        self._before_attempt(options, retry_delay)
+
+        # waits that would pass the deadline of the request fail it at once
+        if self._rate_limiter is not None:
+            if not self._rate_limiter.acquire(options.url, timeout=self._remaining_budget(options)):
+                raise self._deadline_error(options, request, "the rate limiter")
+
+        key, key_delay = self._checkout_key(request)
+        if key_delay > 0:
+            self._check_wait(options, request, key_delay, "the quota of the API key")
+            time.sleep(key_delay)
+        self._refresh_attempt_timeout(options, request)
+
+        if self._hooks:
+            self._emit("on_request", options.url, request, attempt=self._attempt(options, retries))
+        started = time.monotonic()
         try:
             response = self._client.send(
                 request,
                 auth=self.custom_auth,
             )
         except httpx.TimeoutException as err:
-            if retries > 0:
-                return self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    response_headers=None,
-                )
+            self._record_attempt(options, None)
+            delay = self._retry_delay(options, retries, None, retry_delay)
+            if delay is not None:
+                return self._retry_request(options, cast_to, retries, delay, request)
 
             raise APITimeoutError(request=request) from err
         except Exception as err:
-            if retries > 0:
-                return self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    response_headers=None,
-                )
+            self._record_attempt(options, None)
+            delay = self._retry_delay(options, retries, None, retry_delay)
+            if delay is not None:
+                return self._retry_request(options, cast_to, retries, delay, request)
 
             raise APIConnectionError(request=request) from err
 
@@ -461,18 +978,22 @@ class SyncAPIClient(BaseClient[httpx.Client]):
             response.status_code,
             response.reason_phrase,
         )
+        self._emit("on_response", options.url, response, elapsed=time.monotonic() - started)
+        self._record_attempt(options, response)
+        rotate_key = self._bench_key(key, response)
 
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-            if retries > 0 and self._should_retry(err.response):
+            delay = (
+                # another key has quota left, there is no need to back off
+                self._retry_delay(options, retries, err.response.headers, retry_delay, immediate=rotate_key)
+                if rotate_key or self._should_retry(err.response)
+                else None
+            )
+            if delay is not None:
                 err.response.close()
-                return self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    err.response.headers,
-                )
+                return self._retry_request(options, cast_to, retries, delay, request, err.response)
 
             # If the response is streamed then we need to explicitly read the response
             # to completion before attempting to access the response text.
@@ -481,6 +1002,9 @@ class SyncAPIClient(BaseClient[httpx.Client]):
 
             raise self._make_status_error_from_response(err.response) from None
 
+        self._store_cached_response(options, response)
+        self._store_indexed_id(options, response)
+
         return self._process_response(
             cast_to=cast_to,
             options=options,
@@ -492,11 +1016,15 @@ class SyncAPIClient(BaseClient[httpx.Client]):
         options: FinalRequestOptions,
         cast_to: Type[ResponseT],
         remaining_retries: int,
-        response_headers: Optional[httpx.Headers],
+        timeout: float,
+        request: httpx.Request,
+        response: Optional[httpx.Response] = None,
     ) -> ResponseT:
         remaining = remaining_retries - 1
-        timeout = self._calculate_retry_timeout(remaining, options, response_headers)
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
+        if self._hooks:
+            attempt = self._attempt(options, remaining_retries)
+            self._emit("on_retry", options.url, request, attempt=attempt, delay=timeout, response=response)
 
         # In a synchronous context we are blocking the entire thread. Up to the library user to run the client in a
         # different thread if necessary.
@@ -506,8 +1034,66 @@ class SyncAPIClient(BaseClient[httpx.Client]):
             options=options,
             cast_to=cast_to,
             remaining_retries=remaining,
+            retry_delay=timeout,
         )
 
+    def batch(
+        self,
+        fn: Callable[[_ItemT], _T],
+        items: Iterable[_ItemT],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult[_ItemT, _T]]:
+        """Call `fn` for every item on a thread pool and yield a `BatchResult` for each of them as they complete.
+
+        ```py
+        for result in client.batch(lambda ocid: client.maplestory.get_character_stat(ocid=ocid), ocids):
+            if result.ok:
+                print(result.item, result.result)
+        ```
+
+        At most `concurrency` calls are in flight at any time, defaulting to the size of the connection pool.
+        Every call is retried as usual, a call that still fails is reported through `BatchResult.error`
+        without failing the rest of the batch.
+        """
+        return run_batch(fn, items, concurrency=self._batch_concurrency(concurrency))
+
+    def resolve_ids(
+        self,
+        game: str,
+        names: Iterable[str],
+        *,
+        world: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> Iterator[BatchResult[str, str]]:
+        """Resolve many names of `game` (e.g. `"maplestory"`, `"ca"`, `"tfd"`) into their `ocid`/`ouid`.
+
+        ```py
+        for result in client.resolve_ids("maplestory", names):
+            if result.ok:
+                print(result.item, result.result)
+        ```
+
+        With an `id_index` on the client, the names already in the index are looked up at once and yielded first,
+        the remaining ones are resolved concurrently like `batch()` and stored in the index.
+        """
+        route = self._id_route(game)
+        route.params("", world)  # fail early if `world` is missing
+        names = list(dict.fromkeys(names))
+        known: Dict[str, str] = {}
+        if self._id_index is not None:
+            # the remaining names are counted as misses when they are looked up again by the request
+            known = self._id_index.get_many(route.game, names, world)
+            self._id_index.stats.hits += len(known)
+        for name, id in known.items():
+            yield BatchResult(name, result=id)
+
+        def resolve(name: str) -> str:
+            return self._resolve_id(route, name, world)
+
+        missing = (name for name in names if name not in known)
+        yield from self.batch(resolve, missing, concurrency=concurrency)
+
     def get(
         self,
         path: str,
@@ -570,6 +1156,8 @@ def make_request_options(
     idempotency_key: Optional[str] = None,
     timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
     post_parser: Union[PostParser, NotGiven] = NOT_GIVEN,
+    response_mode: Union[ResponseMode, NotGiven] = NOT_GIVEN,
+    budget: Union[float, None, NotGiven] = NOT_GIVEN,
 ) -> RequestOptions:
     """Create a dict of type RequestOptions without keys of NotGiven values."""
     options: RequestOptions = {}
@@ -595,6 +1183,12 @@ def make_request_options(
         # internal
         options["post_parser"] = post_parser  # type: ignore
 
+    if not isinstance(response_mode, NotGiven):
+        options["response_mode"] = response_mode
+
+    if is_given(budget):
+        options["budget"] = budget
+
     return options
 
 
@@ -620,6 +1214,9 @@ class AsyncHttpxClientWrapper(httpx.AsyncClient):
 
 class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
     _client: httpx.AsyncClient
+    _coalesce_requests: bool
+    _hedging: Optional[HedgingPolicy]
+    _inflight: Dict[Tuple[str, object, str], asyncio.Future[Any]]
 
     def __init__(
         self,
@@ -628,13 +1225,30 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
         base_url: Union[str, httpx.URL],
         max_retries: int = DEFAULT_MAX_RETRIES,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Optional[float] = None,
         limits: Optional[httpx.Limits] = None,
         http_client: Optional[httpx.AsyncClient] = None,
         custom_headers: Optional[Mapping[str, str]] = None,
         custom_query: Optional[Mapping[str, object]] = None,
         strict_response_validation: bool,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        id_index: Optional[IdIndex] = None,
+        response_mode: ResponseMode = "model",
+        json_decoder: Optional[JSONDecoder] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        tracing: Optional[OpenTelemetryTracing] = None,
+        coalesce_requests: bool = False,
+        hedging: Optional[HedgingPolicy] = None,
+        http2: bool = False,
+        keepalive_expiry: Optional[float] = None,
     ) -> None:
-        limits = DEFAULT_LIMITS if limits is None else limits
+        limits = _with_keepalive_expiry(DEFAULT_LIMITS if limits is None else limits, keepalive_expiry)
 
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -655,10 +1269,23 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
             limits=limits,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(httpx.Timeout, timeout),
+            budget=budget,
             max_retries=max_retries,
             custom_query=custom_query,
             custom_headers=custom_headers,
             strict_response_validation=strict_response_validation,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            key_pool=key_pool,
+            cache=cache,
+            cache_policy=cache_policy,
+            id_index=id_index,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            tracing=tracing,
         )
 
         self._client = http_client or AsyncHttpxClientWrapper(
@@ -666,11 +1293,26 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(httpx.Timeout, timeout),
             limits=limits,
+            http2=http2,
         )
 
+        self._coalesce_requests = coalesce_requests
+        self._hedging = hedging
+        self._inflight = {}
+
     def is_closed(self) -> bool:
         return self._client.is_closed
 
+    async def warmup(self, connections: int = 1) -> None:
+        """Open up to `connections` connections to the API ahead of the first requests, so that they do not pay
+        for the TCP and TLS handshakes. Only the connections the pool keeps alive are kept open."""
+        async for result in arun_batch(self._warmup_connection, range(connections), concurrency=connections):
+            if not result.ok:
+                log.debug("Failed to open a connection to %s: %r", self.base_url, result.error)
+
+    async def _warmup_connection(self, _: int) -> None:
+        await self._client.request("HEAD", self.base_url, timeout=self.timeout)
+
     async def close(self) -> None:
         """Close the underlying HTTPX client.
 
@@ -707,8 +1349,204 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
         """
         return None
 
+    async def _resolve_names(self, options: FinalRequestOptions) -> None:
+        named = self._named_ids(options)
+        if named is not None:
+            route, names = named
+            ids = {key: await self._resolve_id(route, name, name.world) for key, name in names.items()}
+            options.params = {**options.params, **ids}
+
+    async def _resolve_id(self, route: IdRoute, name: str, world: Optional[str]) -> str:
+        if self._id_index is not None and not route.id_only:
+            id = await anyio.to_thread.run_sync(self._id_index.get, route.game, str(name), world)
+            self._record_index_lookup(route.path, id)
+            if id is not None:
+                return id
+
+        response = await self.get(
+            route.path,
+            cast_to=Dict[str, Any],
+            options={"params": route.params(str(name), world), "response_mode": "dict"},
+        )
+        return route.read_id(response)
+
+    # a cache that does I/O, e.g. `SQLiteCache`, is read and written on a worker thread so that the event loop
+    # is not blocked
+    async def _load_cached_response(self, options: FinalRequestOptions) -> Optional[httpx.Response]:
+        key = self._cache_key(options)
+        if key is None:
+            return None
+
+        cache = cast(ResponseCache, self._cache)
+        cached = await anyio.to_thread.run_sync(cache.get, key) if cache.blocking else cache.get(key)
+        return self._cached_response(options, cached)
+
+    async def _store_cached_response(self, options: FinalRequestOptions, response: httpx.Response) -> None:
+        ttl = self._cache_ttl(options)
+        if ttl is None:
+            return
+
+        cache = cast(ResponseCache, self._cache)
+        key, value = self._request_fingerprint(options), CachedResponse.from_response(response)
+        if cache.blocking:
+            await anyio.to_thread.run_sync(cache.set, key, value, ttl)
+        else:
+            cache.set(key, value, ttl)
+
+    # the id index is a SQLite database, it is queried on a worker thread so that the event loop is not blocked
+    async def _load_indexed_response(self, options: FinalRequestOptions) -> Optional[httpx.Response]:
+        indexed = self._indexed_name(options)
+        if indexed is None:
+            return None
+
+        route, name, world = indexed
+        if not route.id_only:
+            # the response carries more than the id, names of these routes are looked up by `_resolve_id`
+            return None
+
+        id = await anyio.to_thread.run_sync(cast(IdIndex, self._id_index).get, route.game, name, world)
+        return self._indexed_response(options, route, id)
+
+    async def _store_indexed_id(self, options: FinalRequestOptions, response: httpx.Response) -> None:
+        indexed = self._indexed_name(options)
+        if indexed is None:
+            return
+
+        route, name, world = indexed
+        id = self._indexed_id(options, route, response)
+        if id is not None:
+            await anyio.to_thread.run_sync(cast(IdIndex, self._id_index).set, route.game, name, id, world)
+
     async def request(
         self, cast_to: Type[ResponseT], options: FinalRequestOptions, *, remaining_retries: Optional[int] = None
+    ) -> ResponseT:
+        with self._trace(options):
+            await self._resolve_names(options)
+            cached = await self._load_indexed_response(options) or await self._load_cached_response(options)
+            if cached is not None:
+                return self._process_response(cast_to=cast_to, options=options, response=cached)
+
+            if not self._coalesce_requests or options.method.lower() != "get":
+                return await self._send(cast_to, options, remaining_retries=remaining_retries)
+
+            # identical GET requests that are already in flight share a single HTTP call, every caller
+            # receives the same parsed result. The call runs in its own task so that a cancelled caller
+            # does not cancel the request for everyone else.
+            key = (self._request_fingerprint(options), cast_to, self._response_mode(options))
+            task = self._inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(self._send(cast_to, options, remaining_retries=remaining_retries))
+                self._inflight[key] = task
+                task.add_done_callback(lambda done: self._discard_inflight(key, done))
+            else:
+                log.debug("Joining in-flight request to %s", options.url)
+
+            return cast(ResponseT, await asyncio.shield(task))
+
+    async def _send(
+        self, cast_to: Type[ResponseT], options: FinalRequestOptions, *, remaining_retries: Optional[int]
+    ) -> ResponseT:
+        self._start_deadline(options)
+        try:
+            if self._hedging is None or options.method.lower() != "get":
+                return await self._request(cast_to, options, remaining_retries=remaining_retries)
+            return await self._hedged_request(self._hedging, cast_to, options, remaining_retries=remaining_retries)
+        except NexonError as err:
+            self._emit("on_error", options.url, err)
+            raise
+
+    async def _hedged_request(
+        self,
+        hedging: HedgingPolicy,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        remaining_retries: Optional[int],
+    ) -> ResponseT:
+        # the request and its hedge are one logical request: both are sent once and the pair is retried
+        # as a whole, so that a hedge neither retries on its own nor counts towards the retry budget
+        max_retries = options.get_max_retries(self.max_retries)
+        retries = self._remaining_retries(remaining_retries, options)
+        retry_delay: Optional[float] = None
+        while True:
+            # numbers the attempts of this round after the rounds before it
+            attempt_options = options.model_copy(update={"max_retries": max_retries - retries})
+            try:
+                return await self._hedged_attempt(hedging, cast_to, attempt_options, retry_delay)
+            except (APIConnectionError, APIStatusError) as err:
+                response = err.response if isinstance(err, APIStatusError) else None
+                if response is not None and not self._should_retry(response):
+                    raise
+                delay = self._retry_delay(
+                    options, retries, response.headers if response is not None else None, retry_delay
+                )
+                if delay is None:
+                    raise
+                request = err.request
+
+            log.info("Retrying hedged request to %s in %f seconds", options.url, delay)
+            if self._hooks:
+                attempt = self._attempt(options, retries)
+                self._emit("on_retry", options.url, request, attempt=attempt, delay=delay, response=response)
+            await anyio.sleep(delay)
+            retries -= 1
+            retry_delay = delay
+
+    async def _hedged_attempt(
+        self,
+        hedging: HedgingPolicy,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        retry_delay: Optional[float],
+    ) -> ResponseT:
+        started: Dict[asyncio.Future[Any], float] = {}
+
+        def start(hedge: bool) -> asyncio.Future[Any]:
+            request = self._request(cast_to, options, remaining_retries=0, retry_delay=retry_delay, hedge=hedge)
+            task = asyncio.ensure_future(request)
+            started[task] = time.monotonic()
+            return task
+
+        pending = {start(hedge=False)}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedging.delay(options.url))
+            # a hedge must not make the client wait for, or exceed, its quota
+            if not done and (self._rate_limiter is None or await self._rate_limiter.ahas_capacity(options.url)):
+                log.debug("Hedging request to %s", options.url)
+                pending.add(start(hedge=True))
+
+            error: Optional[BaseException] = None
+            while done or pending:
+                for task in done:
+                    if task.exception() is None:
+                        # the latency of the task that completed, a hedge that won says nothing about the first request
+                        hedging.record(options.url, time.monotonic() - started[task])
+                        return cast(ResponseT, task.result())
+                    error = error or task.exception()
+
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            assert error is not None
+            raise error
+        finally:
+            # the slower request is no longer needed, nor are both of them if the caller was cancelled
+            for task in pending:
+                task.cancel()
+
+    def _discard_inflight(self, key: Tuple[str, object, str], task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _request(
+        self,
+        cast_to: Type[ResponseT],
+        options: FinalRequestOptions,
+        *,
+        remaining_retries: Optional[int],
+        retry_delay: Optional[float] = None,
+        hedge: bool = False,
     ) -> ResponseT:
         await self._prepare_options(options)
 
@@ -716,47 +1554,65 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
         request = self._build_request(options)
         await self._prepare_request(request)
 
+        remaining = self._remaining_budget(options)
+        if remaining is not None and remaining <= 0:
+            raise APITimeoutError(request=request)
+
+        self._before_attempt(options, retry_delay, hedge=hedge)
+
+        # waits that would pass the deadline of the request fail it at once
+        if self._rate_limiter is not None:
+            if not await self._rate_limiter.aacquire(options.url, timeout=self._remaining_budget(options)):
+                raise self._deadline_error(options, request, "the rate limiter")
+
+        key, key_delay = self._checkout_key(request)
+        if key_delay > 0:
+            self._check_wait(options, request, key_delay, "the quota of the API key")
+            await anyio.sleep(key_delay)
+        self._refresh_attempt_timeout(options, request)
+
+        if self._hooks:
+            self._emit("on_request", options.url, request, attempt=self._attempt(options, retries))
+        started = time.monotonic()
         try:
             response = await self._client.send(
                 request,
                 auth=self.custom_auth,
             )
         except httpx.TimeoutException as err:
-            if retries > 0:
-                return await self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    response_headers=None,
-                )
+            self._record_attempt(options, None)
+            delay = self._retry_delay(options, retries, None, retry_delay)
+            if delay is not None:
+                return await self._retry_request(options, cast_to, retries, delay, request)
 
             raise APITimeoutError(request=request) from err
         except Exception as err:
-            if retries > 0:
-                return await self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    response_headers=None,
-                )
+            self._record_attempt(options, None)
+            delay = self._retry_delay(options, retries, None, retry_delay)
+            if delay is not None:
+                return await self._retry_request(options, cast_to, retries, delay, request)
 
             raise APIConnectionError(request=request) from err
 
         log.debug(
             'HTTP Request: %s %s "%i %s"', request.method, request.url, response.status_code, response.reason_phrase
         )
+        self._emit("on_response", options.url, response, elapsed=time.monotonic() - started)
+        self._record_attempt(options, response)
+        rotate_key = self._bench_key(key, response)
 
         try:
             response.raise_for_status()
         except httpx.HTTPStatusError as err:  # thrown on 4xx and 5xx status code
-            if retries > 0 and self._should_retry(err.response):
+            delay = (
+                # another key has quota left, there is no need to back off
+                self._retry_delay(options, retries, err.response.headers, retry_delay, immediate=rotate_key)
+                if rotate_key or self._should_retry(err.response)
+                else None
+            )
+            if delay is not None:
                 await err.response.aclose()
-                return await self._retry_request(
-                    options,
-                    cast_to,
-                    retries,
-                    err.response.headers,
-                )
+                return await self._retry_request(options, cast_to, retries, delay, request, err.response)
 
             # If the response is streamed then we need to explicitly read the response
             # to completion before attempting to access the response text.
@@ -765,6 +1621,9 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
 
             raise self._make_status_error_from_response(err.response) from None
 
+        await self._store_cached_response(options, response)
+        await self._store_indexed_id(options, response)
+
         return self._process_response(
             cast_to=cast_to,
             options=options,
@@ -776,20 +1635,84 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient]):
         options: FinalRequestOptions,
         cast_to: Type[ResponseT],
         remaining_retries: int,
-        response_headers: httpx.Headers | None,
+        timeout: float,
+        request: httpx.Request,
+        response: Optional[httpx.Response] = None,
     ) -> ResponseT:
         remaining = remaining_retries - 1
-        timeout = self._calculate_retry_timeout(remaining, options, response_headers)
         log.info("Retrying request to %s in %f seconds", options.url, timeout)
+        if self._hooks:
+            attempt = self._attempt(options, remaining_retries)
+            self._emit("on_retry", options.url, request, attempt=attempt, delay=timeout, response=response)
 
+        # sleeping on the event loop lets other requests proceed and is interrupted when the task is cancelled
         await anyio.sleep(timeout)
 
-        return await self.request(
+        return await self._request(
             options=options,
             cast_to=cast_to,
             remaining_retries=remaining,
+            retry_delay=timeout,
         )
 
+    def batch(
+        self,
+        fn: Callable[[_ItemT], Awaitable[_T]],
+        items: Iterable[_ItemT],
+        *,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult[_ItemT, _T]]:
+        """Await `fn` for every item concurrently and yield a `BatchResult` for each of them as they complete.
+
+        ```py
+        async for result in client.batch(lambda ocid: client.maplestory.get_character_stat(ocid=ocid), ocids):
+            if result.ok:
+                print(result.item, result.result)
+        ```
+
+        At most `concurrency` calls are in flight at any time, defaulting to the size of the connection pool.
+        Every call is retried as usual, a call that still fails is reported through `BatchResult.error`
+        without failing the rest of the batch.
+        """
+        return arun_batch(fn, items, concurrency=self._batch_concurrency(concurrency))
+
+    async def resolve_ids(
+        self,
+        game: str,
+        names: Iterable[str],
+        *,
+        world: Optional[str] = None,
+        concurrency: Optional[int] = None,
+    ) -> AsyncIterator[BatchResult[str, str]]:
+        """Resolve many names of `game` (e.g. `"maplestory"`, `"ca"`, `"tfd"`) into their `ocid`/`ouid`.
+
+        ```py
+        async for result in client.resolve_ids("maplestory", names):
+            if result.ok:
+                print(result.item, result.result)
+        ```
+
+        With an `id_index` on the client, the names already in the index are looked up at once and yielded first,
+        the remaining ones are resolved concurrently like `batch()` and stored in the index.
+        """
+        route = self._id_route(game)
+        route.params("", world)  # fail early if `world` is missing
+        names = list(dict.fromkeys(names))
+        known: Dict[str, str] = {}
+        if self._id_index is not None:
+            # the remaining names are counted as misses when they are looked up again by the request
+            known = await anyio.to_thread.run_sync(self._id_index.get_many, route.game, names, world)
+            self._id_index.stats.hits += len(known)
+        for name, id in known.items():
+            yield BatchResult(name, result=id)
+
+        async def resolve(name: str) -> str:
+            return await self._resolve_id(route, name, world)
+
+        missing = (name for name in names if name not in known)
+        async for result in self.batch(resolve, missing, concurrency=concurrency):
+            yield result
+
     async def get(
         self,
         path: str,
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from typing import Dict, Generic, TypeVar, Callable, Iterable, Iterator, Optional, Awaitable, AsyncIterator
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing_extensions import override
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+
+class BatchResult(Generic[_ItemT, _ResultT]):
+    """The outcome of a single call in a batch.
+
+    Exactly one of `result` and `error` is set, a failed call does not fail the rest of the batch.
+    """
+
+    item: _ItemT
+    result: Optional[_ResultT]
+    error: Optional[Exception]
+
+    def __init__(self, item: _ItemT, *, result: Optional[_ResultT] = None, error: Optional[Exception] = None) -> None:
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> _ResultT:
+        """Return the result of the call, raising its error if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+    @override
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"{self.__class__.__name__}(item={self.item!r}, error={self.error!r})"
+        return f"{self.__class__.__name__}(item={self.item!r}, result={self.result!r})"
+
+
+def run_batch(
+    fn: Callable[[_ItemT], _ResultT],
+    items: Iterable[_ItemT],
+    *,
+    concurrency: int,
+) -> Iterator[BatchResult[_ItemT, _ResultT]]:
+    """Call `fn` for every item on a thread pool and yield the results in completion order.
+
+    Items are consumed lazily, at most `concurrency` calls are in flight at any time.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than 0")
+
+    # `concurrent.futures` imports its thread pool on first use
+    from concurrent.futures import ThreadPoolExecutor
+
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nexon-openapi-batch") as executor:
+        pending: Dict[Future[_ResultT], _ItemT] = {
+            executor.submit(fn, item): item for item in itertools.islice(iterator, concurrency)
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    for next_item in itertools.islice(iterator, 1):
+                        pending[executor.submit(fn, next_item)] = next_item
+
+                    error = future.exception()
+                    if error is not None:
+                        yield BatchResult(item, error=_as_exception(error))
+                    else:
+                        yield BatchResult(item, result=future.result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def arun_batch(
+    fn: Callable[[_ItemT], Awaitable[_ResultT]],
+    items: Iterable[_ItemT],
+    *,
+    concurrency: int,
+) -> AsyncIterator[BatchResult[_ItemT, _ResultT]]:
+    """Await `fn` for every item concurrently and yield the results in completion order.
+
+    Items are consumed lazily, at most `concurrency` calls are in flight at any time.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than 0")
+
+    iterator = iter(items)
+    pending: Dict[asyncio.Future[_ResultT], _ItemT] = {
+        asyncio.ensure_future(fn(item)): item for item in itertools.islice(iterator, concurrency)
+    }
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                for next_item in itertools.islice(iterator, 1):
+                    pending[asyncio.ensure_future(fn(next_item))] = next_item
+
+                error = task.exception()
+                if error is not None:
+                    yield BatchResult(item, error=_as_exception(error))
+                else:
+                    yield BatchResult(item, result=task.result())
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _as_exception(error: BaseException) -> Exception:
+    # anything that is not an `Exception` (e.g. `KeyboardInterrupt`) must not be swallowed
+    if not isinstance(error, Exception):
+        raise error
+    return error
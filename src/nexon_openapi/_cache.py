@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import json
+import math
+import time
+import threading
+from abc import ABC, abstractmethod
+from os import PathLike
+from typing import List, Tuple, Union, Mapping, Optional
+from typing_extensions import override
+from collections import OrderedDict
+
+import httpx
+
+from .utils import get_latest_date_available, seconds_until_data_refresh
+
+FOREVER = math.inf
+
+# these are re-computed by httpx when the cached body is read back, storing them would
+# make httpx try to decode an already decoded body
+_EXCLUDED_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+
+class CachedResponse:
+    """The raw parts of a successful response that are needed to replay it."""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    content: bytes
+
+    def __init__(self, *, status_code: int, headers: List[Tuple[str, str]], content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> CachedResponse:
+        return cls(
+            status_code=response.status_code,
+            headers=[(key, value) for key, value in response.headers.items() if key.lower() not in _EXCLUDED_HEADERS],
+            content=response.content,
+        )
+
+    def to_response(self, request: httpx.Request) -> httpx.Response:
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class CacheStats:
+    hits: int
+    misses: int
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(hits={self.hits}, misses={self.misses})"
+
+
+class ResponseCache(ABC):
+    """Storage backend for cached responses.
+
+    `ttl` is given in seconds, `FOREVER` (`math.inf`) means the entry never expires.
+
+    `blocking` tells whether `get` and `set` do I/O, the async client then calls them on a worker thread.
+    """
+
+    stats: CacheStats
+    blocking: bool = True
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class InMemoryCache(ResponseCache):
+    """A thread-safe LRU cache holding at most `max_size` responses."""
+
+    max_size: int
+    blocking = False
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Tuple[float, CachedResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @override
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    @override
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    @override
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    """A persistent cache stored in a SQLite database file, so that cached responses survive restarts.
+
+    Every lookup is a single primary key read. Values are read through a memory-mapped file of up to
+    `mmap_size` bytes, set it to `0` to disable memory-mapped I/O.
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]], *, mmap_size: int = 256 * 1024 * 1024) -> None:
+        # imported here, most clients never use a persistent cache
+        import sqlite3
+
+        super().__init__()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA mmap_size={int(mmap_size)}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                expires_at REAL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+
+    @override
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status_code, headers, content FROM responses WHERE key = ? AND (expires_at IS NULL OR expires_at > ?)",
+                (key, time.time()),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status_code, headers, content = row
+        return CachedResponse(
+            status_code=status_code,
+            headers=[(name, value) for name, value in json.loads(headers)],
+            content=bytes(content),
+        )
+
+    @override
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        # entries that never expire are stored with a NULL expiry
+        expires_at = None if math.isinf(ttl) else time.time() + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, status_code, headers, content) VALUES (?, ?, ?, ?, ?)",
+                (key, expires_at, value.status_code, json.dumps(value.headers), value.content),
+            )
+
+    @override
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachePolicy:
+    """Decides how long a response may be cached based on when the Nexon Open API refreshes its data.
+
+    - MapleStory queries for a `date` whose data is already final are cached forever.
+    - Other MapleStory queries expire when the next daily update is completed (1:00 KST).
+    - The First Descendant data becomes available after 10 minutes on average, so it is cached for `tfd_ttl` seconds.
+    - Everything else is cached for `default_ttl` seconds, or not at all if it is `None`.
+    """
+
+    tfd_ttl: Optional[float]
+    default_ttl: Optional[float]
+
+    def __init__(self, *, tfd_ttl: Optional[float] = 600.0, default_ttl: Optional[float] = None) -> None:
+        self.tfd_ttl = tfd_ttl
+        self.default_ttl = default_ttl
+
+    def ttl(self, path: str, params: Mapping[str, object]) -> Optional[float]:
+        """Return the number of seconds a response may be cached for, `None` if it must not be cached."""
+        path = path.lstrip("/")
+
+        if path.startswith(("tfd/", "static/tfd/")):
+            return self.tfd_ttl
+
+        if path.startswith("maplestory/"):
+            date = params.get("date")
+            if isinstance(date, str) and date <= get_latest_date_available():
+                return FOREVER
+            return seconds_until_data_refresh()
+
+        return self.default_ttl
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Dict, List, Deque, Tuple, Callable, Optional
+from collections import deque
+
+from ._exceptions import CircuitOpenError
+
+
+def route_family(path: str) -> str:
+    """The endpoint family of `path`, its first three segments: `maplestory/v1/character/stat` -> `maplestory/v1/character`."""
+    return "/".join(path.strip("/").split("/", 3)[:3])
+
+
+class _Window:
+    """Counts events in one second slots over the last `length` seconds."""
+
+    def __init__(self, length: float) -> None:
+        self._length = length
+        # [second, successes, failures]
+        self._slots: Deque[List[int]] = deque()
+
+    def add(self, now: float, *, success: int = 0, failure: int = 0) -> None:
+        second = int(now)
+        self._expire(now)
+        if self._slots and self._slots[-1][0] == second:
+            slot = self._slots[-1]
+            slot[1] += success
+            slot[2] += failure
+        else:
+            self._slots.append([second, success, failure])
+
+    def totals(self, now: float) -> Tuple[int, int]:
+        self._expire(now)
+        return sum(slot[1] for slot in self._slots), sum(slot[2] for slot in self._slots)
+
+    def clear(self) -> None:
+        self._slots.clear()
+
+    def _expire(self, now: float) -> None:
+        oldest = now - self._length
+        while self._slots and self._slots[0][0] + 1 <= oldest:
+            self._slots.popleft()
+
+
+class RetryBudget:
+    """Caps the number of retries to a fraction of the recent traffic.
+
+    Retries are allowed while they amount to at most `ratio` of the requests sent in the last `window` seconds.
+    `min_retries` retries per window are always allowed, so that a client with little traffic can still retry.
+    During an outage, every request fails and the budget stops the retries from multiplying the load.
+
+    ```py
+    client = NexonOpenAPI(retry_budget=RetryBudget(ratio=0.1))
+    ```
+    """
+
+    ratio: float
+    window: float
+    min_retries: int
+
+    def __init__(self, ratio: float = 0.1, *, window: float = 10.0, min_retries: int = 10) -> None:
+        if ratio < 0:
+            raise ValueError("ratio must be greater than or equal to 0")
+        if window <= 0:
+            raise ValueError("window must be greater than 0")
+
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        # successes count requests, failures count retries
+        self._events = _Window(window)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Record a request that is sent for the first time."""
+        with self._lock:
+            self._events.add(time.monotonic(), success=1)
+
+    def try_retry(self) -> bool:
+        """Withdraw a retry from the budget, return `False` if the budget is exhausted."""
+        with self._lock:
+            now = time.monotonic()
+            requests, retries = self._events.totals(now)
+            if retries >= max(self.min_retries, self.ratio * requests):
+                return False
+
+            self._events.add(now, failure=1)
+            return True
+
+
+class _Circuit:
+    def __init__(self, window: float) -> None:
+        self.state = "closed"
+        self.outcomes = _Window(window)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_started_at = 0.0
+
+
+class CircuitBreaker:
+    """Fails requests fast while an endpoint family is failing, instead of sending them.
+
+    The outcome of every attempt is recorded per endpoint family (see `route_family`). Timeouts, connection
+    errors, `408` and `5xx` responses are failures. Once at least `min_requests` attempts were made in the last
+    `window` seconds and `failure_ratio` of them failed, the circuit of the family opens and its requests raise
+    `CircuitOpenError` without being sent.
+
+    After `reset_timeout` seconds the circuit is half-open: up to `half_open_probes` requests are sent as probes,
+    the circuit closes again once a probe succeeds and reopens if one fails.
+
+    ```py
+    client = NexonOpenAPI(circuit_breaker=CircuitBreaker(failure_ratio=0.5, reset_timeout=30))
+    ```
+    """
+
+    failure_ratio: float
+    min_requests: int
+    window: float
+    reset_timeout: float
+    half_open_probes: int
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        *,
+        min_requests: int = 20,
+        window: float = 10.0,
+        reset_timeout: float = 30.0,
+        half_open_probes: int = 1,
+        family: Callable[[str], str] = route_family,
+    ) -> None:
+        if not 0 < failure_ratio <= 1:
+            raise ValueError("failure_ratio must be greater than 0 and at most 1")
+        if half_open_probes < 1:
+            raise ValueError("half_open_probes must be at least 1")
+
+        self.failure_ratio = failure_ratio
+        self.min_requests = min_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self._family = family
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, path: str) -> str:
+        """The state of the circuit of the family of `path`: `"closed"`, `"open"` or `"half_open"`."""
+        with self._lock:
+            circuit = self._circuits.get(self._family(path))
+            if circuit is None:
+                return "closed"
+            if circuit.state == "open" and time.monotonic() >= circuit.opened_at + self.reset_timeout:
+                return "half_open"
+            return circuit.state
+
+    def before_request(self, path: str) -> None:
+        """Raise `CircuitOpenError` if a request to `path` must not be sent."""
+        family = self._family(path)
+        with self._lock:
+            circuit = self._circuits.get(family)
+            if circuit is None or circuit.state == "closed":
+                return
+
+            now = time.monotonic()
+            if circuit.state == "open":
+                retry_after = circuit.opened_at + self.reset_timeout - now
+                if retry_after > 0:
+                    raise CircuitOpenError(family, retry_after=retry_after)
+                circuit.state = "half_open"
+                circuit.probes = 0
+
+            if circuit.probes >= self.half_open_probes:
+                retry_after = circuit.probe_started_at + self.reset_timeout - now
+                if retry_after > 0:
+                    raise CircuitOpenError(family, retry_after=retry_after)
+                # the probes never reported back (e.g. they were cancelled), send new ones
+                circuit.probes = 0
+
+            circuit.probes += 1
+            circuit.probe_started_at = now
+
+    def record_success(self, path: str) -> None:
+        with self._lock:
+            circuit = self._circuit(self._family(path))
+            if circuit.state == "half_open":
+                circuit.state = "closed"
+                circuit.outcomes.clear()
+            circuit.outcomes.add(time.monotonic(), success=1)
+
+    def record_failure(self, path: str) -> None:
+        with self._lock:
+            circuit = self._circuit(self._family(path))
+            now = time.monotonic()
+            if circuit.state == "half_open":
+                self._open(circuit, now)
+                return
+
+            circuit.outcomes.add(now, failure=1)
+            if circuit.state == "closed":
+                successes, failures = circuit.outcomes.totals(now)
+                total = successes + failures
+                if total >= self.min_requests and failures >= self.failure_ratio * total:
+                    self._open(circuit, now)
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _circuit(self, family: str) -> _Circuit:
+        circuit = self._circuits.get(family)
+        if circuit is None:
+            circuit = self._circuits[family] = _Circuit(self.window)
+        return circuit
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = "open"
+        circuit.opened_at = now
+        circuit.probes = 0
+        circuit.outcomes.clear()
+
+
+def is_failure(status_code: Optional[int]) -> bool:
+    """Whether an attempt that ended with `status_code`, `None` if no response was received, counts as a failure."""
+    return status_code is None or status_code == 408 or status_code >= 500
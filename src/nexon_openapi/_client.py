@@ -1,62 +1,81 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Mapping, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Union, Generic, TypeVar, Sequence, overload
 from typing_extensions import override
 
 import httpx
 
 from ._base_client import SyncAPIClient, AsyncAPIClient
-from ._types import NotGiven, NOT_GIVEN, Omit
+from ._types import NotGiven, NOT_GIVEN, Omit, ResponseMode, ResponseModeT
 from ._constants import DEFAULT_MAX_RETRIES, DEFAULT_LIMITS
 from ._exceptions import NexonError
 from ._qs import Querystring
+from ._rate_limit import RateLimiter
+from ._backoff import Backoff
+from ._hooks import Hooks
+from ._json import JSONDecoder
 from .__version__ import __version__
 from ._exceptions import *
 from .utils import is_mapping
-from .resources import (
-    WarsOfPrasia,
-    WarsOfPrasiaAsync,
-    MabinogiHeroes,
-    MabinogiHeroesAsync,
-    CrazyArcade,
-    CrazyArcadeAsync,
-    MapleStory,
-    MapleStoryAsync,
-    MapleStoryM,
-    MapleStoryMAsync,
-    Baram,
-    BaramAsync,
-    BaramY,
-    BaramYAsync,
-    KartRiderRushPlus,
-    KartRiderRushPlusAsync,
-    Hit2,
-    Hit2Async,
-    V4,
-    V4Async,
-    FCOnline,
-    FCOnlineAsync,
-    TFD,
-    TFDAsync,
-)
-
-
-class NexonOpenAPI(SyncAPIClient):
-    api_key: str
-
-    wars_of_prasia: WarsOfPrasia
-    mabinogi_heroes: MabinogiHeroes
-    crazy_arcade: CrazyArcade
-    maplestorym: MapleStoryM
-    baram: Baram
-    baramy: BaramY
-    kartrush: KartRiderRushPlus
-    hit2: Hit2
-    v4: V4
-    fc_online: FCOnline
-    maplestory: MapleStory
-    tfd: TFD
+from ._resource import lazy_resource
+
+if TYPE_CHECKING:
+    from ._tracing import OpenTelemetryTracing
+    from ._circuit import RetryBudget, CircuitBreaker
+    from ._key_pool import APIKeyPool
+    from ._hedging import HedgingPolicy
+    from ._cache import CachePolicy, ResponseCache
+    from ._id_index import IdIndex
+    from .resources import (
+        WarsOfPrasia,
+        WarsOfPrasiaAsync,
+        MabinogiHeroes,
+        MabinogiHeroesAsync,
+        CrazyArcade,
+        CrazyArcadeAsync,
+        MapleStory,
+        MapleStoryAsync,
+        MapleStoryM,
+        MapleStoryMAsync,
+        Baram,
+        BaramAsync,
+        BaramY,
+        BaramYAsync,
+        KartRiderRushPlus,
+        KartRiderRushPlusAsync,
+        Hit2,
+        Hit2Async,
+        V4,
+        V4Async,
+        FCOnline,
+        FCOnlineAsync,
+        TFD,
+        TFDAsync,
+    )
+
+
+_QUERYSTRING = Querystring(array_format="comma")
+
+_OtherResponseModeT = TypeVar("_OtherResponseModeT", bound=ResponseMode)
+
+
+class NexonOpenAPI(SyncAPIClient, Generic[ResponseModeT]):
+    _api_key: str
+    _api_key_header = "x-nxopen-api-key"
+
+    wars_of_prasia: lazy_resource[WarsOfPrasia[ResponseModeT]] = lazy_resource("._wars_of_prasia", "WarsOfPrasia")
+    mabinogi_heroes: lazy_resource[MabinogiHeroes[ResponseModeT]] = lazy_resource("._mabinogi_heroes", "MabinogiHeroes")
+    crazy_arcade: lazy_resource[CrazyArcade[ResponseModeT]] = lazy_resource("._crazy_arcade", "CrazyArcade")
+    maplestorym: lazy_resource[MapleStoryM[ResponseModeT]] = lazy_resource("._maplestorym", "MapleStoryM")
+    baram: lazy_resource[Baram[ResponseModeT]] = lazy_resource("._baram", "Baram")
+    baramy: lazy_resource[BaramY[ResponseModeT]] = lazy_resource("._baramy", "BaramY")
+    kartrush: lazy_resource[KartRiderRushPlus[ResponseModeT]] = lazy_resource("._kartrush", "KartRiderRushPlus")
+    hit2: lazy_resource[Hit2[ResponseModeT]] = lazy_resource("._hit2", "Hit2")
+    v4: lazy_resource[V4[ResponseModeT]] = lazy_resource("._v4", "V4")
+    fc_online: lazy_resource[FCOnline[ResponseModeT]] = lazy_resource("._fc_online", "FCOnline")
+    maplestory: lazy_resource[MapleStory[ResponseModeT]] = lazy_resource("._maplestory", "MapleStory")
+    tfd: lazy_resource[TFD[ResponseModeT]] = lazy_resource("._the_first_descendant", "TFD")
 
     def __init__(
         self,
@@ -64,12 +83,27 @@ class NexonOpenAPI(SyncAPIClient):
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Optional[float] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
         limits: httpx.Limits = DEFAULT_LIMITS,
         default_headers: Union[Mapping[str, str], None] = None,
         default_query: Union[Mapping[str, object], None] = None,
         http_client: Union[httpx.Client, None] = None,
         strict_response_validation: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        id_index: Optional[IdIndex] = None,
+        response_mode: ResponseModeT = "model",
+        json_decoder: Optional[JSONDecoder] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        tracing: Optional[OpenTelemetryTracing] = None,
+        http2: bool = False,
+        keepalive_expiry: Optional[float] = None,
     ) -> None:
         """construct a new synchronous nexon openapi client instance
 
@@ -77,8 +111,49 @@ class NexonOpenAPI(SyncAPIClient):
 
         - `api_key` from `NEXON_OPENAPI_API_KEY`
         - `base_url` from `NEXON_OPENAPI_BASE_URL`
+
+        `budget` is the total number of seconds a call may take, retries and the waits between them included.
+        Retries that would not finish in time are not attempted and the timeout of every attempt is shortened
+        to the time left. Pass `budget=` to a resource method to override it for one call.
+
+        Pass a `RateLimiter` as `rate_limiter` to throttle requests on the client side before they are sent.
+
+        `backoff` decides how long to wait between retries, e.g. `DecorrelatedJitterBackoff()` to spread out the
+        retries of many concurrent requests that were rate limited at once. Defaults to an `ExponentialBackoff`.
+
+        A `RetryBudget` as `retry_budget` caps retries to a fraction of the recent traffic, and a `CircuitBreaker`
+        as `circuit_breaker` fails requests to a failing endpoint family fast with `CircuitOpenError`.
+
+        Pass an `APIKeyPool` as `key_pool` instead of `api_key` to spread requests over several keys, each
+        with its own quota.
+
+        Pass a `ResponseCache` (e.g. `InMemoryCache()`) as `cache` to serve repeated requests locally, `cache_policy`
+        decides how long each response may be cached for.
+
+        Pass an `IdIndex` as `id_index` to remember resolved `ocid`/`ouid` so that looking up the same name again
+        does not hit the API.
+
+        `response_mode` selects what the resource methods return: `"model"` parses responses into models,
+        `"dict"` only decodes the JSON body and `"raw"` returns the undecoded body as a `RawResponse`.
+        The resource methods are typed accordingly, e.g. `NexonOpenAPI(response_mode="dict")` is a
+        `NexonOpenAPI[Literal["dict"]]` whose methods return `Dict[str, Any]`.
+        Use `client.with_options(response_mode=...)` to change it for some calls only.
+
+        Response bodies are decoded with `orjson` or `msgspec` when one of them is installed, pass a
+        `json_decoder` to use another decoder.
+
+        `hooks` receive an event for every request, response, retry, error, parsed body and cache lookup, see
+        `Hooks`. A `MetricsCollector` keeps latency histograms and status code counts per endpoint.
+        Pass an `OpenTelemetryTracing` as `tracing` to trace every call with OpenTelemetry spans.
+
+        `http2=True` multiplexes concurrent requests over a few connections (`pip install nexon_openapi[http2]`),
+        `keepalive_expiry` is how many seconds an idle connection is kept open. Both are ignored when an
+        `http_client` is given. `client.warmup()` opens connections ahead of the first requests and
+        `client.pool_stats()` reports the state of the connection pool.
         """
 
+        if api_key is None and key_pool is not None:
+            api_key = key_pool.keys[0]
         if api_key is None:
             api_key = os.environ.get("NEXON_OPENAPI_API_KEY")
         if api_key is None:
@@ -97,25 +172,57 @@ class NexonOpenAPI(SyncAPIClient):
             base_url=base_url,
             max_retries=max_retries,
             timeout=timeout,
+            budget=budget,
             http_client=http_client,
             limits=limits,
             custom_headers=default_headers,
             custom_query=default_query,
             strict_response_validation=strict_response_validation,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            key_pool=key_pool,
+            cache=cache,
+            cache_policy=cache_policy,
+            id_index=id_index,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            tracing=tracing,
+            http2=http2,
+            keepalive_expiry=keepalive_expiry,
         )
 
-        self.maplestory = MapleStory(self)
-        self.maplestorym = MapleStoryM(self)
-        self.wars_of_prasia = WarsOfPrasia(self)
-        self.mabinogi_heroes = MabinogiHeroes(self)
-        self.crazy_arcade = CrazyArcade(self)
-        self.baram = Baram(self)
-        self.baramy = BaramY(self)
-        self.kartrush = KartRiderRushPlus(self)
-        self.hit2 = Hit2(self)
-        self.v4 = V4(self)
-        self.fc_online = FCOnline(self)
-        self.tfd = TFD(self)
+    @overload
+    def with_options(self, *, budget: Union[float, None, NotGiven] = NOT_GIVEN) -> NexonOpenAPI[ResponseModeT]:
+        ...
+
+    @overload
+    def with_options(
+        self,
+        *,
+        response_mode: _OtherResponseModeT,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> NexonOpenAPI[_OtherResponseModeT]:
+        ...
+
+    def with_options(
+        self,
+        *,
+        response_mode: Union[ResponseMode, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Any:
+        """Return a copy of the client with the given options changed.
+
+        The copy shares the connection pool, the rate limiter and the caches of this client.
+
+        ```py
+        client.with_options(response_mode="dict").maplestory.get_character_item_equipment(ocid=ocid)
+        client.with_options(budget=2.0).maplestory.get_character_basic(ocid=ocid)
+        ```
+        """
+        return self._copy_with_options(response_mode=response_mode, budget=budget)
 
     @override
     def _make_status_error(
@@ -154,7 +261,17 @@ class NexonOpenAPI(SyncAPIClient):
     @property
     @override
     def qs(self) -> Querystring:
-        return Querystring(array_format="comma")
+        return _QUERYSTRING
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        self._api_key = api_key
+        # the key is sent with the cached default headers
+        self._invalidate_headers()
 
     @property
     @override
@@ -170,21 +287,22 @@ class NexonOpenAPI(SyncAPIClient):
         }
 
 
-class NexonOpenAPIAsync(AsyncAPIClient):
-    api_key: str
+class NexonOpenAPIAsync(AsyncAPIClient, Generic[ResponseModeT]):
+    _api_key: str
+    _api_key_header = "x-nxopen-api-key"
 
-    maplestory: MapleStoryAsync
-    maplestorym: MapleStoryMAsync
-    wars_of_prasia: WarsOfPrasiaAsync
-    mabinogi_heroes: MabinogiHeroesAsync
-    crazy_arcade: CrazyArcadeAsync
-    baram: BaramAsync
-    baramy: BaramYAsync
-    kartrush: KartRiderRushPlusAsync
-    hit2: Hit2Async
-    v4: V4Async
-    fc_online: FCOnlineAsync
-    tfd: TFDAsync
+    maplestory: lazy_resource[MapleStoryAsync[ResponseModeT]] = lazy_resource("._maplestory", "MapleStoryAsync")
+    maplestorym: lazy_resource[MapleStoryMAsync[ResponseModeT]] = lazy_resource("._maplestorym", "MapleStoryMAsync")
+    wars_of_prasia: lazy_resource[WarsOfPrasiaAsync[ResponseModeT]] = lazy_resource("._wars_of_prasia", "WarsOfPrasiaAsync")
+    mabinogi_heroes: lazy_resource[MabinogiHeroesAsync[ResponseModeT]] = lazy_resource("._mabinogi_heroes", "MabinogiHeroesAsync")
+    crazy_arcade: lazy_resource[CrazyArcadeAsync[ResponseModeT]] = lazy_resource("._crazy_arcade", "CrazyArcadeAsync")
+    baram: lazy_resource[BaramAsync[ResponseModeT]] = lazy_resource("._baram", "BaramAsync")
+    baramy: lazy_resource[BaramYAsync[ResponseModeT]] = lazy_resource("._baramy", "BaramYAsync")
+    kartrush: lazy_resource[KartRiderRushPlusAsync[ResponseModeT]] = lazy_resource("._kartrush", "KartRiderRushPlusAsync")
+    hit2: lazy_resource[Hit2Async[ResponseModeT]] = lazy_resource("._hit2", "Hit2Async")
+    v4: lazy_resource[V4Async[ResponseModeT]] = lazy_resource("._v4", "V4Async")
+    fc_online: lazy_resource[FCOnlineAsync[ResponseModeT]] = lazy_resource("._fc_online", "FCOnlineAsync")
+    tfd: lazy_resource[TFDAsync[ResponseModeT]] = lazy_resource("._the_first_descendant", "TFDAsync")
 
     def __init__(
         self,
@@ -192,12 +310,29 @@ class NexonOpenAPIAsync(AsyncAPIClient):
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Optional[float] = None,
         max_retries: int = DEFAULT_MAX_RETRIES,
         limits: httpx.Limits = DEFAULT_LIMITS,
         default_headers: Union[Mapping[str, str], None] = None,
         default_query: Union[Mapping[str, object], None] = None,
         http_client: Union[httpx.AsyncClient, None] = None,
         strict_response_validation: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        key_pool: Optional[APIKeyPool] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        id_index: Optional[IdIndex] = None,
+        response_mode: ResponseModeT = "model",
+        json_decoder: Optional[JSONDecoder] = None,
+        hooks: Optional[Sequence[Hooks]] = None,
+        tracing: Optional[OpenTelemetryTracing] = None,
+        http2: bool = False,
+        keepalive_expiry: Optional[float] = None,
+        coalesce_requests: bool = False,
+        hedging: Optional[HedgingPolicy] = None,
     ) -> None:
         """construct a new synchronous nexon openapi client instance
 
@@ -205,8 +340,56 @@ class NexonOpenAPIAsync(AsyncAPIClient):
 
         - `api_key` from `NEXON_OPENAPI_API_KEY`
         - `base_url` from `NEXON_OPENAPI_BASE_URL`
+
+        `budget` is the total number of seconds a call may take, retries and the waits between them included.
+        Retries that would not finish in time are not attempted and the timeout of every attempt is shortened
+        to the time left. Pass `budget=` to a resource method to override it for one call.
+
+        Pass a `RateLimiter` as `rate_limiter` to throttle requests on the client side before they are sent.
+
+        `backoff` decides how long to wait between retries, e.g. `DecorrelatedJitterBackoff()` to spread out the
+        retries of many concurrent requests that were rate limited at once. Defaults to an `ExponentialBackoff`.
+
+        A `RetryBudget` as `retry_budget` caps retries to a fraction of the recent traffic, and a `CircuitBreaker`
+        as `circuit_breaker` fails requests to a failing endpoint family fast with `CircuitOpenError`.
+
+        Pass an `APIKeyPool` as `key_pool` instead of `api_key` to spread requests over several keys, each
+        with its own quota.
+
+        Pass a `ResponseCache` (e.g. `InMemoryCache()`) as `cache` to serve repeated requests locally, `cache_policy`
+        decides how long each response may be cached for.
+
+        Pass an `IdIndex` as `id_index` to remember resolved `ocid`/`ouid` so that looking up the same name again
+        does not hit the API.
+
+        `response_mode` selects what the resource methods return: `"model"` parses responses into models,
+        `"dict"` only decodes the JSON body and `"raw"` returns the undecoded body as a `RawResponse`.
+        The resource methods are typed accordingly, e.g. `NexonOpenAPI(response_mode="dict")` is a
+        `NexonOpenAPI[Literal["dict"]]` whose methods return `Dict[str, Any]`.
+        Use `client.with_options(response_mode=...)` to change it for some calls only.
+
+        Response bodies are decoded with `orjson` or `msgspec` when one of them is installed, pass a
+        `json_decoder` to use another decoder.
+
+        `hooks` receive an event for every request, response, retry, error, parsed body and cache lookup, see
+        `Hooks`. A `MetricsCollector` keeps latency histograms and status code counts per endpoint.
+        Pass an `OpenTelemetryTracing` as `tracing` to trace every call with OpenTelemetry spans.
+
+        `http2=True` multiplexes concurrent requests over a few connections (`pip install nexon_openapi[http2]`),
+        `keepalive_expiry` is how many seconds an idle connection is kept open. Both are ignored when an
+        `http_client` is given. `client.warmup()` opens connections ahead of the first requests and
+        `client.pool_stats()` reports the state of the connection pool.
+
+        With `coalesce_requests` enabled, concurrent identical GET requests share a single HTTP call and
+        all of the callers receive the same parsed response object.
+
+        Pass a `HedgingPolicy` as `hedging` to send a second request when a response takes longer than usual
+        and use whichever of the two answers first. The two are retried together, as one request of the
+        `retry_budget`.
         """
 
+        if api_key is None and key_pool is not None:
+            api_key = key_pool.keys[0]
         if api_key is None:
             api_key = os.environ.get("NEXON_OPENAPI_API_KEY")
         if api_key is None:
@@ -225,25 +408,59 @@ class NexonOpenAPIAsync(AsyncAPIClient):
             base_url=base_url,
             max_retries=max_retries,
             timeout=timeout,
+            budget=budget,
             http_client=http_client,
             limits=limits,
             custom_headers=default_headers,
             custom_query=default_query,
             strict_response_validation=strict_response_validation,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            retry_budget=retry_budget,
+            circuit_breaker=circuit_breaker,
+            key_pool=key_pool,
+            cache=cache,
+            cache_policy=cache_policy,
+            id_index=id_index,
+            response_mode=response_mode,
+            json_decoder=json_decoder,
+            hooks=hooks,
+            tracing=tracing,
+            http2=http2,
+            keepalive_expiry=keepalive_expiry,
+            coalesce_requests=coalesce_requests,
+            hedging=hedging,
         )
 
-        self.maplestory = MapleStoryAsync(self)
-        self.maplestorym = MapleStoryMAsync(self)
-        self.wars_of_prasia = WarsOfPrasiaAsync(self)
-        self.mabinogi_heroes = MabinogiHeroesAsync(self)
-        self.crazy_arcade = CrazyArcadeAsync(self)
-        self.baram = BaramAsync(self)
-        self.baramy = BaramYAsync(self)
-        self.kartrush = KartRiderRushPlusAsync(self)
-        self.hit2 = Hit2Async(self)
-        self.v4 = V4Async(self)
-        self.fc_online = FCOnlineAsync(self)
-        self.tfd = TFDAsync(self)
+    @overload
+    def with_options(self, *, budget: Union[float, None, NotGiven] = NOT_GIVEN) -> NexonOpenAPIAsync[ResponseModeT]:
+        ...
+
+    @overload
+    def with_options(
+        self,
+        *,
+        response_mode: _OtherResponseModeT,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> NexonOpenAPIAsync[_OtherResponseModeT]:
+        ...
+
+    def with_options(
+        self,
+        *,
+        response_mode: Union[ResponseMode, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Any:
+        """Return a copy of the client with the given options changed.
+
+        The copy shares the connection pool, the rate limiter and the caches of this client.
+
+        ```py
+        client.with_options(response_mode="dict").maplestory.get_character_item_equipment(ocid=ocid)
+        client.with_options(budget=2.0).maplestory.get_character_basic(ocid=ocid)
+        ```
+        """
+        return self._copy_with_options(response_mode=response_mode, budget=budget)
 
     @override
     def _make_status_error(
@@ -282,7 +499,17 @@ class NexonOpenAPIAsync(AsyncAPIClient):
     @property
     @override
     def qs(self) -> Querystring:
-        return Querystring(array_format="comma")
+        return _QUERYSTRING
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, api_key: str) -> None:
+        self._api_key = api_key
+        # the key is sent with the cached default headers
+        self._invalidate_headers()
 
     @property
     @override
@@ -12,6 +12,19 @@ class NexonError(Exception):
     pass
 
 
+class CircuitOpenError(NexonError):
+    """Raised instead of sending a request while the circuit breaker of its endpoint family is open."""
+
+    family: str
+    retry_after: float
+    """The number of seconds until requests to the family are sent again."""
+
+    def __init__(self, family: str, *, retry_after: float) -> None:
+        super().__init__(f"The circuit of {family!r} is open, requests are sent again in {retry_after:.1f} seconds")
+        self.family = family
+        self.retry_after = retry_after
+
+
 class APIError(NexonError):
     message: str
     request: httpx.Request
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, List, Deque, Callable, Optional
+from collections import deque
+
+from ._circuit import route_family
+
+
+class _Latencies:
+    def __init__(self, max_samples: int) -> None:
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.delay: Optional[float] = None
+        self.since_update = 0
+
+
+class HedgingPolicy:
+    """Sends a second, identical request when the first one is slower than usual, and uses whichever answers first.
+
+    The latencies of the last `max_samples` requests are kept per endpoint family (see `route_family`). A request
+    that did not complete after the `percentile`th percentile of its family's latencies is hedged, the slower of
+    the two requests is cancelled. Until `min_samples` latencies are known, `initial_delay` is used.
+
+    Hedges are only sent for `GET` requests, and only when the client's rate limiter has a token available
+    right away, so hedging never makes the client exceed its quota.
+
+    ```py
+    client = NexonOpenAPIAsync(hedging=HedgingPolicy(percentile=95))
+    ```
+    """
+
+    percentile: float
+    min_delay: float
+    initial_delay: float
+    min_samples: int
+    max_samples: int
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        *,
+        min_delay: float = 0.01,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        max_samples: int = 1000,
+        family: Callable[[str], str] = route_family,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if min_samples < 1 or max_samples < min_samples:
+            raise ValueError("expected 1 <= min_samples <= max_samples")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self._family = family
+        self._latencies: Dict[str, _Latencies] = {}
+        self._lock = threading.Lock()
+
+    def delay(self, path: str) -> float:
+        """The number of seconds to wait for a response to a request to `path` before it is hedged."""
+        with self._lock:
+            latencies = self._latencies.get(self._family(path))
+            if latencies is None or latencies.delay is None:
+                return self.initial_delay
+            return latencies.delay
+
+    def record(self, path: str, latency: float) -> None:
+        """Record the latency of a completed request to `path`."""
+        family = self._family(path)
+        with self._lock:
+            latencies = self._latencies.get(family)
+            if latencies is None:
+                latencies = self._latencies[family] = _Latencies(self.max_samples)
+
+            latencies.samples.append(latency)
+            latencies.since_update += 1
+            count = len(latencies.samples)
+            # sorting every sample on each request would dominate the cost of a cached response,
+            # the percentile is refreshed after every 5% of the window instead
+            if count >= self.min_samples and (
+                latencies.delay is None or latencies.since_update >= max(1, count // 20)
+            ):
+                latencies.delay = max(self.min_delay, _percentile(sorted(latencies.samples), self.percentile))
+                latencies.since_update = 0
+
+
+def _percentile(ordered: List[float], percentile: float) -> float:
+    index = max(0, math.ceil(percentile / 100 * len(ordered)) - 1)
+    return ordered[index]
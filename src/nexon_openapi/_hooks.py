@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+from ._exceptions import NexonError
+
+
+class Hooks:
+    """Receives the events of a client, override the methods of the events you are interested in.
+
+    `path` is the route of the request without its query, e.g. `maplestory/v1/character/basic`. Hooks are called
+    synchronously on the thread or event loop that sends the request, keep them fast. An exception raised by a
+    hook is logged and otherwise ignored.
+
+    ```py
+    class SlowRequests(Hooks):
+        def on_response(self, path, response, *, elapsed):
+            if elapsed > 1:
+                log.warning("%s took %.2fs", path, elapsed)
+
+
+    client = NexonOpenAPI(hooks=[SlowRequests()])
+    ```
+    """
+
+    def on_request(self, path: str, request: httpx.Request, *, attempt: int) -> None:
+        """An attempt is about to be sent, the first attempt of a request is attempt 1."""
+
+    def on_response(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        """A response was received `elapsed` seconds after the attempt was sent, whatever its status."""
+
+    def on_retry(
+        self,
+        path: str,
+        request: httpx.Request,
+        *,
+        attempt: int,
+        delay: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        """Attempt `attempt` failed, with `response` or with no response at all, and is retried in `delay` seconds."""
+
+    def on_error(self, path: str, error: NexonError) -> None:
+        """The request failed with `error`, which is raised to the caller."""
+
+    def on_parse(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        """The body of `response` was decoded and parsed in `elapsed` seconds."""
+
+    def on_cache_hit(self, path: str, *, source: str) -> None:
+        """The response was served locally, `source` is `"cache"` or `"id_index"`."""
+
+    def on_cache_miss(self, path: str, *, source: str) -> None:
+        """The request could have been served locally but was not known to `source`."""
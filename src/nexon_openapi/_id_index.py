@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+import threading
+from os import PathLike
+from typing import Any, Dict, List, Tuple, Union, Mapping, Iterable, Optional, Sequence
+
+from ._cache import CacheStats
+
+# SQLite limits the number of host parameters of a single statement
+_MAX_VARIABLES = 500
+
+
+class IdRoute:
+    """Describes the endpoint that resolves a name into an identifier (`ocid` or `ouid`) for a game.
+
+    `id_path` is the path of the id in the response, `(id_field,)` by default.
+    """
+
+    path: str
+    id_field: str
+    id_path: Tuple[Union[str, int], ...]
+    name_param: str
+    world_param: Optional[str]
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        id_field: str,
+        name_param: str,
+        world_param: Optional[str] = None,
+        id_path: Optional[Sequence[Union[str, int]]] = None,
+    ) -> None:
+        self.path = path
+        self.id_field = id_field
+        self.id_path = tuple(id_path) if id_path is not None else (id_field,)
+        self.name_param = name_param
+        self.world_param = world_param
+
+    @property
+    def game(self) -> str:
+        return self.path.split("/", 1)[0]
+
+    @property
+    def id_only(self) -> bool:
+        """Whether the response is the id alone, so that it can be answered from an indexed id."""
+        return self.id_path == (self.id_field,)
+
+    def read_id(self, body: Any) -> str:
+        """The id in the decoded JSON `body` of a response."""
+        for key in self.id_path:
+            body = body[key]
+        if not isinstance(body, str):
+            raise TypeError(f"Expected the {self.id_field} of {self.path} to be a string, got {type(body).__name__}")
+        return body
+
+    def params(self, name: str, world: Optional[str]) -> Dict[str, str]:
+        params = {self.name_param: name}
+        if self.world_param is not None:
+            if world is None:
+                raise ValueError(f"'world' is required to resolve ids of {self.game}")
+            params[self.world_param] = world
+        return params
+
+
+ID_ROUTES: Dict[str, IdRoute] = {
+    route.game: route
+    for route in (
+        IdRoute("maplestory/v1/id", id_field="ocid", name_param="character_name"),
+        IdRoute("maplestorym/v1/id", id_field="ocid", name_param="character_name", world_param="world_name"),
+        IdRoute("wp/v1/id", id_field="ocid", name_param="character_name", world_param="world_name"),
+        IdRoute("heroes/v1/id", id_field="ocid", name_param="character_name"),
+        IdRoute("baram/v1/id", id_field="ocid", name_param="character_name", world_param="server_name"),
+        IdRoute("baramy/v1/id", id_field="ocid", name_param="character_name", world_param="server_name"),
+        IdRoute("hit2/v1/id", id_field="ocid", name_param="character_name"),
+        IdRoute("v4/v1/id", id_field="ocid", name_param="character_name"),
+        IdRoute("ca/v1/id", id_field="ouid", name_param="user_name", world_param="world_name"),
+        # answers `{"ouid_info": [{"ouid": ..., "racer_date_create": ..., "racer_level": ...}]}`
+        IdRoute("kartrush/v1/id", id_field="ouid", name_param="racer_name", id_path=("ouid_info", 0, "ouid")),
+        IdRoute("fconline/v1/id", id_field="ouid", name_param="nickname"),
+        IdRoute("tfd/v1/id", id_field="ouid", name_param="user_name"),
+    )
+}
+
+
+class Name(str):
+    """A character or user name passed in place of an `ocid`/`ouid`, resolved into its id before the call.
+
+    ```py
+    client.maplestory.get_character_basic(ocid=Name("..."))
+    client.maplestorym.get_character_basic(ocid=Name("...", world="아케인"))
+    ```
+
+    Every call with a name first calls `get_ocid`/`get_ouid`, pass an `IdIndex` to the client so that names are
+    only resolved once.
+    """
+
+    world: Optional[str]
+
+    def __new__(cls, name: str, *, world: Optional[str] = None) -> Name:
+        self = super().__new__(cls, name)
+        self.world = world
+        return self
+
+
+def id_route_for_path(path: str) -> Optional[IdRoute]:
+    path = path.strip("/")
+    route = ID_ROUTES.get(path.split("/", 1)[0])
+    if route is None or route.path != path:
+        return None
+    return route
+
+
+class IdIndex:
+    """A persistent index of `(game, world, name) -> id`, stored in a SQLite database file.
+
+    Identifiers rarely change, so once a name is resolved it is served from the index. Entries older
+    than `max_age` seconds are treated as missing and resolved again, `None` keeps them forever.
+
+    ```py
+    client = NexonOpenAPI(id_index=IdIndex("ids.sqlite3", max_age=7 * 24 * 60 * 60))
+    client.maplestory.get_ocid(character_name="...")  # only the first call hits the API
+    ```
+    """
+
+    max_age: Optional[float]
+    stats: CacheStats
+
+    def __init__(self, path: Union[str, PathLike[str]] = ":memory:", *, max_age: Optional[float] = None) -> None:
+        # imported here, the clients import this module for `Name` alone
+        import sqlite3
+
+        self.max_age = max_age
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ids (
+                game TEXT NOT NULL,
+                world TEXT NOT NULL,
+                name TEXT NOT NULL,
+                id TEXT NOT NULL,
+                resolved_at REAL NOT NULL,
+                PRIMARY KEY (game, world, name)
+            ) WITHOUT ROWID
+            """)
+
+    def get(self, game: str, name: str, world: Optional[str] = None) -> Optional[str]:
+        """Return the id stored for `name`, `None` if it is unknown or has to be revalidated."""
+        return self.get_many(game, [name], world).get(name)
+
+    def get_many(self, game: str, names: Iterable[str], world: Optional[str] = None) -> Dict[str, str]:
+        """Return the ids of every name in `names` that is stored and still fresh."""
+        found: Dict[str, str] = {}
+        unique = list(dict.fromkeys(names))
+        with self._lock:
+            for start in range(0, len(unique), _MAX_VARIABLES):
+                chunk = unique[start : start + _MAX_VARIABLES]
+                rows = self._conn.execute(
+                    f"SELECT name, id FROM ids WHERE game = ? AND world = ? AND resolved_at >= ? "
+                    f"AND name IN ({', '.join('?' * len(chunk))})",
+                    (game, world or "", self._fresh_after(), *chunk),
+                ).fetchall()
+                found.update(rows)
+        return found
+
+    def set(self, game: str, name: str, id: str, world: Optional[str] = None) -> None:
+        self.set_many(game, {name: id}, world)
+
+    def set_many(self, game: str, ids: Mapping[str, str], world: Optional[str] = None) -> None:
+        now = time.time()
+        rows: List[Tuple[str, str, str, str, float]] = [(game, world or "", name, id, now) for name, id in ids.items()]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO ids (game, world, name, id, resolved_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def delete(self, game: str, name: str, world: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM ids WHERE game = ? AND world = ? AND name = ?",
+                (game, world or "", name),
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM ids")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM ids").fetchone()[0]
+
+    def _fresh_after(self) -> float:
+        return time.time() - self.max_age if self.max_age is not None else float("-inf")
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Union, Callable
+
+JSONDecoder = Callable[[Union[bytes, str]], Any]
+"""Decodes a JSON document, the raw body of a response is passed as `bytes`."""
+
+
+def stdlib_json_loads(content: Union[bytes, str]) -> Any:
+    return json.loads(content)
+
+
+def default_json_decoder() -> JSONDecoder:
+    """Return the fastest JSON decoder that is installed: `orjson`, `msgspec` or the standard library."""
+    try:
+        import orjson
+    except ImportError:
+        pass
+    else:
+        return orjson.loads  # type: ignore[no-any-return]
+
+    try:
+        import msgspec
+    except ImportError:
+        pass
+    else:
+        return msgspec.json.decode  # type: ignore[no-any-return]
+
+    return stdlib_json_loads
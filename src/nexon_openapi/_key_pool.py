@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Dict, List, Tuple, Union, Mapping, Iterable, Optional, cast
+from typing_extensions import override
+
+from ._rate_limit import TokenBucket
+
+
+class _PooledKey:
+    def __init__(self, key: str, bucket: Optional[TokenBucket]) -> None:
+        self.key = key
+        self.bucket = bucket
+        self.benched_until = 0.0
+        self.last_used = 0.0
+        self.requests = 0
+
+    def rank(self, now: float) -> Tuple[float, float, float]:
+        """Keys are picked in ascending order: the earliest a request can be sent, the most tokens left,
+        the least recently used."""
+        bench = max(0.0, self.benched_until - now)
+        if self.bucket is None:
+            return bench, 0.0, self.last_used
+
+        balance = self.bucket.balance
+        return max(bench, (1 - balance) / self.bucket.rate), -balance, self.last_used
+
+
+class APIKeyPool:
+    """Spreads requests over several API keys, each with its own quota.
+
+    Every request is sent with the key that has the most tokens left in its rate limiter, keys with the
+    same budget take turns. A key that receives a `429` response is benched for `Retry-After` seconds or
+    `rate_limit_bench` seconds, a key that receives a `403` response for `forbidden_bench` seconds, and the
+    request is retried with another key. Requests wait for a key to come back once every key is benched.
+
+    ```py
+    # every key allows 500 requests per second
+    client = NexonOpenAPI(key_pool=APIKeyPool(["key-1", "key-2", "key-3"], rate=500))
+
+    # keys with different quotas
+    client = NexonOpenAPI(key_pool=APIKeyPool({"key-1": TokenBucket(rate=500), "key-2": TokenBucket(rate=5)}))
+    ```
+    """
+
+    rate_limit_bench: float
+    forbidden_bench: float
+
+    def __init__(
+        self,
+        keys: Union[Iterable[str], Mapping[str, Optional[TokenBucket]]],
+        *,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        rate_limit_bench: float = 1.0,
+        forbidden_bench: float = 300.0,
+    ) -> None:
+        if isinstance(keys, Mapping):
+            buckets = cast(Mapping[str, Optional[TokenBucket]], keys)
+            pooled = [_PooledKey(key, bucket) for key, bucket in buckets.items()]
+        else:
+            pooled = [_PooledKey(key, TokenBucket(rate, burst) if rate is not None else None) for key in keys]
+        if not pooled:
+            raise ValueError("at least one key is required")
+
+        self.rate_limit_bench = rate_limit_bench
+        self.forbidden_bench = forbidden_bench
+        self._keys: Dict[str, _PooledKey] = {key.key: key for key in pooled}
+        self._lock = threading.Lock()
+
+    @property
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def checkout(self) -> Tuple[str, float]:
+        """Pick the key for the next request and reserve a token from its rate limiter.
+
+        Return the key and the number of seconds to wait before the request may be sent with it, until its
+        rate limiter has a token or, if every key is benched, until its bench is over.
+        """
+        with self._lock:
+            now = time.monotonic()
+            pooled = min(self._keys.values(), key=lambda key: key.rank(now))
+            pooled.last_used = now
+            pooled.requests += 1
+
+            delay = max(0.0, pooled.benched_until - now)
+            if pooled.bucket is not None:
+                delay = max(delay, pooled.bucket.reserve())
+            return pooled.key, delay
+
+    def bench(self, key: str, seconds: float) -> None:
+        """Stop using `key` for `seconds` seconds, unless every other key is benched for longer."""
+        with self._lock:
+            pooled = self._keys.get(key)
+            if pooled is not None:
+                pooled.benched_until = max(pooled.benched_until, time.monotonic() + seconds)
+
+    def has_active_key(self) -> bool:
+        """Whether at least one key is not benched."""
+        with self._lock:
+            now = time.monotonic()
+            return any(key.benched_until <= now for key in self._keys.values())
+
+    def benched_keys(self) -> List[str]:
+        with self._lock:
+            now = time.monotonic()
+            return [key.key for key in self._keys.values() if key.benched_until > now]
+
+    def requests(self) -> Dict[str, int]:
+        """The number of requests sent with every key."""
+        with self._lock:
+            return {key.key: key.requests for key in self._keys.values()}
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(keys={len(self._keys)}, benched={len(self.benched_keys())})"
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import math
+import threading
+from typing import Dict, List, Callable, Optional
+from typing_extensions import override
+
+import httpx
+
+from ._hooks import Hooks
+from ._exceptions import NexonError
+
+# every power of two is split into this many linear buckets, a recorded value is off by at most 1/64 (1.6%)
+_SUB_BUCKETS = 64
+_SUB_BUCKET_BITS = 6
+
+
+class LatencyHistogram:
+    """A log-linear histogram of durations, in the spirit of HdrHistogram.
+
+    Durations are recorded with microsecond resolution in buckets whose width grows with their value, so the
+    memory used does not depend on the number of samples and percentiles are accurate to 1.6%.
+    """
+
+    count: int
+    total: float
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self._max = 0
+        self._buckets: Dict[int, int] = {}
+
+    def record(self, seconds: float) -> None:
+        micros = max(0, int(seconds * 1_000_000))
+        index = _bucket_index(micros)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self._max = max(self._max, micros)
+
+    def percentile(self, percentile: float) -> float:
+        """The duration, in seconds, below which `percentile` percent of the recorded durations fall."""
+        if not self.count:
+            return 0.0
+
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(_bucket_value(index), self._max) / 1_000_000
+        return self.max
+
+    @property
+    def max(self) -> float:
+        return self._max / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: LatencyHistogram) -> None:
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self._max = max(self._max, other._max)
+
+    def copy(self) -> LatencyHistogram:
+        histogram = LatencyHistogram()
+        histogram.merge(self)
+        return histogram
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count}, p50={self.percentile(50):.4f}, "
+            f"p99={self.percentile(99):.4f}, max={self.max:.4f})"
+        )
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < 2 * _SUB_BUCKETS:
+        return micros
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    return shift * _SUB_BUCKETS + (micros >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """The middle of the values of bucket `index`."""
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    return ((index - shift * _SUB_BUCKETS) << shift) + (1 << shift) // 2
+
+
+class EndpointMetrics:
+    """What a `MetricsCollector` recorded for one endpoint.
+
+    `latency` is the network time of every attempt, from sending the request to reading the whole body, and
+    `parse` the time spent decoding and validating bodies into models. `requests` counts attempts, retries
+    included, and `bytes_received` the bytes read from the network, before decompression.
+    """
+
+    requests: int
+    retries: int
+    bytes_received: int
+    cache_hits: int
+    cache_misses: int
+    latency: LatencyHistogram
+    parse: LatencyHistogram
+    status_codes: Dict[int, int]
+    errors: Dict[str, int]
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.retries = 0
+        self.bytes_received = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.latency = LatencyHistogram()
+        self.parse = LatencyHistogram()
+        self.status_codes = {}
+        self.errors = {}
+
+    def merge(self, other: EndpointMetrics) -> None:
+        self.requests += other.requests
+        self.retries += other.retries
+        self.bytes_received += other.bytes_received
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.latency.merge(other.latency)
+        self.parse.merge(other.parse)
+        for status_code, count in other.status_codes.items():
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + count
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+
+    def copy(self) -> EndpointMetrics:
+        metrics = EndpointMetrics()
+        metrics.merge(self)
+        return metrics
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(requests={self.requests}, retries={self.retries}, "
+            f"status_codes={self.status_codes}, latency={self.latency!r}, parse={self.parse!r})"
+        )
+
+
+class MetricsCollector(Hooks):
+    """Hooks that keep per endpoint latency histograms, status code counts, retries, errors and bytes received.
+
+    ```py
+    metrics = MetricsCollector()
+    client = NexonOpenAPI(hooks=[metrics])
+    ...
+    print(metrics.report())  # or metrics.report(family=route_family) to group the endpoints by family
+    metrics.endpoints()["maplestory/v1/character/basic"].latency.percentile(99)
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    @override
+    def on_response(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        with self._lock:
+            metrics = self._endpoint(path)
+            metrics.requests += 1
+            metrics.latency.record(elapsed)
+            metrics.bytes_received += response.num_bytes_downloaded
+            metrics.status_codes[response.status_code] = metrics.status_codes.get(response.status_code, 0) + 1
+
+    @override
+    def on_retry(
+        self,
+        path: str,
+        request: httpx.Request,
+        *,
+        attempt: int,
+        delay: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        with self._lock:
+            self._endpoint(path).retries += 1
+
+    @override
+    def on_error(self, path: str, error: NexonError) -> None:
+        name = type(error).__name__
+        with self._lock:
+            errors = self._endpoint(path).errors
+            errors[name] = errors.get(name, 0) + 1
+
+    @override
+    def on_parse(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        with self._lock:
+            self._endpoint(path).parse.record(elapsed)
+
+    @override
+    def on_cache_hit(self, path: str, *, source: str) -> None:
+        with self._lock:
+            self._endpoint(path).cache_hits += 1
+
+    @override
+    def on_cache_miss(self, path: str, *, source: str) -> None:
+        with self._lock:
+            self._endpoint(path).cache_misses += 1
+
+    def endpoints(self, family: Optional[Callable[[str], str]] = None) -> Dict[str, EndpointMetrics]:
+        """A snapshot of the metrics of every endpoint, merged per `family(path)` when `family` is given
+        (e.g. `route_family`)."""
+        with self._lock:
+            snapshot = {path: metrics.copy() for path, metrics in self._endpoints.items()}
+        if family is None:
+            return snapshot
+
+        merged: Dict[str, EndpointMetrics] = {}
+        for path, metrics in snapshot.items():
+            key = family(path)
+            if key in merged:
+                merged[key].merge(metrics)
+            else:
+                merged[key] = metrics
+        return merged
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+    def report(self, family: Optional[Callable[[str], str]] = None) -> str:
+        """A text table of the endpoints, the ones that spent the most time on the network and parsing first.
+        Durations are in milliseconds."""
+        endpoints = self.endpoints(family)
+        rows: List[List[str]] = [
+            ["endpoint", "requests", "p50", "p95", "p99", "max", "parse p50", "parse p99", "total s", "parse s",
+             "retries", "errors", "cached", "KiB"]  # fmt: skip
+        ]
+        ranked = sorted(endpoints.items(), key=lambda item: item[1].latency.total + item[1].parse.total, reverse=True)
+        for path, metrics in ranked:
+            latency, parse = metrics.latency, metrics.parse
+            rows.append(
+                [
+                    path,
+                    str(metrics.requests),
+                    *(f"{latency.percentile(percentile) * 1000:.1f}" for percentile in (50, 95, 99)),
+                    f"{latency.max * 1000:.1f}",
+                    f"{parse.percentile(50) * 1000:.2f}",
+                    f"{parse.percentile(99) * 1000:.2f}",
+                    f"{latency.total:.2f}",
+                    f"{parse.total:.2f}",
+                    str(metrics.retries),
+                    str(sum(metrics.errors.values())),
+                    str(metrics.cache_hits),
+                    f"{metrics.bytes_received / 1024:.0f}",
+                ]
+            )
+
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if column == 0 else cell.rjust(width)
+                for column, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def _endpoint(self, path: str) -> EndpointMetrics:
+        metrics = self._endpoints.get(path)
+        if metrics is None:
+            metrics = self._endpoints[path] = EndpointMetrics()
+        return metrics
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(endpoints={len(self._endpoints)})"
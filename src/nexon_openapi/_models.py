@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import datetime
 import inspect
 from typing import (
     TYPE_CHECKING,
@@ -8,7 +7,10 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    List,
+    Tuple,
     Optional,
+    FrozenSet,
     Set,
     Type,
     TypeVar,
@@ -34,7 +36,7 @@ from pydantic import ConfigDict
 from pydantic.fields import FieldInfo
 
 
-from ._types import Query, Headers, Body, AnyMapping, NotGiven, NOT_GIVEN, ModelT, IncEx
+from ._types import Query, Headers, Body, AnyMapping, NotGiven, NOT_GIVEN, ModelT, IncEx, ResponseMode
 from ._compat import PYDANTIC_V2, ConfigDict
 from ._compat import GenericModel as BaseGenericModel
 from ._compat import (
@@ -46,12 +48,14 @@ from ._compat import (
     get_model_config,
     get_model_fields,
     field_get_default,
+    field_outer_type,
 )
 from .utils import is_given, strip_not_given, is_mapping, is_list
 
-
 _T = TypeVar("_T")
 
+_Constructor = Callable[[object], object]
+
 
 @runtime_checkable
 class _ConfigProtocol(Protocol):
@@ -88,32 +92,26 @@ class BaseModel(pydantic.BaseModel):
     ) -> ModelT:
         m = cls.__new__(cls)
         fields_values: dict[str, object] = {}
-
-        config = get_model_config(cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
+        plan = _model_plan(cls)
 
         if _fields_set is None:
             _fields_set = set()
 
-        model_fields = get_model_fields(cls)
-        for name, field in model_fields.items():
-            key = field.alias
-            if key is None or (key not in values and populate_by_name):
+        for name, alias, field, construct_value in plan.fields:
+            key = alias
+            if key is None or (key not in values and plan.populate_by_name):
                 key = name
 
             if key in values:
-                fields_values[name] = _construct_field(value=values[key], field=field, key=key)
+                value = values[key]
+                fields_values[name] = field_get_default(field) if value is None else construct_value(value)
                 _fields_set.add(name)
             else:
                 fields_values[name] = field_get_default(field)
 
         _extra = {}
         for key, value in values.items():
-            if key not in model_fields:
+            if key not in plan.field_names:
                 if PYDANTIC_V2:
                     _extra[key] = value
                 else:
@@ -244,21 +242,6 @@ class BaseModel(pydantic.BaseModel):
             )
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
-
-    if PYDANTIC_V2:
-        type_ = field.annotation
-    else:
-        type_ = cast(type, field.outer_type_)  # type: ignore
-
-    if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
-
-    return construct_type(value=value, type_=type_)
-
-
 def is_basemodel(type_: type) -> bool:
     """Returns whether or not the given type is either a `BaseModel` or a union of `BaseModel`"""
     origin = get_origin(type_) or type_
@@ -281,6 +264,8 @@ class FinalRequestOptionsInput(TypedDict, total=False):
     timeout: Union[float, Timeout, None]
     json_data: Body
     extra_json: AnyMapping
+    response_mode: ResponseMode
+    budget: Optional[float]
 
 
 @final
@@ -293,6 +278,11 @@ class FinalRequestOptions(pydantic.BaseModel):
     timeout: Union[float, Timeout, None, NotGiven] = NOT_GIVEN
     idempotency_key: Optional[str] = None
     post_parser: Union[Callable[[Any], Any], NotGiven] = NOT_GIVEN
+    response_mode: Union[ResponseMode, NotGiven] = NOT_GIVEN
+    # the total number of seconds the request may take, including its retries
+    budget: Union[float, None, NotGiven] = NOT_GIVEN
+    # `time.monotonic()` after which the request is abandoned, set from the budget when the request starts
+    deadline: Optional[float] = None
 
     # It should be noted that we cannot use `json` here as that would override
     # a BaseModel method in an incompatible fashion.
@@ -357,75 +347,165 @@ def construct_type(*, value: object, type_: type) -> object:
 
     If the given value does not match the expected type then it is returned as-is.
     """
+    return _get_constructor(type_)(value)
+
+
+# `construct_type` runs for every value of every response, so the type introspection it needs is
+# done once per type: each type is compiled into a function that only looks at the value.
+_constructors: Dict[Any, _Constructor] = {}
 
+
+def _type_key(type_: Any) -> Any:
+    # `Union[A, B] == Union[B, A]`, but the variants are tried in order
+    return (type_, get_args(type_))
+
+
+def _get_constructor(type_: Any) -> _Constructor:
+    key = _type_key(type_)
+    try:
+        return _constructors[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable types can't be cached
+        return _compile_constructor(type_)
+
+    constructor = _constructors[key] = _compile_constructor(type_)
+    return constructor
+
+
+def _compile_constructor(type_: Any) -> _Constructor:
     # we need to use the origin class for any types that are subscripted generics
     # e.g. Dict[str, object]
     origin = get_origin(type_) or type_
     args = get_args(type_)
 
     if is_union(origin):
-        try:
-            return validate_type(type_=type_, value=value)
-        except Exception:
-            pass
+        variants = [_get_constructor(variant) for variant in args]
 
-        # if the data is not valid, use the first variant that doesn't fail while deserializing
-        for variant in args:
+        def construct_union(value: object) -> object:
             try:
-                return construct_type(value=value, type_=variant)
+                return validate_type(type_=type_, value=value)
             except Exception:
-                continue
+                pass
+
+            # if the data is not valid, use the first variant that doesn't fail while deserializing
+            for construct_variant in variants:
+                try:
+                    return construct_variant(value)
+                except Exception:
+                    continue
 
-        raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+            raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+
+        return construct_union
 
     if origin == dict:
-        if not is_mapping(value):
-            return value
+        construct_item = _get_constructor(args[1]) if len(args) == 2 else _identity  # Dict[_, items_type]
+
+        def construct_dict(value: object) -> object:
+            if not is_mapping(value):
+                return value
+            return {key: construct_item(item) for key, item in value.items()}
 
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {key: construct_type(value=item, type_=items_type) for key, item in value.items()}
+        return construct_dict
 
-    if not is_literal_type(type_) and (issubclass(origin, pydantic.BaseModel) or issubclass(origin, GenericModel)):
-        if is_list(value):
-            return [cast(Any, type_).construct(**entry) if is_mapping(entry) else entry for entry in value]
+    if not is_literal_type(type_):
+        try:
+            is_model = issubclass(origin, pydantic.BaseModel) or issubclass(origin, GenericModel)
+        except TypeError as err:
+            return _raise(err)
+
+        if is_model:
+            model: Any = type_
+            construct_mapping = model.model_construct if issubclass(type_, pydantic.BaseModel) else model.construct
 
-        if is_mapping(value):
-            if issubclass(type_, pydantic.BaseModel):
-                return type_.model_construct(**value)  # type: ignore[arg-type]
+            def construct_model(value: object) -> object:
+                if is_list(value):
+                    return [model.construct(**entry) if is_mapping(entry) else entry for entry in value]
 
-            return cast(Any, type_).construct(**value)
+                if is_mapping(value):
+                    return construct_mapping(**value)
+
+                return value
+
+            return construct_model
 
     if origin == list:
-        if not is_list(value):
-            return value
+        construct_entry = _get_constructor(args[0]) if args else _identity  # List[inner_type]
 
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
+        def construct_list(value: object) -> object:
+            if not is_list(value):
+                return value
+            return [construct_entry(entry) for entry in value]
+
+        return construct_list
 
     if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
+        return _construct_float
 
-        return value
+    return _identity
 
-    if type_ == datetime.date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
 
-    if type_ == datetime:  # type: ignore
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
             return value
+        return coerced
 
     return value
 
 
+def _identity(value: object) -> object:
+    return value
+
+
+def _raise(error: Exception) -> _Constructor:
+    def construct(value: object) -> object:  # noqa: ARG001
+        raise type(error)(*error.args)
+
+    return construct
+
+
+class _ModelPlan:
+    """What `BaseModel.construct` needs to know about a model class, computed once per class."""
+
+    populate_by_name: bool
+    fields: List[Tuple[str, Optional[str], FieldInfo, _Constructor]]
+    field_names: FrozenSet[str]
+
+    def __init__(self, model: Type[pydantic.BaseModel]) -> None:
+        config = get_model_config(model)
+        self.populate_by_name = bool(
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+
+        model_fields = get_model_fields(model)
+        self.field_names = frozenset(model_fields)
+        self.fields = [
+            (name, field.alias, field, _field_constructor(name, field)) for name, field in model_fields.items()
+        ]
+
+
+_model_plans: Dict[type, _ModelPlan] = {}
+
+
+def _model_plan(model: Type[pydantic.BaseModel]) -> _ModelPlan:
+    plan = _model_plans.get(model)
+    if plan is None:
+        plan = _model_plans[model] = _ModelPlan(model)
+    return plan
+
+
+def _field_constructor(name: str, field: FieldInfo) -> _Constructor:
+    type_ = field_outer_type(field)
+    if type_ is None:
+        return _raise(RuntimeError(f"Unexpected field type is None for {name}"))
+    return _get_constructor(type_)
+
+
 # our use of subclasssing here causes weirdness for type checkers,
 # so we just pretend that we don't subclass
 if TYPE_CHECKING:
@@ -439,8 +519,18 @@ else:
 if PYDANTIC_V2:
     from pydantic import TypeAdapter
 
+    _type_adapters: Dict[Any, TypeAdapter[Any]] = {}
+
     def _validate_non_model_type(*, type_: Type[_T], value: object) -> _T:
-        return TypeAdapter(type_).validate_python(value)
+        key = _type_key(type_)
+        try:
+            adapter = _type_adapters.get(key)
+        except TypeError:  # unhashable types can't be cached
+            return TypeAdapter(type_).validate_python(value)
+
+        if adapter is None:
+            adapter = _type_adapters[key] = TypeAdapter(type_)
+        return cast(_T, adapter.validate_python(value))
 
 elif not TYPE_CHECKING:  # TODO: condition is weird
 
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import queue
+import asyncio
+import itertools
+import threading
+from typing import Any, Deque, Tuple, TypeVar, Callable, Iterable, Iterator, Optional, Awaitable, AsyncIterator
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+_KeyT = TypeVar("_KeyT")
+_PageT = TypeVar("_PageT")
+
+# marks the end of a cursor chain in its queue
+_END = object()
+
+
+def _page_numbers(start: int, end: Optional[int]) -> Iterator[int]:
+    if start < 1:
+        raise ValueError("start page must be greater than 0")
+    return itertools.count(start) if end is None else iter(range(start, end))
+
+
+def iter_pages(
+    fetch_page: Callable[[int], _PageT],
+    is_empty: Callable[[_PageT], bool],
+    *,
+    start: int = 1,
+    end: Optional[int] = None,
+    prefetch: int = 4,
+) -> Iterator[_PageT]:
+    """Yield the pages `start, start + 1, ...` in order until an empty page is returned or `end` (exclusive) is reached.
+
+    Up to `prefetch` pages are fetched ahead on a thread pool while the current page is being consumed.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be greater than 0")
+
+    pages = _page_numbers(start, end)
+    with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="nexon-openapi-pages") as executor:
+        window: Deque[Future[_PageT]] = deque(
+            executor.submit(fetch_page, page) for page in itertools.islice(pages, prefetch)
+        )
+        try:
+            while window:
+                page = window.popleft().result()
+                if is_empty(page):
+                    return
+
+                for number in itertools.islice(pages, 1):
+                    window.append(executor.submit(fetch_page, number))
+
+                yield page
+        finally:
+            for future in window:
+                future.cancel()
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int], Awaitable[_PageT]],
+    is_empty: Callable[[_PageT], bool],
+    *,
+    start: int = 1,
+    end: Optional[int] = None,
+    prefetch: int = 4,
+) -> AsyncIterator[_PageT]:
+    """Yield the pages `start, start + 1, ...` in order until an empty page is returned or `end` (exclusive) is reached.
+
+    Up to `prefetch` pages are fetched concurrently ahead while the current page is being consumed.
+    """
+    if prefetch < 1:
+        raise ValueError("prefetch must be greater than 0")
+
+    pages = _page_numbers(start, end)
+    window: Deque[asyncio.Future[_PageT]] = deque(
+        asyncio.ensure_future(fetch_page(page)) for page in itertools.islice(pages, prefetch)
+    )
+    try:
+        while window:
+            page = await window.popleft()
+            if is_empty(page):
+                return
+
+            for number in itertools.islice(pages, 1):
+                window.append(asyncio.ensure_future(fetch_page(number)))
+
+            yield page
+    finally:
+        for task in window:
+            task.cancel()
+
+
+def iter_cursor_chains(
+    fetch_page: Callable[[_KeyT, Optional[str]], _PageT],
+    next_cursor: Callable[[_PageT], Optional[str]],
+    keys: Iterable[_KeyT],
+    *,
+    concurrency: int = 4,
+    buffer: int = 2,
+) -> Iterator[_PageT]:
+    """Follow a cursor chain for every key and yield the pages of each chain in key order.
+
+    `fetch_page(key, None)` returns the first page of a chain and `fetch_page(key, cursor)` the following ones,
+    until `next_cursor` returns a falsy value. Up to `concurrency` chains are crawled on a thread pool at once,
+    each of them holding at most `buffer` pages that have not been consumed yet.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than 0")
+    if buffer < 1:
+        raise ValueError("buffer must be greater than 0")
+
+    stop = threading.Event()
+
+    def offer(chain: queue.Queue[Any], item: object) -> None:
+        # once the consumer is gone nobody drains the queue anymore
+        if not stop.is_set():
+            chain.put(item)
+
+    def crawl(key: _KeyT, chain: queue.Queue[Any]) -> None:
+        try:
+            cursor: Optional[str] = None
+            while not stop.is_set():
+                page = fetch_page(key, cursor)
+                offer(chain, page)
+                cursor = next_cursor(page)
+                if not cursor:
+                    break
+        except BaseException as error:
+            offer(chain, _ChainError(error))
+        finally:
+            offer(chain, _END)
+
+    iterator = iter(keys)
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="nexon-openapi-cursor") as executor:
+
+        def start(key: _KeyT) -> queue.Queue[Any]:
+            chain: queue.Queue[Any] = queue.Queue(maxsize=buffer)
+            executor.submit(crawl, key, chain)
+            return chain
+
+        chains: Deque[queue.Queue[Any]] = deque(start(key) for key in itertools.islice(iterator, concurrency))
+        try:
+            while chains:
+                item = chains[0].get()
+                if item is _END:
+                    chains.popleft()
+                    for key in itertools.islice(iterator, 1):
+                        chains.append(start(key))
+                    continue
+
+                if isinstance(item, _ChainError):
+                    raise item.error
+
+                yield item
+        finally:
+            stop.set()
+            # unblock the workers that are waiting for room in their queue, they exit once they notice `stop`
+            for chain in chains:
+                _drain(chain)
+
+
+async def aiter_cursor_chains(
+    fetch_page: Callable[[_KeyT, Optional[str]], Awaitable[_PageT]],
+    next_cursor: Callable[[_PageT], Optional[str]],
+    keys: Iterable[_KeyT],
+    *,
+    concurrency: int = 4,
+    buffer: int = 2,
+) -> AsyncIterator[_PageT]:
+    """Follow a cursor chain for every key and yield the pages of each chain in key order.
+
+    The async equivalent of `iter_cursor_chains`, the chains are crawled by concurrent tasks.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be greater than 0")
+    if buffer < 1:
+        raise ValueError("buffer must be greater than 0")
+
+    async def crawl(key: _KeyT, chain: asyncio.Queue[Any]) -> None:
+        try:
+            cursor: Optional[str] = None
+            while True:
+                page = await fetch_page(key, cursor)
+                await chain.put(page)
+                cursor = next_cursor(page)
+                if not cursor:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            await chain.put(_ChainError(error))
+        await chain.put(_END)
+
+    def start(key: _KeyT) -> Tuple[asyncio.Queue[Any], asyncio.Future[None]]:
+        chain: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer)
+        return chain, asyncio.ensure_future(crawl(key, chain))
+
+    iterator = iter(keys)
+    chains: Deque[Tuple[asyncio.Queue[Any], asyncio.Future[None]]] = deque(
+        start(key) for key in itertools.islice(iterator, concurrency)
+    )
+    try:
+        while chains:
+            item = await chains[0][0].get()
+            if item is _END:
+                chains.popleft()
+                for key in itertools.islice(iterator, 1):
+                    chains.append(start(key))
+                continue
+
+            if isinstance(item, _ChainError):
+                raise item.error
+
+            yield item
+    finally:
+        for _, task in chains:
+            task.cancel()
+
+
+class _ChainError:
+    """Carries an exception raised while crawling a chain over to the consumer."""
+
+    error: BaseException
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _drain(chain: queue.Queue[Any]) -> None:
+    try:
+        while True:
+            chain.get_nowait()
+    except queue.Empty:
+        pass
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import Any, List, Union, Optional
+from typing_extensions import override
+
+import httpx
+
+
+class PoolStats:
+    """A snapshot of the connection pool of a client.
+
+    `connections` is the number of open connections, of which `idle` are kept alive without a request in
+    flight and `active` are serving requests. `waiting` requests are queued for a connection because the pool
+    is full, a steady non-zero value means `max_connections` is too low. It is `None` with httpcore versions
+    that do not report queued requests (before 1.0). `http2` connections multiplex their requests.
+    """
+
+    connections: int
+    idle: int
+    active: int
+    waiting: Optional[int]
+    http2: int
+
+    def __init__(self, *, connections: int, idle: int, active: int, waiting: Optional[int], http2: int) -> None:
+        self.connections = connections
+        self.idle = idle
+        self.active = active
+        self.waiting = waiting
+        self.http2 = http2
+
+    @override
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(connections={self.connections}, idle={self.idle}, active={self.active}, "
+            f"waiting={self.waiting}, http2={self.http2})"
+        )
+
+
+def pool_stats(client: Union[httpx.Client, httpx.AsyncClient]) -> Optional[PoolStats]:
+    """Inspect the connection pool of an httpx client, `None` if it does not use an httpcore connection pool
+    (e.g. a `MockTransport`)."""
+    # httpx does not expose its pool. The connections of the pool and their `is_closed()`, `is_idle()` and `info()`
+    # are there since httpcore 0.17 (httpx 0.24), the queued requests are only told apart by httpcore 1.x
+    pool: Any = getattr(getattr(client, "_transport", None), "_pool", None)
+    if pool is None or not hasattr(pool, "connections"):
+        return None
+
+    connections = [connection for connection in pool.connections if not connection.is_closed()]
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return PoolStats(
+        connections=len(connections),
+        idle=idle,
+        active=len(connections) - idle,
+        waiting=_waiting(getattr(pool, "_requests", [])),
+        http2=sum(1 for connection in connections if ", HTTP/2," in connection.info()),
+    )
+
+
+def _waiting(requests: List[Any]) -> Optional[int]:
+    if not all(hasattr(request, "is_queued") for request in requests):
+        return None
+    return sum(1 for request in requests if request.is_queued())
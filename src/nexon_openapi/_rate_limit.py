@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+import os
+import mmap
+import time
+import struct
+import threading
+from os import PathLike
+from typing import Any, List, Tuple, Union, Mapping, Optional, Generator
+from contextlib import contextmanager
+from typing_extensions import override
+
+import anyio
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens are refilled continuously at `rate` tokens per second, up to `burst` tokens.
+
+    Callers reserve a token up front and are told how long they have to wait until it becomes
+    available, so concurrent callers are queued in order instead of polling the bucket.
+
+    `blocking` tells whether `reserve` and `balance` do I/O, `RateLimiter.aacquire` then calls them on a worker
+    thread.
+    """
+
+    rate: float
+    burst: float
+    blocking: bool = False
+
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+
+        if burst is None:
+            burst = max(rate, 1.0)
+        if burst < 1:
+            raise ValueError("burst must be greater than or equal to 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take `tokens` from the bucket and return the number of seconds to wait before they can be used."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def refund(self, tokens: float = 1.0) -> None:
+        """Give back `tokens` that were reserved but will not be used."""
+        self.reserve(-tokens)
+
+    @property
+    def balance(self) -> float:
+        """The number of tokens left, negative when tokens were reserved ahead of time by waiting callers."""
+        with self._lock:
+            elapsed = time.monotonic() - self._updated_at
+            return min(self.burst, self._tokens + elapsed * self.rate)
+
+    @property
+    def available(self) -> float:
+        """The number of tokens that can be taken right now without waiting."""
+        return max(0.0, self.balance)
+
+
+# magic, tokens, updated at (`time.monotonic()`, which is the same clock in every process of a machine)
+_SHARED_STATE = struct.Struct("<4sdd")
+_SHARED_MAGIC = b"NXTB"
+
+
+class SharedTokenBucket(TokenBucket):
+    """A token bucket whose state is stored in a memory-mapped file, shared by every process of the machine
+    that opens the same `path`.
+
+    Use it when several worker processes (gunicorn, celery, ...) send requests with the same API key:
+
+    ```py
+    limiter = RateLimiter(bucket=SharedTokenBucket("/tmp/nexon-openapi.bucket", rate=450, burst=50))
+    client = NexonOpenAPI(rate_limiter=limiter)
+    ```
+
+    Every process must use the same `rate` and `burst`. Updates are serialized with `flock`, so this is only
+    available on POSIX systems.
+    """
+
+    path: str
+    # `flock` waits for the other processes
+    blocking = True
+
+    def __init__(self, path: Union[str, PathLike[str]], rate: float, burst: Optional[float] = None) -> None:
+        super().__init__(rate, burst)
+
+        import fcntl  # POSIX only
+
+        self._fcntl = fcntl
+        self.path = os.fspath(path)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(fd).st_size < _SHARED_STATE.size:
+                    os.ftruncate(fd, _SHARED_STATE.size)
+                self._map = mmap.mmap(fd, _SHARED_STATE.size)
+
+                magic, _, updated_at = _SHARED_STATE.unpack_from(self._map)
+                # a new file, or one that was written before the machine rebooted and the clock restarted
+                if magic != _SHARED_MAGIC or updated_at > time.monotonic():
+                    _SHARED_STATE.pack_into(self._map, 0, _SHARED_MAGIC, self.burst, time.monotonic())
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    @override
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._locked():
+            _, stored, updated_at = _SHARED_STATE.unpack_from(self._map)
+            now = time.monotonic()
+            stored = min(self.burst, stored + max(0.0, now - updated_at) * self.rate) - tokens
+            _SHARED_STATE.pack_into(self._map, 0, _SHARED_MAGIC, stored, now)
+
+        if stored >= 0:
+            return 0.0
+        return -stored / self.rate
+
+    @property
+    @override
+    def balance(self) -> float:
+        with self._locked():
+            _, stored, updated_at = _SHARED_STATE.unpack_from(self._map)
+        return min(self.burst, stored + max(0.0, time.monotonic() - updated_at) * self.rate)
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        # `flock` locks are held per open file, the threads of this process are serialized by `_lock`
+        with self._lock:
+            self._fcntl.flock(self._fd, self._fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                self._fcntl.flock(self._fd, self._fcntl.LOCK_UN)
+
+
+# refills and takes tokens atomically, returns the balance as a string as Redis truncates Lua numbers to integers
+_REDIS_RESERVE = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local tokens = tonumber(ARGV[3])
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call("HMGET", KEYS[1], "tokens", "updated_at")
+local stored = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+local balance = math.min(burst, stored + math.max(0, now - updated_at) * rate) - tokens
+if tokens ~= 0 then
+    redis.call("HSET", KEYS[1], "tokens", tostring(balance), "updated_at", tostring(now))
+    -- once the bucket is full again the key is not needed anymore
+    redis.call("EXPIRE", KEYS[1], math.ceil((burst - balance) / rate) + 1)
+end
+return tostring(balance)
+"""
+
+
+class RedisTokenBucket(TokenBucket):
+    """A token bucket stored in Redis, shared by every client that uses the same `key`, across machines.
+
+    `redis` is a `redis.Redis` client, or any client with a compatible `register_script()`:
+
+    ```py
+    import redis
+
+    bucket = RedisTokenBucket(redis.Redis(host="..."), "nexon-openapi:bucket", rate=450, burst=50)
+    client = NexonOpenAPI(rate_limiter=RateLimiter(bucket=bucket))
+    ```
+
+    Every reservation is a single round trip running a Lua script, the refill uses the clock of the Redis
+    server. Every client must use the same `rate` and `burst`.
+    """
+
+    key: str
+    blocking = True
+
+    def __init__(self, redis: Any, key: str, rate: float, burst: Optional[float] = None) -> None:
+        super().__init__(rate, burst)
+        self.key = key
+        self._script = redis.register_script(_REDIS_RESERVE)
+
+    @override
+    def reserve(self, tokens: float = 1.0) -> float:
+        balance = self._eval(tokens)
+        if balance >= 0:
+            return 0.0
+        return -balance / self.rate
+
+    @property
+    @override
+    def balance(self) -> float:
+        return self._eval(0.0)
+
+    def _eval(self, tokens: float) -> float:
+        return float(self._script(keys=[self.key], args=[repr(self.rate), repr(self.burst), repr(tokens)]))
+
+
+class RateLimiter:
+    """Client side rate limiter, consulted before every request is sent.
+
+    ```py
+    limiter = RateLimiter(
+        rate=450,  # requests per second shared by every endpoint
+        burst=50,
+        routes={
+            # endpoints matching a prefix additionally use their own bucket
+            "maplestory/v1/ranking/*": TokenBucket(rate=100, burst=10),
+            "maplestory/v1/character/*": TokenBucket(rate=300, burst=30),
+        },
+    )
+    client = NexonOpenAPI(rate_limiter=limiter)
+    ```
+
+    If several route prefixes match a path, the longest one wins.
+
+    Pass a `bucket` instead of `rate` and `burst` to share the quota with other processes, see
+    `SharedTokenBucket` and `RedisTokenBucket`. They can be used as route buckets as well.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        *,
+        bucket: Optional[TokenBucket] = None,
+        routes: Optional[Mapping[str, TokenBucket]] = None,
+    ) -> None:
+        if rate is not None and bucket is not None:
+            raise ValueError("'rate' and 'bucket' are mutually exclusive")
+        if rate is None and bucket is None and not routes:
+            raise ValueError("either 'rate', 'bucket' or 'routes' must be given")
+
+        self._bucket = TokenBucket(rate, burst) if rate is not None else bucket
+        self._routes: List[Tuple[str, TokenBucket]] = sorted(
+            ((_normalize_prefix(prefix), bucket) for prefix, bucket in (routes or {}).items()),
+            key=lambda route: len(route[0]),
+            reverse=True,
+        )
+
+    def reserve(self, path: str) -> float:
+        """Reserve a token for a request to `path` and return the number of seconds to wait before sending it."""
+        return max((bucket.reserve() for bucket in self._buckets(path)), default=0.0)
+
+    def has_capacity(self, path: str) -> bool:
+        """Whether a request to `path` could be sent right now without waiting, no token is taken."""
+        bucket = self._route_bucket(path)
+        if bucket is not None and bucket.available < 1:
+            return False
+        return self._bucket is None or self._bucket.available >= 1
+
+    async def ahas_capacity(self, path: str) -> bool:
+        """Whether a request to `path` could be sent right now without waiting, no token is taken."""
+        if self._blocking(path):
+            return await anyio.to_thread.run_sync(self.has_capacity, path)
+        return self.has_capacity(path)
+
+    def acquire(self, path: str, timeout: Optional[float] = None) -> bool:
+        """Block the current thread until a request to `path` may be sent.
+
+        If that would take longer than `timeout` seconds, return `False` at once without taking a token.
+        """
+        delay = self._reserve_within(path, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+    async def aacquire(self, path: str, timeout: Optional[float] = None) -> bool:
+        """Wait, without blocking the event loop, until a request to `path` may be sent.
+
+        If that would take longer than `timeout` seconds, return `False` at once without taking a token.
+        """
+        if self._blocking(path):
+            delay = await anyio.to_thread.run_sync(self._reserve_within, path, timeout)
+        else:
+            delay = self._reserve_within(path, timeout)
+        if delay is None:
+            return False
+        if delay > 0:
+            await anyio.sleep(delay)
+        return True
+
+    def _reserve_within(self, path: str, timeout: Optional[float]) -> Optional[float]:
+        buckets = self._buckets(path)
+        delay = max((bucket.reserve() for bucket in buckets), default=0.0)
+        if timeout is not None and delay > timeout:
+            # the request is not sent, its tokens are left to the requests queued behind it
+            for bucket in buckets:
+                bucket.refund()
+            return None
+        return delay
+
+    def _blocking(self, path: str) -> bool:
+        return any(bucket.blocking for bucket in self._buckets(path))
+
+    def _buckets(self, path: str) -> List[TokenBucket]:
+        buckets = [self._bucket] if self._bucket is not None else []
+        bucket = self._route_bucket(path)
+        if bucket is not None:
+            buckets.append(bucket)
+        return buckets
+
+    def _route_bucket(self, path: str) -> Optional[TokenBucket]:
+        path = path.lstrip("/")
+        for prefix, bucket in self._routes:
+            if path.startswith(prefix):
+                return bucket
+        return None
+
+
+def _normalize_prefix(prefix: str) -> str:
+    # `maplestory/v1/ranking/*` and `maplestory/v1/ranking/` describe the same set of routes
+    return prefix.lstrip("/").rstrip("*")
@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import os
+import json
+import time
+import base64
+import random
+import hashlib
+import threading
+from os import PathLike
+from typing import Any, Dict, List, Tuple, Union, Callable, Optional
+from typing_extensions import override
+
+import anyio
+import httpx
+
+from .utils import is_dict, is_list
+from ._rate_limit import TokenBucket
+
+# headers that describe the encoding of the recorded body, not the body that is replayed
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+
+_RANKING_PAGE_SIZE = 200
+_FC_ONLINE_DEFAULT_LIMIT = 10
+_FC_ONLINE_MAX_LIMIT = 100
+
+
+def _fixture_key(method: str, url: httpx.URL) -> str:
+    query = "&".join(f"{key}={value}" for key, value in sorted(url.params.multi_items()))
+    return f"{method.upper()} {url.path.strip('/')}?{query}"
+
+
+def _fixture_name(key: str, path: str) -> str:
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return f"{path.strip('/').replace('/', '_')}-{digest}.json"
+
+
+class RecordingTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Sends requests with `transport` and saves every successful response as a fixture file in `directory`,
+    to be replayed with a `ReplayTransport`.
+
+    ```py
+    transport = RecordingTransport("fixtures/")
+    client = NexonOpenAPI(http_client=httpx.Client(transport=transport))
+    ```
+
+    Works with both `httpx.Client` and `httpx.AsyncClient`, `transport` defaults to the httpx transport of the client
+    type. Request headers, and so the API key, are not recorded, the query with its ids and names is.
+    """
+
+    directory: str
+
+    def __init__(
+        self,
+        directory: Union[str, PathLike[str]],
+        transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport, None] = None,
+    ) -> None:
+        self.directory = os.fspath(directory)
+        self._transport = transport
+        os.makedirs(self.directory, exist_ok=True)
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.HTTPTransport()
+        assert isinstance(self._transport, httpx.BaseTransport)
+
+        response = self._transport.handle_request(request)
+        try:
+            content = response.read()
+        finally:
+            response.close()
+        return self._record(request, response, content)
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if self._transport is None:
+            self._transport = httpx.AsyncHTTPTransport()
+        assert isinstance(self._transport, httpx.AsyncBaseTransport)
+
+        response = await self._transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        return self._record(request, response, content)
+
+    @override
+    def close(self) -> None:
+        if isinstance(self._transport, httpx.BaseTransport):
+            self._transport.close()
+
+    @override
+    async def aclose(self) -> None:
+        if isinstance(self._transport, httpx.AsyncBaseTransport):
+            await self._transport.aclose()
+
+    def _record(self, request: httpx.Request, response: httpx.Response, content: bytes) -> httpx.Response:
+        headers = {key: value for key, value in response.headers.items() if key.lower() not in _DROPPED_HEADERS}
+        if 200 <= response.status_code < 300:
+            key = _fixture_key(request.method, request.url)
+            fixture: Dict[str, Any] = {
+                "method": request.method,
+                "path": request.url.path.strip("/"),
+                "query": dict(sorted(request.url.params.items())),
+                "status_code": response.status_code,
+                "headers": headers,
+            }
+            try:
+                fixture["body"] = json.loads(content)
+            except ValueError:
+                fixture["text"] = content.decode("utf-8", errors="replace")
+
+            path = os.path.join(self.directory, _fixture_name(key, request.url.path))
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(fixture, file, ensure_ascii=False, indent=2)
+
+        # the body was already decoded, it is returned without its content encoding
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+
+class _Fixture:
+    def __init__(self, status_code: int, headers: Dict[str, str], content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+
+class ReplayTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Answers requests like the Nexon Open API, without a network, for offline tests and load tests that do not
+    spend any quota.
+
+    Requests are answered, in order, with:
+    - a `429` during the last `rate_limit_bursts[1]` seconds of every `rate_limit_bursts[0]` seconds, or once more
+      than `rate_limit` requests per second were received
+    - a `500` for a random `error_rate` fraction of the requests
+    - the response recorded by a `RecordingTransport` in `directory` for the same method, path and query
+    - generated pages for the paginated endpoints: the rankings (`page`, 200 rows per page, `ranking_size` rows),
+      the starforce history (`count` and `cursor`, `starforce_size` events per day) and the FC Online match and
+      trade history (`offset` and `limit`, `history_size` entries). Rows are copied from the recordings of the same
+      endpoint when there are any.
+    - a `400` error otherwise
+
+    Every response is delayed by `latency` seconds, or by `latency(request)` seconds when it is a function:
+
+    ```py
+    transport = ReplayTransport("fixtures/", latency=lambda request: random.lognormvariate(-3, 0.5), error_rate=0.01)
+    client = NexonOpenAPIAsync(api_key="offline", http_client=httpx.AsyncClient(transport=transport))
+    ```
+
+    Pass a `seed` to make the errors reproducible. `status_counts()` tells how many responses of each status
+    were sent.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, PathLike[str], None] = None,
+        *,
+        latency: Union[float, Callable[[httpx.Request], float]] = 0.0,
+        error_rate: float = 0.0,
+        rate_limit: Optional[float] = None,
+        rate_limit_bursts: Optional[Tuple[float, float]] = None,
+        ranking_size: int = 1000,
+        starforce_size: int = 2500,
+        history_size: int = 250,
+        seed: Optional[int] = None,
+    ) -> None:
+        if not 0 <= error_rate <= 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self._latency = latency
+        self._error_rate = error_rate
+        self._rate_limit = TokenBucket(rate_limit) if rate_limit is not None else None
+        self._rate_limit_bursts = rate_limit_bursts
+        self._ranking_size = ranking_size
+        self._starforce_size = starforce_size
+        self._history_size = history_size
+        self._random = random.Random(seed)
+        self._started_at = time.monotonic()
+        self._fixtures: Dict[str, _Fixture] = {}
+        # rows of the recorded pages of a paginated endpoint, used to generate its other pages
+        self._rows: Dict[str, List[Any]] = {}
+        self._status_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            self.load(directory)
+
+    def load(self, directory: Union[str, PathLike[str]]) -> None:
+        """Add the fixtures recorded in `directory`."""
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith(".json"):
+                continue
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                fixture = json.load(file)
+
+            url = httpx.URL("/" + fixture["path"], params=fixture["query"])
+            if "body" in fixture:
+                content = json.dumps(fixture["body"], ensure_ascii=False).encode()
+                rows = _page_rows(fixture["path"], fixture["body"])
+                if rows:
+                    self._rows.setdefault(fixture["path"], []).extend(rows)
+            else:
+                content = fixture["text"].encode()
+            self._fixtures[_fixture_key(fixture["method"], url)] = _Fixture(
+                fixture["status_code"], fixture["headers"], content
+            )
+
+    def status_counts(self) -> Dict[int, int]:
+        with self._lock:
+            return dict(self._status_counts)
+
+    @override
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._respond(request)
+        delay = self._delay(request)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    @override
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = self._respond(request)
+        delay = self._delay(request)
+        if delay > 0:
+            await anyio.sleep(delay)
+        return response
+
+    def _delay(self, request: httpx.Request) -> float:
+        return self._latency(request) if callable(self._latency) else self._latency
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        status_code, headers, content = self._answer(request)
+        with self._lock:
+            self._status_counts[status_code] = self._status_counts.get(status_code, 0) + 1
+        # streamed like a response read from the network, so that `num_bytes_downloaded` is counted
+        headers = {**headers, "content-length": str(len(content))}
+        return httpx.Response(status_code, headers=headers, stream=httpx.ByteStream(content), request=request)
+
+    def _answer(self, request: httpx.Request) -> Tuple[int, Dict[str, str], bytes]:
+        if self._rate_limited():
+            return _error(429, "OPENAPI00007", "Rate limit exceeded")
+
+        with self._lock:
+            failed = self._error_rate > 0 and self._random.random() < self._error_rate
+        if failed:
+            return _error(500, "OPENAPI00001", "Internal server error")
+
+        fixture = self._fixtures.get(_fixture_key(request.method, request.url))
+        if fixture is not None:
+            return fixture.status_code, fixture.headers, fixture.content
+
+        path = request.url.path.strip("/")
+        params = request.url.params
+        if path.startswith("maplestory/v1/ranking/"):
+            body: Any = self._ranking_page(path, params)
+        elif path == "maplestory/v1/history/starforce":
+            body = self._starforce_page(params)
+        elif path in ("fconline/v1/user/match", "fconline/v1/user/trade"):
+            body = self._fc_online_history(path, params)
+        else:
+            return _error(400, "OPENAPI00004", f"No recorded response for {request.method} {request.url}")
+
+        return 200, {"content-type": "application/json"}, json.dumps(body, ensure_ascii=False).encode()
+
+    def _rate_limited(self) -> bool:
+        if self._rate_limit_bursts is not None:
+            every, duration = self._rate_limit_bursts
+            if (time.monotonic() - self._started_at) % every >= every - duration:
+                return True
+
+        if self._rate_limit is None:
+            return False
+        with self._lock:
+            # a request over the quota is rejected instead of queued
+            if self._rate_limit.available < 1:
+                return True
+            self._rate_limit.reserve()
+            return False
+
+    def _ranking_page(self, path: str, params: httpx.QueryParams) -> Dict[str, Any]:
+        page = int(params.get("page") or 1)
+        date = params.get("date") or "2024-01-01"
+        start = (page - 1) * _RANKING_PAGE_SIZE
+        end = min(start + _RANKING_PAGE_SIZE, self._ranking_size)
+        kind = path.rsplit("/", 1)[-1]
+        recorded = self._rows.get(path)
+
+        rows: List[Dict[str, Any]] = []
+        for index in range(start, end):
+            if recorded:
+                row = dict(recorded[index % len(recorded)])
+                row["ranking"] = index + 1
+            else:
+                row = _ranking_row(kind, date, index)
+            rows.append(row)
+        return {"ranking": rows}
+
+    def _starforce_page(self, params: httpx.QueryParams) -> Dict[str, Any]:
+        count = int(params.get("count") or 10)
+        cursor = params.get("cursor")
+        if cursor:
+            date, offset = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit(":", 1)
+            start = int(offset)
+        else:
+            date, start = params.get("date") or "2024-01-01", 0
+
+        end = min(start + count, self._starforce_size)
+        recorded = self._rows.get("maplestory/v1/history/starforce")
+        events: List[Dict[str, Any]] = []
+        for index in range(start, end):
+            if recorded:
+                event = dict(recorded[index % len(recorded)])
+                event["id"] = f"{date}-{index}"
+            else:
+                event = _starforce_event(date, index)
+            events.append(event)
+
+        next_cursor = None
+        if end < self._starforce_size:
+            next_cursor = base64.urlsafe_b64encode(f"{date}:{end}".encode()).decode()
+        return {"count": len(events), "next_cursor": next_cursor, "starforce_history": events}
+
+    def _fc_online_history(self, path: str, params: httpx.QueryParams) -> List[Any]:
+        offset = int(params.get("offset") or 0)
+        limit = min(int(params.get("limit") or _FC_ONLINE_DEFAULT_LIMIT), _FC_ONLINE_MAX_LIMIT)
+        ouid = params.get("ouid") or ""
+        recorded = self._rows.get(path)
+
+        entries: List[Any] = []
+        for index in range(offset, min(offset + limit, self._history_size)):
+            if path.endswith("match"):
+                entries.append(f"{ouid[:8]}{index:016x}")
+            elif recorded:
+                entry = dict(recorded[index % len(recorded)])
+                entry["saleSn"] = f"{ouid[:8]}{index:016x}"
+                entries.append(entry)
+            else:
+                entries.append(_trade(ouid, index))
+        return entries
+
+
+def _error(status_code: int, name: str, message: str) -> Tuple[int, Dict[str, str], bytes]:
+    content = json.dumps({"error": {"name": name, "message": message}}).encode()
+    return status_code, {"content-type": "application/json"}, content
+
+
+def _page_rows(path: str, body: Any) -> Optional[List[Any]]:
+    if path.startswith("maplestory/v1/ranking/") and is_dict(body):
+        return _rows_of(body.get("ranking"))
+    if path == "maplestory/v1/history/starforce" and is_dict(body):
+        return _rows_of(body.get("starforce_history"))
+    if path == "fconline/v1/user/trade":
+        return _rows_of(body)
+    return None
+
+
+def _rows_of(value: object) -> Optional[List[Any]]:
+    return value if is_list(value) else None
+
+
+def _ranking_row(kind: str, date: str, index: int) -> Dict[str, Any]:
+    row: Dict[str, Any] = {"date": date, "ranking": index + 1, "world_name": "스카니아"}
+    if kind == "guild":
+        row.update(
+            guild_name=f"guild{index}",
+            guild_level=30 - index % 30,
+            guild_master_name=f"master{index}",
+            guild_mark="",
+            guild_point=1_000_000 - index,
+        )
+        return row
+
+    row.update(character_name=f"character{index}", class_name="전사", sub_class_name="히어로")
+    if kind == "union":
+        row.update(union_level=9000 - index, union_power=100_000_000 - index)
+    elif kind == "achievement":
+        row.update(trophy_grade="다이아", trophy_score=100_000 - index)
+    else:
+        row.update(character_level=300 - index % 100)
+    if kind == "overall":
+        row.update(character_exp=1_000_000_000 - index, character_popularity=index % 1000, character_guildname="")
+    elif kind == "dojang":
+        row.update(dojang_floor=100 - index % 100, dojang_time_record=600 + index)
+    elif kind == "theseed":
+        row.update(theseed_floor=50 - index % 50, theseed_time_record=600 + index)
+    return row
+
+
+def _starforce_event(date: str, index: int) -> Dict[str, Any]:
+    before = index % 22
+    return {
+        "id": f"{date}-{index}",
+        "item_upgrade_result": "성공",
+        "before_starforce_count": before,
+        "after_starforce_count": before + 1,
+        "starcatch_result": "성공",
+        "superior_item_flag": "슈페리얼 장비 아님",
+        "destory_defence": "파괴 방지 미적용",
+        "chance_time": "찬스타임 미적용",
+        "event_field_flag": "이벤트 필드 아님",
+        "upgrade_item": "",
+        "protect_shield": "미사용",
+        "bonus_stat_upgrade": "",
+        "character_name": f"character{index % 100}",
+        "world_name": "스카니아",
+        "target_item": "아케인셰이드 투핸드소드",
+        "date_create": f"{date}T{index // 3600 % 24:02}:{index // 60 % 60:02}:{index % 60:02}+09:00",
+        "starforce_event_list": [],
+    }
+
+
+def _trade(ouid: str, index: int) -> Dict[str, Any]:
+    return {
+        "tradeDate": f"2024-01-01T{index // 3600 % 24:02}:{index // 60 % 60:02}:{index % 60:02}",
+        "saleSn": f"{ouid[:8]}{index:016x}",
+        "spid": 101000001 + index,
+        "grade": 1 + index % 10,
+        "value": 1_000_000 * (1 + index % 100),
+    }
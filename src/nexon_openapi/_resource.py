@@ -1,16 +1,32 @@
 from __future__ import annotations
 
 import time
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List, Type, Generic, TypeVar, Callable, Coroutine, overload
+from typing_extensions import Literal, ParamSpec, Concatenate
+
+import anyio
+
+from ._types import ResponseModeT
 
 if TYPE_CHECKING:
     from ._client import NexonOpenAPI, NexonOpenAPIAsync
+    from ._models import BaseModel
+    from ._response import RawResponse
+
+_P = ParamSpec("_P")
+_ModelT = TypeVar("_ModelT")
+_JSONT = TypeVar("_JSONT")
+_BaseModelT = TypeVar("_BaseModelT", bound="BaseModel")
+_ResourceT = TypeVar("_ResourceT")
+_SyncResourceT = TypeVar("_SyncResourceT", bound="SyncAPIResource[Any]")
+_AsyncResourceT = TypeVar("_AsyncResourceT", bound="AsyncAPIResource[Any]")
 
 
-class SyncAPIResource:
-    _client: NexonOpenAPI
+class SyncAPIResource(Generic[ResponseModeT]):
+    _client: NexonOpenAPI[Any]
 
-    def __init__(self, client: NexonOpenAPI) -> None:
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         self._client = client
         self._get = client.get
         self._post = client.post
@@ -18,14 +34,21 @@ class SyncAPIResource:
         self._put = client.put
         self._delete = client.delete
 
+    def _model_resource(self: _SyncResourceT) -> _SyncResourceT:
+        """Return this resource bound to a client that parses responses into models, whatever the client's
+        `response_mode` is. Used by methods that read the responses they fetch."""
+        if self._client.response_mode == "model":
+            return self
+        return type(self)(self._client.with_options(response_mode="model"))
+
     def _sleep(self, seconds: float) -> None:
         time.sleep(seconds)
 
 
-class AsyncAPIResource:
-    _client: NexonOpenAPIAsync
+class AsyncAPIResource(Generic[ResponseModeT]):
+    _client: NexonOpenAPIAsync[Any]
 
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         self._client = client
         self._get = client.get
         self._post = client.post
@@ -33,5 +56,147 @@ class AsyncAPIResource:
         self._put = client.put
         self._delete = client.delete
 
-    def _sleep(self, seconds: float) -> None:
-        time.sleep(seconds)
+    def _model_resource(self: _AsyncResourceT) -> _AsyncResourceT:
+        """Return this resource bound to a client that parses responses into models, whatever the client's
+        `response_mode` is. Used by methods that read the responses they fetch."""
+        if self._client.response_mode == "model":
+            return self
+        return type(self)(self._client.with_options(response_mode="model"))
+
+    async def _sleep(self, seconds: float) -> None:
+        await anyio.sleep(seconds)
+
+
+if TYPE_CHECKING:
+
+    class _TypedByResponseMode(Generic[_P, _ModelT, _JSONT]):
+        def __init__(self, method: Callable[Concatenate[Any, _P], Any]) -> None:
+            ...
+
+        @overload
+        def __get__(self, instance: None, owner: Type[Any]) -> _TypedByResponseMode[_P, _ModelT, _JSONT]:
+            ...
+
+        @overload
+        def __get__(self, instance: SyncAPIResource[Literal["dict"]], owner: Type[Any]) -> Callable[_P, _JSONT]:
+            ...
+
+        @overload
+        def __get__(self, instance: SyncAPIResource[Literal["raw"]], owner: Type[Any]) -> Callable[_P, RawResponse]:
+            ...
+
+        @overload
+        def __get__(self, instance: object, owner: Type[Any]) -> Callable[_P, _ModelT]:
+            ...
+
+        def __get__(self, instance: object, owner: Type[Any]) -> Any:
+            ...
+
+    class _AsyncTypedByResponseMode(Generic[_P, _ModelT, _JSONT]):
+        def __init__(self, method: Callable[Concatenate[Any, _P], Any]) -> None:
+            ...
+
+        @overload
+        def __get__(self, instance: None, owner: Type[Any]) -> _AsyncTypedByResponseMode[_P, _ModelT, _JSONT]:
+            ...
+
+        @overload
+        def __get__(
+            self, instance: AsyncAPIResource[Literal["dict"]], owner: Type[Any]
+        ) -> Callable[_P, Coroutine[Any, Any, _JSONT]]:
+            ...
+
+        @overload
+        def __get__(
+            self, instance: AsyncAPIResource[Literal["raw"]], owner: Type[Any]
+        ) -> Callable[_P, Coroutine[Any, Any, RawResponse]]:
+            ...
+
+        @overload
+        def __get__(self, instance: object, owner: Type[Any]) -> Callable[_P, Coroutine[Any, Any, _ModelT]]:
+            ...
+
+        def __get__(self, instance: object, owner: Type[Any]) -> Any:
+            ...
+
+    @overload
+    def typed_by_response_mode(
+        method: Callable[Concatenate[Any, _P], List[_ModelT]]
+    ) -> _TypedByResponseMode[_P, List[_ModelT], List[Any]]:
+        ...
+
+    @overload
+    def typed_by_response_mode(
+        method: Callable[Concatenate[Any, _P], _BaseModelT]
+    ) -> _TypedByResponseMode[_P, _BaseModelT, Dict[str, Any]]:
+        ...
+
+    def typed_by_response_mode(method: Callable[Concatenate[Any, _P], Any]) -> Any:
+        """Types a resource method by the response mode of its resource: the annotated model in the `"model"`
+        mode, the decoded JSON body (`Dict[str, Any]`, or `List[Any]` for a list of models) in the `"dict"` mode
+        and `RawResponse` in the `"raw"` mode.
+
+        Only for methods that return the response of `_get` as it is. A no-op at runtime.
+        """
+        ...
+
+    @overload
+    def async_typed_by_response_mode(
+        method: Callable[Concatenate[Any, _P], Coroutine[Any, Any, List[_ModelT]]]
+    ) -> _AsyncTypedByResponseMode[_P, List[_ModelT], List[Any]]:
+        ...
+
+    @overload
+    def async_typed_by_response_mode(
+        method: Callable[Concatenate[Any, _P], Coroutine[Any, Any, _BaseModelT]]
+    ) -> _AsyncTypedByResponseMode[_P, _BaseModelT, Dict[str, Any]]:
+        ...
+
+    def async_typed_by_response_mode(method: Callable[Concatenate[Any, _P], Any]) -> Any:
+        """`typed_by_response_mode` for the methods of the async resources."""
+        ...
+
+else:
+
+    def typed_by_response_mode(method):
+        return method
+
+    async_typed_by_response_mode = typed_by_response_mode
+
+
+class lazy_resource(Generic[_ResourceT]):
+    """Declares a resource of a client that is imported and constructed on first access.
+
+    ```py
+    class NexonOpenAPI(SyncAPIClient, Generic[ResponseModeT]):
+        maplestory: lazy_resource[MapleStory[ResponseModeT]] = lazy_resource("._maplestory", "MapleStory")
+    ```
+
+    `module` is relative to the `resources` package. The resource is stored on the client instance,
+    so every later access is a plain attribute lookup.
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._attr = name
+
+    def __set_name__(self, owner: Type[Any], attr: str) -> None:
+        self._attr = attr
+
+    @overload
+    def __get__(self, instance: None, owner: Type[Any]) -> lazy_resource[_ResourceT]:
+        ...
+
+    @overload
+    def __get__(self, instance: object, owner: Type[Any]) -> _ResourceT:
+        ...
+
+    def __get__(self, instance: object, owner: Type[Any]) -> Any:
+        if instance is None:
+            return self
+
+        module = importlib.import_module(self._module, package=f"{__package__}.resources")
+        resource = getattr(module, self._name)(instance)
+        instance.__dict__[self._attr] = resource
+        return resource
@@ -3,16 +3,17 @@ from __future__ import annotations
 import inspect
 import logging
 import datetime
-from typing import TYPE_CHECKING, Union, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Union, Generic, TypeVar, cast
 from typing_extensions import ParamSpec, override, get_origin
 
 import httpx
 import pydantic
 
-from ._types import NoneType, UnknownResponse, BinaryResponseContent, ResponseT, ModelBuilderProtocol
+from ._types import NoneType, UnknownResponse, BinaryResponseContent, ResponseT, ModelBuilderProtocol, ResponseMode
 from .utils import is_given
 from ._models import BaseModel, is_basemodel, validate_type, construct_type
 from ._exceptions import APIResponseValidationError
+from ._json import JSONDecoder, stdlib_json_loads
 
 if TYPE_CHECKING:
     from ._models import FinalRequestOptions
@@ -24,11 +25,34 @@ R = TypeVar("R")
 log: logging.Logger = logging.getLogger(__name__)
 
 
+class RawResponse:
+    """The undecoded body of a response, returned instead of a model in the `"raw"` response mode."""
+
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+
+    def __init__(self, response: httpx.Response, json_decoder: JSONDecoder = stdlib_json_loads) -> None:
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.content = response.content
+        self._json_decoder = json_decoder
+
+    def json(self) -> Any:
+        return self._json_decoder(self.content)
+
+    @override
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} [{self.status_code}] {len(self.content)} bytes>"
+
+
 class APIResponse(Generic[R]):
     _cast_to: type[R]
     _parsed: Union[R, None]
     _strict_response_validation: bool
     _options: FinalRequestOptions
+    _response_mode: ResponseMode
+    _json_decoder: JSONDecoder
 
     http_response: httpx.Response
 
@@ -38,17 +62,30 @@ class APIResponse(Generic[R]):
         cast_to: type[R],
         strict_response_validation: bool,
         options: FinalRequestOptions,
+        response_mode: ResponseMode = "model",
+        json_decoder: JSONDecoder = stdlib_json_loads,
     ) -> None:
         self._cast_to = cast_to
         self._parsed = None
         self._strict_response_validation = strict_response_validation
         self._options = options
+        self._response_mode = response_mode
+        self._json_decoder = json_decoder
         self.http_response = raw
 
     def parse(self) -> R:
         if self._parsed is not None:
             return self._parsed
 
+        # the other modes skip building models, `R` is only accurate for the "model" mode
+        if self._response_mode == "raw":
+            self._parsed = cast(R, RawResponse(self.http_response, self._json_decoder))
+            return self._parsed
+
+        if self._response_mode == "dict":
+            self._parsed = cast(R, self._json_decoder(self.http_response.content))
+            return self._parsed
+
         parsed = self._parse()
         if is_given(self._options.post_parser):
             parsed = self._options.post_parser(parsed)
@@ -145,7 +182,7 @@ class APIResponse(Generic[R]):
         if content_type != "application/json":
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._json_decoder(response.content)
                 except Exception as exc:
                     log.debug(
                         "Could not read JSON from response data due to %s - %s",
@@ -171,7 +208,7 @@ class APIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        data = self._json_decoder(response.content)
 
         return self._process_response_data(
             data=data,
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional, Generator
+from contextvars import ContextVar
+from contextlib import contextmanager
+from typing_extensions import override
+
+import httpx
+
+from ._hooks import Hooks
+from ._exceptions import APIError, NexonError
+from .__version__ import __version__
+
+if TYPE_CHECKING:
+    from ._models import FinalRequestOptions
+
+
+class _Call:
+    """The span of a call and the child spans that are still open."""
+
+    def __init__(self, span: Any) -> None:
+        self.span = span
+        self.attempts: Dict[httpx.Request, Any] = {}
+        self.sleep: Optional[Any] = None
+        self.retries = 0
+        self.ended = False
+
+    def end_sleep(self) -> None:
+        if self.sleep is not None:
+            self.sleep.end()
+            self.sleep = None
+
+    def end(self) -> None:
+        self.ended = True
+        self.end_sleep()
+        # attempts that never completed, e.g. the slower request of a hedged call
+        for attempt in self.attempts.values():
+            attempt.set_attribute("nexon.cancelled", True)
+            attempt.end()
+        self.attempts.clear()
+        self.span.set_attribute("nexon.retries", self.retries)
+
+
+_call: ContextVar[Optional[_Call]] = ContextVar("nexon_openapi_traced_call", default=None)
+
+
+class OpenTelemetryTracing(Hooks):
+    """Traces every call of a client with OpenTelemetry (`pip install nexon_openapi[opentelemetry]`).
+
+    A `CLIENT` span named after the method and route of the call, e.g. `GET maplestory/v1/character/basic`, covers
+    the whole call. It has a child span for every attempt sent, for every wait before a retry and for parsing the
+    response body, so that the latency of a call can be told apart between the network, retries and decoding.
+    Routes carry no ids, `ocid` and the other parameters are only sent in the query, which is not recorded.
+
+    ```py
+    client = NexonOpenAPI(tracing=OpenTelemetryTracing())
+    ```
+
+    Spans are created with the global tracer provider unless a `tracer_provider` is given.
+    """
+
+    def __init__(self, tracer_provider: Any = None) -> None:
+        # optional dependency
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = trace.get_tracer("nexon_openapi", __version__, tracer_provider=tracer_provider)
+
+    @contextmanager
+    def span(self, options: FinalRequestOptions, server_address: str) -> Generator[None, None, None]:
+        """Trace a call to `options.url` until the context manager exits."""
+        method = options.method.upper()
+        attributes = {"http.request.method": method, "url.template": options.url, "server.address": server_address}
+        with self._tracer.start_as_current_span(
+            f"{method} {options.url}", kind=self._trace.SpanKind.CLIENT, attributes=attributes
+        ) as span:
+            call = _Call(span)
+            token = _call.set(call)
+            try:
+                yield
+            finally:
+                _call.reset(token)
+                call.end()
+
+    @override
+    def on_request(self, path: str, request: httpx.Request, *, attempt: int) -> None:
+        call = _traced_call()
+        if call is None:
+            return
+
+        call.end_sleep()
+        attributes = {"nexon.attempt": attempt}
+        if attempt > 1:
+            attributes["http.request.resend_count"] = attempt - 1
+        call.attempts[request] = self._tracer.start_span("attempt", attributes=attributes)
+
+    @override
+    def on_response(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        call = _traced_call()
+        if call is None:
+            return
+
+        size = len(response.content)
+        call.span.set_attribute("http.response.status_code", response.status_code)
+        call.span.set_attribute("http.response.body.size", size)
+
+        attempt = call.attempts.pop(response.request, None)
+        if attempt is not None:
+            attempt.set_attribute("http.response.status_code", response.status_code)
+            attempt.set_attribute("http.response.body.size", size)
+            if response.status_code >= 400:
+                attempt.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+                attempt.set_attribute("error.type", str(response.status_code))
+            attempt.end()
+
+    @override
+    def on_retry(
+        self,
+        path: str,
+        request: httpx.Request,
+        *,
+        attempt: int,
+        delay: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        call = _traced_call()
+        if call is None:
+            return
+
+        # without a response the attempt failed to connect or timed out
+        self._fail_attempt(call, request, "no response")
+        call.retries += 1
+        call.end_sleep()
+        call.sleep = self._tracer.start_span("retry sleep", attributes={"nexon.retry.delay": delay})
+
+    @override
+    def on_error(self, path: str, error: NexonError) -> None:
+        call = _traced_call()
+        if call is not None and isinstance(error, APIError):
+            self._fail_attempt(call, error.request, type(error).__name__)
+
+    @override
+    def on_parse(self, path: str, response: httpx.Response, *, elapsed: float) -> None:
+        call = _traced_call()
+        if call is None:
+            return
+
+        # the span is recorded once parsing is done, with the time it started at
+        end = time.time_ns()
+        span = self._tracer.start_span(
+            "parse",
+            start_time=end - int(elapsed * 1_000_000_000),
+            attributes={"http.response.body.size": len(response.content)},
+        )
+        span.end(end_time=end)
+
+    @override
+    def on_cache_hit(self, path: str, *, source: str) -> None:
+        call = _traced_call()
+        if call is not None:
+            call.span.set_attribute("nexon.cache_hit", source)
+
+    def _fail_attempt(self, call: _Call, request: httpx.Request, error_type: str) -> None:
+        attempt = call.attempts.pop(request, None)
+        if attempt is not None:
+            attempt.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+            attempt.set_attribute("error.type", error_type)
+            attempt.end()
+
+
+def _traced_call() -> Optional[_Call]:
+    call = _call.get()
+    # a coalesced request can outlive the call that started it
+    if call is None or call.ended:
+        return None
+    return call
@@ -17,7 +17,7 @@ from typing import (
     TypeVar,
     Union,
 )
-from typing_extensions import Literal, TypedDict, override, runtime_checkable, Protocol
+from typing_extensions import Literal, TypedDict, override, runtime_checkable, Protocol, TypeVar as TypeVarWithDefault
 
 from httpx import Response, Timeout
 import pydantic
@@ -107,6 +107,12 @@ class NotGiven:
 NotGivenOr = Union[_T, NotGiven]
 NOT_GIVEN = NotGiven()
 
+# "model" parses responses into the models of the resources, "dict" only decodes the JSON body
+# and "raw" returns the undecoded body as a `RawResponse`
+ResponseMode = Literal["model", "dict", "raw"]
+# the response mode of a client and its resources, `NexonOpenAPI(response_mode="dict")` is a `NexonOpenAPI[Literal["dict"]]`
+ResponseModeT = TypeVarWithDefault("ResponseModeT", bound=ResponseMode, default=Literal["model"], covariant=True)
+
 ResponseT = TypeVar(
     "ResponseT",
     bound="Union[str, None, BaseModel, List[Any], Dict[str, Any], Response, UnknownResponse]",
@@ -120,6 +126,8 @@ class RequestOptions(TypedDict, total=False):
     params: Query
     extra_json: AnyMapping
     idempotency_key: str
+    response_mode: ResponseMode
+    budget: Optional[float]
 
 
 PostParser = Callable[[Any], Any]
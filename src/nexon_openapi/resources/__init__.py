@@ -1,12 +1,60 @@
-from ._maplestory import MapleStory as MapleStory, MapleStoryAsync as MapleStoryAsync
-from ._maplestorym import MapleStoryM as MapleStoryM, MapleStoryMAsync as MapleStoryMAsync
-from ._wars_of_prasia import WarsOfPrasia as WarsOfPrasia, WarsOfPrasiaAsync as WarsOfPrasiaAsync
-from ._mabinogi_heroes import MabinogiHeroes as MabinogiHeroes, MabinogiHeroesAsync as MabinogiHeroesAsync
-from ._crazy_arcade import CrazyArcade as CrazyArcade, CrazyArcadeAsync as CrazyArcadeAsync
-from ._baram import Baram as Baram, BaramAsync as BaramAsync
-from ._baramy import BaramY as BaramY, BaramYAsync as BaramYAsync
-from ._kartrush import KartRiderRushPlus as KartRiderRushPlus, KartRiderRushPlusAsync as KartRiderRushPlusAsync
-from ._hit2 import Hit2 as Hit2, Hit2Async as Hit2Async
-from ._v4 import V4 as V4, V4Async as V4Async
-from ._fc_online import FCOnline as FCOnline, FCOnlineAsync as FCOnlineAsync
-from ._the_first_descendant import TFD as TFD, TFDAsync as TFDAsync
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from ._maplestory import MapleStory as MapleStory, MapleStoryAsync as MapleStoryAsync
+    from ._maplestorym import MapleStoryM as MapleStoryM, MapleStoryMAsync as MapleStoryMAsync
+    from ._wars_of_prasia import WarsOfPrasia as WarsOfPrasia, WarsOfPrasiaAsync as WarsOfPrasiaAsync
+    from ._mabinogi_heroes import MabinogiHeroes as MabinogiHeroes, MabinogiHeroesAsync as MabinogiHeroesAsync
+    from ._crazy_arcade import CrazyArcade as CrazyArcade, CrazyArcadeAsync as CrazyArcadeAsync
+    from ._baram import Baram as Baram, BaramAsync as BaramAsync
+    from ._baramy import BaramY as BaramY, BaramYAsync as BaramYAsync
+    from ._kartrush import KartRiderRushPlus as KartRiderRushPlus, KartRiderRushPlusAsync as KartRiderRushPlusAsync
+    from ._hit2 import Hit2 as Hit2, Hit2Async as Hit2Async
+    from ._v4 import V4 as V4, V4Async as V4Async
+    from ._fc_online import FCOnline as FCOnline, FCOnlineAsync as FCOnlineAsync
+    from ._the_first_descendant import TFD as TFD, TFDAsync as TFDAsync
+
+# the resource modules define hundreds of models, they are only imported once one of their names is used
+_LAZY_IMPORTS: Dict[str, str] = {
+    "MapleStory": "._maplestory",
+    "MapleStoryAsync": "._maplestory",
+    "MapleStoryM": "._maplestorym",
+    "MapleStoryMAsync": "._maplestorym",
+    "WarsOfPrasia": "._wars_of_prasia",
+    "WarsOfPrasiaAsync": "._wars_of_prasia",
+    "MabinogiHeroes": "._mabinogi_heroes",
+    "MabinogiHeroesAsync": "._mabinogi_heroes",
+    "CrazyArcade": "._crazy_arcade",
+    "CrazyArcadeAsync": "._crazy_arcade",
+    "Baram": "._baram",
+    "BaramAsync": "._baram",
+    "BaramY": "._baramy",
+    "BaramYAsync": "._baramy",
+    "KartRiderRushPlus": "._kartrush",
+    "KartRiderRushPlusAsync": "._kartrush",
+    "Hit2": "._hit2",
+    "Hit2Async": "._hit2",
+    "V4": "._v4",
+    "V4Async": "._v4",
+    "FCOnline": "._fc_online",
+    "FCOnlineAsync": "._fc_online",
+    "TFD": "._the_first_descendant",
+    "TFDAsync": "._the_first_descendant",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_IMPORTS})
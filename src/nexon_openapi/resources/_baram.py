@@ -1,24 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ocid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class Baram(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class Baram(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -30,6 +30,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "baram/v1/id",
@@ -42,12 +43,15 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -56,6 +60,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterBasic:
         return self._get(
             path="baram/v1/character/basic",
@@ -65,10 +70,12 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterBasic,
         )
 
+    @typed_by_response_mode
     def get_character_title(
         self,
         *,
@@ -77,6 +84,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterTitle:
         return self._get(
             path="baram/v1/character/title",
@@ -86,10 +94,12 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterTitle,
         )
 
+    @typed_by_response_mode
     def get_character_title_equipment(
         self,
         *,
@@ -98,6 +108,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterTitleEquipment:
         return self._get(
             path="baram/v1/character/title-equipment",
@@ -107,10 +118,12 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterTitleEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_item_equipment(
         self,
         *,
@@ -119,6 +132,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterItemEquipment:
         return self._get(
             path="baram/v1/character/item-equipment",
@@ -128,10 +142,12 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterItemEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_stat(
         self,
         *,
@@ -140,6 +156,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterStat:
         return self._get(
             path="baram/v1/character/stat",
@@ -149,10 +166,12 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterStat,
         )
 
+    @typed_by_response_mode
     def get_character_guild(
         self,
         *,
@@ -161,6 +180,7 @@ class Baram(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterGuild:
         return self._get(
             path="baram/v1/character/guild",
@@ -170,13 +190,14 @@ class Baram(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterGuild,
         )
 
 
-class BaramAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class BaramAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -188,6 +209,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "baram/v1/id",
@@ -200,12 +222,15 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -214,6 +239,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterBasic:
         return await self._get(
             path="baram/v1/character/basic",
@@ -223,10 +249,12 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title(
         self,
         *,
@@ -235,6 +263,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterTitle:
         return await self._get(
             path="baram/v1/character/title",
@@ -244,10 +273,12 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterTitle,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title_equipment(
         self,
         *,
@@ -256,6 +287,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterTitleEquipment:
         return await self._get(
             path="baram/v1/character/title-equipment",
@@ -265,10 +297,12 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterTitleEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_item_equipment(
         self,
         *,
@@ -277,6 +311,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterItemEquipment:
         return await self._get(
             path="baram/v1/character/item-equipment",
@@ -286,10 +321,12 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterItemEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_stat(
         self,
         *,
@@ -298,6 +335,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterStat:
         return await self._get(
             path="baram/v1/character/stat",
@@ -307,10 +345,12 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_guild(
         self,
         *,
@@ -319,6 +359,7 @@ class BaramAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramCharacterGuild:
         return await self._get(
             path="baram/v1/character/guild",
@@ -328,6 +369,7 @@ class BaramAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramCharacterGuild,
         )
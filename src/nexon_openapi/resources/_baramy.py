@@ -1,24 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ocid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class BaramY(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class BaramY(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -30,6 +30,7 @@ class BaramY(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "baramy/v1/id",
@@ -42,12 +43,15 @@ class BaramY(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -56,6 +60,7 @@ class BaramY(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterBasic:
         return self._get(
             path="baramy/v1/character/basic",
@@ -65,10 +70,12 @@ class BaramY(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterBasic,
         )
 
+    @typed_by_response_mode
     def get_character_title(
         self,
         *,
@@ -77,6 +84,7 @@ class BaramY(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterTitle:
         return self._get(
             path="baramy/v1/character/title",
@@ -86,10 +94,12 @@ class BaramY(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterTitle,
         )
 
+    @typed_by_response_mode
     def get_character_title_equipment(
         self,
         *,
@@ -98,6 +108,7 @@ class BaramY(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterTitleEquipment:
         return self._get(
             path="baramy/v1/character/title-equipment",
@@ -107,13 +118,14 @@ class BaramY(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterTitleEquipment,
         )
 
 
-class BaramYAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class BaramYAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -125,6 +137,7 @@ class BaramYAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "baramy/v1/id",
@@ -137,12 +150,15 @@ class BaramYAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -151,6 +167,7 @@ class BaramYAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterBasic:
         return await self._get(
             path="baramy/v1/character/basic",
@@ -160,10 +177,12 @@ class BaramYAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title(
         self,
         *,
@@ -172,6 +191,7 @@ class BaramYAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterTitle:
         return await self._get(
             path="baramy/v1/character/title",
@@ -181,10 +201,12 @@ class BaramYAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterTitle,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title_equipment(
         self,
         *,
@@ -193,6 +215,7 @@ class BaramYAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> BaramYCharacterTitleEquipment:
         return await self._get(
             path="baramy/v1/character/title-equipment",
@@ -202,6 +225,7 @@ class BaramYAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=BaramYCharacterTitleEquipment,
         )
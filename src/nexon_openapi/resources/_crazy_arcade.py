@@ -1,23 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ouid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class CrazyArcade(SyncAPIResource):
+class CrazyArcade(SyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/ca/?id=12&shallow=true
 
@@ -26,7 +26,7 @@ class CrazyArcade(SyncAPIResource):
     - 게임 콘텐츠 변경으로 ouid가 변경될 수 있습니다. ouid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
     """
 
-    def __init__(self, client: NexonOpenAPI) -> None:
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ouid(
@@ -38,6 +38,7 @@ class CrazyArcade(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "ca/v1/id",
@@ -50,12 +51,15 @@ class CrazyArcade(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         )
 
         return response.ouid
 
+    @typed_by_response_mode
     def get_user_basic(
         self,
         *,
@@ -64,6 +68,7 @@ class CrazyArcade(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserBasic:
         return self._get(
             path="ca/v1/user/basic",
@@ -73,10 +78,12 @@ class CrazyArcade(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserBasic,
         )
 
+    @typed_by_response_mode
     def get_user_title(
         self,
         *,
@@ -85,6 +92,7 @@ class CrazyArcade(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserTitle:
         return self._get(
             path="ca/v1/user/title",
@@ -94,10 +102,12 @@ class CrazyArcade(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserTitle,
         )
 
+    @typed_by_response_mode
     def get_user_title_equipment(
         self,
         *,
@@ -106,6 +116,7 @@ class CrazyArcade(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserTitleEquipment:
         return self._get(
             path="ca/v1/user/title-equipment",
@@ -115,12 +126,13 @@ class CrazyArcade(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserTitleEquipment,
         )
 
 
-class CrazyArcadeAsync(AsyncAPIResource):
+class CrazyArcadeAsync(AsyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/ca/?id=12&shallow=true
 
@@ -129,7 +141,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
     - 게임 콘텐츠 변경으로 ouid가 변경될 수 있습니다. ouid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
     """
 
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ouid(
@@ -141,6 +153,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "ca/v1/id",
@@ -153,12 +166,15 @@ class CrazyArcadeAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         )
 
         return response.ouid
 
+    @async_typed_by_response_mode
     async def get_user_basic(
         self,
         *,
@@ -167,6 +183,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserBasic:
         return await self._get(
             path="ca/v1/user/basic",
@@ -176,10 +193,12 @@ class CrazyArcadeAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_user_title(
         self,
         *,
@@ -188,6 +207,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserTitle:
         return await self._get(
             path="ca/v1/user/title",
@@ -197,10 +217,12 @@ class CrazyArcadeAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserTitle,
         )
 
+    @async_typed_by_response_mode
     async def get_user_title_equipment(
         self,
         *,
@@ -209,6 +231,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> CrazyArcadeUserTitleEquipment:
         return await self._get(
             path="ca/v1/user/title-equipment",
@@ -218,6 +241,7 @@ class CrazyArcadeAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=CrazyArcadeUserTitleEquipment,
         )
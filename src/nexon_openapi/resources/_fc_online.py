@@ -1,23 +1,23 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 import httpx
 
 from ._types import Ouid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class FCOnline(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class FCOnline(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ouid(
@@ -28,6 +28,7 @@ class FCOnline(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         return self._get(
             "fconline/v1/id",
@@ -40,10 +41,13 @@ class FCOnline(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         ).ouid
 
+    @typed_by_response_mode
     def get_user_basic(
         self,
         *,
@@ -52,6 +56,7 @@ class FCOnline(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserBasic:
         return self._get(
             path="fconline/v1/user/basic",
@@ -61,10 +66,12 @@ class FCOnline(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=FCOnlineUserBasic,
         )
 
+    @typed_by_response_mode
     def get_user_max_division(
         self,
         *,
@@ -73,6 +80,7 @@ class FCOnline(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[FCOnlineUserMaxDivision]:
         return self._get(
             path="fconline/v1/user/maxdivision",
@@ -82,6 +90,7 @@ class FCOnline(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[FCOnlineUserMaxDivision],
         )
@@ -97,6 +106,7 @@ class FCOnline(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserMatchHistory:
         matches = self._get(
             path="fconline/v1/user/match",
@@ -106,6 +116,8 @@ class FCOnline(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=List[str],
         )
@@ -123,6 +135,7 @@ class FCOnline(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserTradeHistory:
         """
         거래 종류{tradetype}로 유저의 이적시장 거래 종류별 기록을 조회합니다. (본인 거래 기록만 조회 가능)
@@ -139,14 +152,16 @@ class FCOnline(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=List[FCOnlineUserTradeHistory.Trade],
         )
 
         return FCOnlineUserTradeHistory(trades=trades)
 
-class FCOnlineAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class FCOnlineAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ouid(
@@ -157,6 +172,7 @@ class FCOnlineAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "fconline/v1/id",
@@ -169,12 +185,15 @@ class FCOnlineAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         )
 
         return response.ouid
 
+    @async_typed_by_response_mode
     async def get_user_basic(
         self,
         *,
@@ -183,6 +202,7 @@ class FCOnlineAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserBasic:
         return await self._get(
             path="fconline/v1/user/basic",
@@ -192,10 +212,12 @@ class FCOnlineAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=FCOnlineUserBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_user_max_division(
         self,
         *,
@@ -204,6 +226,7 @@ class FCOnlineAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[FCOnlineUserMaxDivision]:
         return await self._get(
             path="fconline/v1/user/maxdivision",
@@ -213,6 +236,7 @@ class FCOnlineAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[FCOnlineUserMaxDivision],
         )
@@ -228,6 +252,7 @@ class FCOnlineAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserMatchHistory:
         matches = await self._get(
             path="fconline/v1/user/match",
@@ -237,6 +262,8 @@ class FCOnlineAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=List[str],
         )
@@ -247,13 +274,14 @@ class FCOnlineAsync(AsyncAPIResource):
         self,
         *,
         ouid: str,
-        tradetype: int,
+        tradetype: str,
         offset: Optional[int] = None,
         limit: Optional[int] = None,
         extra_headers: Optional[Headers] = None,
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> FCOnlineUserTradeHistory:
         """
         거래 종류{tradetype}로 유저의 이적시장 거래 종류별 기록을 조회합니다. (본인 거래 기록만 조회 가능)
@@ -270,6 +298,8 @@ class FCOnlineAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=List[FCOnlineUserTradeHistory.Trade],
         )
@@ -1,24 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ocid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class Hit2(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class Hit2(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -29,6 +29,7 @@ class Hit2(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "hit2/v1/id",
@@ -41,12 +42,15 @@ class Hit2(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -55,6 +59,7 @@ class Hit2(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> Hit2CharacterBasic:
         return self._get(
             path="hit2/v1/character/basic",
@@ -64,13 +69,14 @@ class Hit2(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=Hit2CharacterBasic,
         )
 
 
-class Hit2Async(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class Hit2Async(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -81,6 +87,7 @@ class Hit2Async(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "hit2/v1/id",
@@ -93,12 +100,15 @@ class Hit2Async(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -107,6 +117,7 @@ class Hit2Async(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> Hit2CharacterBasic:
         return await self._get(
             path="hit2/v1/character/basic",
@@ -116,6 +127,7 @@ class Hit2Async(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=Hit2CharacterBasic,
         )
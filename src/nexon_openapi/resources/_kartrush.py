@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class KartRiderRushPlus(SyncAPIResource):
+class KartRiderRushPlus(SyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/kartrush/?id=11&shallow=true
 
@@ -25,9 +25,10 @@ class KartRiderRushPlus(SyncAPIResource):
     - 게임 콘텐츠 변경으로 ouid가 변경될 수 있습니다. ouid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
     """
 
-    def __init__(self, client: NexonOpenAPI) -> None:
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
+    @typed_by_response_mode
     def get_ouid(
         self,
         *,
@@ -36,6 +37,7 @@ class KartRiderRushPlus(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> OuidInfo:
         """계정 식별자(ouid)를 조회합니다.
 
@@ -53,10 +55,12 @@ class KartRiderRushPlus(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=OuidInfo,
         )
 
+    @typed_by_response_mode
     def get_user_basic(
         self,
         *,
@@ -65,6 +69,7 @@ class KartRiderRushPlus(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> KartRiderRushPlushUserBasic:
         return self._get(
             path="kartrush/v1/user/basic",
@@ -74,10 +79,12 @@ class KartRiderRushPlus(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=KartRiderRushPlushUserBasic,
         )
 
+    @typed_by_response_mode
     def get_user_title_equipment(
         self,
         *,
@@ -86,6 +93,7 @@ class KartRiderRushPlus(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> KartRiderRushPlushUserTitleEquipment:
         return self._get(
             path="kartrush/v1/user/title-equipment",
@@ -95,12 +103,13 @@ class KartRiderRushPlus(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=KartRiderRushPlushUserTitleEquipment,
         )
 
 
-class KartRiderRushPlusAsync(AsyncAPIResource):
+class KartRiderRushPlusAsync(AsyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/kartrush/?id=11&shallow=true
 
@@ -109,9 +118,10 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
     - 게임 콘텐츠 변경으로 ouid가 변경될 수 있습니다. ouid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
     """
 
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
+    @async_typed_by_response_mode
     async def get_ouid(
         self,
         *,
@@ -120,6 +130,7 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> OuidInfo:
         """계정 식별자(ouid)를 조회합니다.
 
@@ -137,10 +148,12 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=OuidInfo,
         )
 
+    @async_typed_by_response_mode
     async def get_user_basic(
         self,
         *,
@@ -149,6 +162,7 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> KartRiderRushPlushUserBasic:
         return await self._get(
             path="kartrush/v1/user/basic",
@@ -158,10 +172,12 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=KartRiderRushPlushUserBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_user_title_equipment(
         self,
         *,
@@ -170,6 +186,7 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> KartRiderRushPlushUserTitleEquipment:
         return await self._get(
             path="kartrush/v1/user/title-equipment",
@@ -179,6 +196,7 @@ class KartRiderRushPlusAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=KartRiderRushPlushUserTitleEquipment,
         )
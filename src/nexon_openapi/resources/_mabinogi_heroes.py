@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ocid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
@@ -19,8 +19,8 @@ if TYPE_CHECKING:
 __all__ = ["MabinogiHeroes", "MabinogiHeroesCharacterBasic"]
 
 
-class MabinogiHeroes(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class MabinogiHeroes(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -31,6 +31,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "heroes/v1/id",
@@ -43,12 +44,15 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -57,6 +61,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterBasic:
         return self._get(
             path="heroes/v1/character/basic",
@@ -66,10 +71,12 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterBasic,
         )
 
+    @typed_by_response_mode
     def get_character_title(
         self,
         *,
@@ -78,6 +85,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterTitle:
         return self._get(
             path="heroes/v1/character/title",
@@ -87,10 +95,12 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterTitle,
         )
 
+    @typed_by_response_mode
     def get_character_title_equipment(
         self,
         *,
@@ -99,6 +109,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterTitleEquipment:
         return self._get(
             path="heroes/v1/character/title-equipment",
@@ -108,10 +119,12 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterTitleEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_item_equipment(
         self,
         *,
@@ -120,6 +133,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterItemEquipment:
         return self._get(
             path="heroes/v1/character/item-equipment",
@@ -129,10 +143,12 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterItemEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_stat(
         self,
         *,
@@ -141,6 +157,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterStat:
         return self._get(
             path="heroes/v1/character/stat",
@@ -150,10 +167,12 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterStat,
         )
 
+    @typed_by_response_mode
     def get_character_guild(
         self,
         *,
@@ -162,6 +181,7 @@ class MabinogiHeroes(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterGuild:
         return self._get(
             path="heroes/v1/character/guild",
@@ -171,13 +191,14 @@ class MabinogiHeroes(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterGuild,
         )
 
 
-class MabinogiHeroesAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class MabinogiHeroesAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -188,6 +209,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "heroes/v1/id",
@@ -200,12 +222,15 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -214,6 +239,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterBasic:
         return await self._get(
             path="heroes/v1/character/basic",
@@ -223,10 +249,12 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title(
         self,
         *,
@@ -235,6 +263,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterTitle:
         return await self._get(
             path="heroes/v1/character/title",
@@ -244,10 +273,12 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterTitle,
         )
 
+    @async_typed_by_response_mode
     async def get_character_title_equipment(
         self,
         *,
@@ -256,6 +287,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterTitleEquipment:
         return await self._get(
             path="heroes/v1/character/title-equipment",
@@ -265,10 +297,12 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterTitleEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_item_equipment(
         self,
         *,
@@ -277,6 +311,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterItemEquipment:
         return await self._get(
             path="heroes/v1/character/item-equipment",
@@ -286,10 +321,12 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterItemEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_stat(
         self,
         *,
@@ -298,6 +335,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterStat:
         return await self._get(
             path="heroes/v1/character/stat",
@@ -307,10 +345,12 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_guild(
         self,
         *,
@@ -319,6 +359,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MabinogiHeroesCharacterGuild:
         return await self._get(
             path="heroes/v1/character/guild",
@@ -328,6 +369,7 @@ class MabinogiHeroesAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MabinogiHeroesCharacterGuild,
         )
@@ -1,29 +1,26 @@
 from __future__ import annotations
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 import httpx
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
-from typing_extensions import Required, TypedDict, Annotated
+from typing import TYPE_CHECKING, Any, Dict, List, Iterable, Iterator, Optional, Tuple, Union, AsyncIterator
+from typing_extensions import Literal, Required, TypedDict, Annotated
 
 from pydantic import Field
 
 from ._types import Ocid, Ouid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
-from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from ..utils import maybe_transform, get_latest_date_available
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
+from .._batch import BatchResult
+from .._pagination import iter_pages, aiter_pages, iter_cursor_chains, aiter_cursor_chains
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-KST_TIMEZONE = timezone(timedelta(hours=9))
-ONE_DAY = timedelta(days=1)
-TWO_DAY = timedelta(days=2)
-
-
-class MapleStory(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class MapleStory(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -34,6 +31,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "maplestory/v1/id",
@@ -46,6 +44,8 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
@@ -59,6 +59,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "maplestory/v1/ouid",
@@ -67,12 +68,15 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         )
 
         return response.ouid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -82,21 +86,24 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterBasic:
         date = validate_date(date) if date is not None else date
 
         return self._get(
             path="maplestory/v1/character/basic",
             options=make_request_options(
-                query=maybe_transform({"ocid": ocid}, GetCharacterBasicRequestParam),
+                query=maybe_transform({"ocid": ocid, "date": date}, GetCharacterBasicRequestParam),
                 extra_headers=extra_headers,
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterBasic,
         )
 
+    @typed_by_response_mode
     def get_character_list(
         self,
         *,
@@ -105,6 +112,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterList:
 
         return self._get(
@@ -115,10 +123,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterList,
         )
 
+    @typed_by_response_mode
     def get_character_popularity(
         self,
         *,
@@ -128,6 +138,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPopularity:
         date = validate_date(date) if date is not None else date
 
@@ -139,10 +150,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPopularity,
         )
 
+    @typed_by_response_mode
     def get_character_stat(
         self,
         *,
@@ -152,6 +165,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterStat:
         date = validate_date(date) if date is not None else date
 
@@ -163,10 +177,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterStat,
         )
 
+    @typed_by_response_mode
     def get_character_hyper_stat(
         self,
         *,
@@ -176,6 +192,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHyperStat:
         date = validate_date(date) if date is not None else date
 
@@ -187,10 +204,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHyperStat,
         )
 
+    @typed_by_response_mode
     def get_character_propensity(
         self,
         *,
@@ -200,6 +219,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPropensity:
         date = validate_date(date) if date is not None else date
 
@@ -211,10 +231,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPropensity,
         )
 
+    @typed_by_response_mode
     def get_character_ability(
         self,
         *,
@@ -224,6 +246,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterAbility:
         date = validate_date(date) if date is not None else date
 
@@ -235,10 +258,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterAbility,
         )
 
+    @typed_by_response_mode
     def get_character_item_equipment(
         self,
         *,
@@ -248,6 +273,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterItemEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -259,10 +285,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterItemEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_cash_item_equipment(
         self,
         *,
@@ -272,6 +300,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterCashItemEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -283,10 +312,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterCashItemEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_symbol_equipment(
         self,
         *,
@@ -296,6 +327,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSymbolEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -307,10 +339,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSymbolEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_set_effect(
         self,
         *,
@@ -320,6 +354,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSetEffect:
         date = validate_date(date) if date is not None else date
 
@@ -331,10 +366,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSetEffect,
         )
 
+    @typed_by_response_mode
     def get_character_beauty_equipment(
         self,
         *,
@@ -344,6 +381,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterBeautyEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -355,10 +393,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterBeautyEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_android_equipment(
         self,
         *,
@@ -368,6 +408,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterAndroidEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -379,10 +420,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterAndroidEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_pet_equipment(
         self,
         *,
@@ -392,6 +435,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPetEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -403,10 +447,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPetEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_skill(
         self,
         *,
@@ -417,6 +463,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSkill:
         """
         character_skill_grade: string
@@ -451,10 +498,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSkill,
         )
 
+    @typed_by_response_mode
     def get_character_link_skill(
         self,
         *,
@@ -464,6 +513,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterLinkSkill:
         date = validate_date(date) if date is not None else date
 
@@ -478,10 +528,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterLinkSkill,
         )
 
+    @typed_by_response_mode
     def get_character_vmatrix(
         self,
         *,
@@ -491,6 +543,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterVMatrix:
         date = validate_date(date) if date is not None else date
 
@@ -505,10 +558,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterVMatrix,
         )
 
+    @typed_by_response_mode
     def get_character_hexa_matrix(
         self,
         *,
@@ -518,6 +573,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHexaMatrix:
         date = validate_date(date) if date is not None else date
 
@@ -532,10 +588,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHexaMatrix,
         )
 
+    @typed_by_response_mode
     def get_character_hexa_matrix_stat(
         self,
         *,
@@ -545,6 +603,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHexaMatrixStat:
         date = validate_date(date) if date is not None else date
 
@@ -559,10 +618,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHexaMatrixStat,
         )
 
+    @typed_by_response_mode
     def get_character_dojang(
         self,
         *,
@@ -572,6 +633,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterDojang:
         date = validate_date(date) if date is not None else date
 
@@ -586,10 +648,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterDojang,
         )
 
+    @typed_by_response_mode
     def get_user_union(
         self,
         *,
@@ -599,6 +663,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnion:
         date = validate_date(date) if date is not None else date
 
@@ -610,10 +675,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnion,
         )
 
+    @typed_by_response_mode
     def get_user_union_raider(
         self,
         *,
@@ -623,6 +690,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnionRaider:
         date = validate_date(date) if date is not None else date
 
@@ -634,10 +702,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnionRaider,
         )
 
+    @typed_by_response_mode
     def get_user_union_artifact(
         self,
         *,
@@ -647,6 +717,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnionArtifact:
         date = validate_date(date) if date is not None else date
 
@@ -658,10 +729,58 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnionArtifact,
         )
 
+    def get_character_snapshot(
+        self,
+        *,
+        ocid: str,
+        date: Optional[str] = None,
+        include: Optional[Iterable[CharacterSnapshotEndpoint]] = None,
+        concurrency: Optional[int] = None,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> MapleStoryCharacterSnapshot:
+        """
+        캐릭터 및 유니온 정보 조회 API를 동시에 호출하여 하나의 스냅샷으로 반환합니다.
+
+        include: 조회할 항목 (기본 값은 전체)
+            Available values : basic, popularity, stat, hyper_stat, propensity, ability, item_equipment,
+            cash_item_equipment, symbol_equipment, set_effect, beauty_equipment, android_equipment, pet_equipment,
+            skill, link_skill, vmatrix, hexa_matrix, hexa_matrix_stat, dojang, union, union_raider, union_artifact
+
+            skill 항목은 모든 전직 차수(character_skill_grade)의 스킬을 조회합니다.
+
+        concurrency: 동시에 호출할 최대 개수 (기본 값은 client.batch 와 같이 커넥션 풀 크기)
+        """
+        date = validate_date(date) if date is not None else date
+        calls = _character_snapshot_calls(include)
+
+        resource = self._model_resource()
+
+        def fetch(call: Tuple[str, Optional[str]]) -> Any:
+            field, character_skill_grade = call
+            kwargs: Dict[str, Any] = dict(
+                ocid=ocid,
+                date=date,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+            if character_skill_grade is not None:
+                return resource.get_character_skill(character_skill_grade=character_skill_grade, **kwargs)
+            return getattr(resource, CHARACTER_SNAPSHOT_ENDPOINTS[field])(**kwargs)
+
+        return _build_character_snapshot(list(self._client.batch(fetch, calls, concurrency=concurrency)))
+
     def get_guild_id(
         self,
         *,
@@ -672,6 +791,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         date = validate_date(date) if date is not None else date
 
@@ -683,10 +803,13 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=MapleStoryGuildId,
         ).oguild_id
 
+    @typed_by_response_mode
     def get_guild_basic(
         self,
         *,
@@ -696,6 +819,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryGuildBasic:
         date = validate_date(date) if date is not None else date
 
@@ -707,10 +831,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryGuildBasic,
         )
 
+    @typed_by_response_mode
     def get_overall_ranking(
         self,
         *,
@@ -724,6 +850,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryOverallRanking:
         """
         world_type: str
@@ -867,10 +994,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryOverallRanking,
         )
 
+    @typed_by_response_mode
     def get_union_ranking(
         self,
         *,
@@ -882,6 +1011,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUnionRanking:
         """
         world_name: 월드 명
@@ -921,10 +1051,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUnionRanking,
         )
 
+    @typed_by_response_mode
     def get_guild_ranking(
         self,
         *,
@@ -937,6 +1069,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryGuildRanking:
         """
         ranking_type: str
@@ -981,10 +1114,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryGuildRanking,
         )
 
+    @typed_by_response_mode
     def get_dojang_ranking(
         self,
         *,
@@ -998,6 +1133,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryDojangRanking:
         """
         difficulty: str
@@ -1141,10 +1277,12 @@ class MapleStory(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryDojangRanking,
         )
 
+    @typed_by_response_mode
     def get_the_seed_ranking(
         self,
         *,
@@ -1156,6 +1294,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryTheSeedRanking:
         """
         world_name: 월드 명
@@ -1195,10 +1334,12 @@ class MapleStory(SyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryTheSeedRanking,
         )
 
+    @typed_by_response_mode
     def get_achievement_ranking(
         self,
         *,
@@ -1209,6 +1350,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryAchievementRanking:
         date = validate_date(date) if date is not None else get_latest_date_available()
 
@@ -1227,10 +1369,256 @@ class MapleStory(SyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryAchievementRanking,
         )
 
+    def iter_overall_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        world_type: Optional[str] = None,
+        class_: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryOverallRanking.Ranking]:
+        """
+        종합 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryOverallRanking:
+            return resource.get_overall_ranking(
+                date=date,
+                world_name=world_name,
+                world_type=world_type,
+                class_=class_,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    def iter_union_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryUnionRanking.Ranking]:
+        """
+        유니온 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryUnionRanking:
+            return resource.get_union_ranking(
+                date=date,
+                world_name=world_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    def iter_guild_ranking(
+        self,
+        *,
+        ranking_type: str,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        guild_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryGuildRanking.Ranking]:
+        """
+        길드 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryGuildRanking:
+            return resource.get_guild_ranking(
+                ranking_type=ranking_type,
+                date=date,
+                world_name=world_name,
+                guild_name=guild_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    def iter_dojang_ranking(
+        self,
+        *,
+        difficulty: str,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        class_: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryDojangRanking.Ranking]:
+        """
+        무릉도장 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryDojangRanking:
+            return resource.get_dojang_ranking(
+                difficulty=difficulty,
+                date=date,
+                world_name=world_name,
+                class_=class_,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    def iter_the_seed_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryTheSeedRanking.Ranking]:
+        """
+        더 시드 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryTheSeedRanking:
+            return resource.get_the_seed_ranking(
+                date=date,
+                world_name=world_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    def iter_achievement_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryAchievementRanking.Ranking]:
+        """
+        업적 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        def fetch_page(page: int) -> MapleStoryAchievementRanking:
+            return resource.get_achievement_ranking(
+                date=date,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for ranking in iter_pages(fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch):
+            yield from ranking.ranking
+
+    @typed_by_response_mode
     def get_starforce_history(
         self,
         *,
@@ -1241,6 +1629,7 @@ class MapleStory(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryStartForceHistory:
         if date is not None and cursor is not None:
             raise ValueError("either 'date' or 'cursor' must be None")
@@ -1263,13 +1652,58 @@ class MapleStory(SyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryStartForceHistory,
         )
 
+    def iter_starforce_history(
+        self,
+        *,
+        start_date: str,
+        end_date: Optional[str] = None,
+        count: int = 1000,
+        concurrency: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> Iterator[MapleStoryStartForceHistory.StartForceHistory]:
+        """
+        start_date 부터 end_date 까지 (포함) 스타포스 강화 결과를 날짜 순서대로 순회합니다.
+        하루 안에서는 next_cursor 를 따라 조회하고, 여러 날짜는 최대 concurrency 개를 동시에 조회합니다.
+
+        end_date: str
+            생략 시 조회 가능한 최신 날짜
+        count: int
+            한 번에 조회할 결과 건 수 (10~1000)
+        """
+        start_date = validate_date(start_date)
+        end_date = validate_date(end_date) if end_date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
 
-class MapleStoryAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+        def fetch_page(date: str, cursor: Optional[str]) -> MapleStoryStartForceHistory:
+            return resource.get_starforce_history(
+                count=count,
+                date=date if cursor is None else None,
+                cursor=cursor,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        for history in iter_cursor_chains(
+            fetch_page, _next_cursor, _date_range(start_date, end_date), concurrency=concurrency
+        ):
+            yield from history.starforce_history
+
+
+class MapleStoryAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -1280,6 +1714,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "maplestory/v1/id",
@@ -1292,6 +1727,8 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
@@ -1305,6 +1742,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "maplestory/v1/ouid",
@@ -1313,12 +1751,15 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ouid,
         )
 
         return response.ouid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -1328,6 +1769,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterBasic:
         date = validate_date(date) if date is not None else date
 
@@ -1339,10 +1781,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_character_list(
         self,
         *,
@@ -1350,6 +1794,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterList:
         return await self._get(
             path="maplestory/v1/character/list",
@@ -1359,10 +1804,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterList,
         )
 
+    @async_typed_by_response_mode
     async def get_character_popularity(
         self,
         *,
@@ -1372,6 +1819,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPopularity:
         date = validate_date(date) if date is not None else date
 
@@ -1383,10 +1831,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPopularity,
         )
 
+    @async_typed_by_response_mode
     async def get_character_stat(
         self,
         *,
@@ -1396,6 +1846,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterStat:
         date = validate_date(date) if date is not None else date
 
@@ -1407,10 +1858,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_hyper_stat(
         self,
         *,
@@ -1420,6 +1873,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHyperStat:
         date = validate_date(date) if date is not None else date
 
@@ -1431,10 +1885,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHyperStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_propensity(
         self,
         *,
@@ -1444,6 +1900,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPropensity:
         date = validate_date(date) if date is not None else date
 
@@ -1455,10 +1912,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPropensity,
         )
 
+    @async_typed_by_response_mode
     async def get_character_ability(
         self,
         *,
@@ -1468,6 +1927,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterAbility:
         date = validate_date(date) if date is not None else date
 
@@ -1479,10 +1939,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterAbility,
         )
 
+    @async_typed_by_response_mode
     async def get_character_item_equipment(
         self,
         *,
@@ -1492,6 +1954,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterItemEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1503,10 +1966,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterItemEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_cash_item_equipment(
         self,
         *,
@@ -1516,6 +1981,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterCashItemEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1527,10 +1993,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterCashItemEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_symbol_equipment(
         self,
         *,
@@ -1540,6 +2008,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSymbolEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1551,10 +2020,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSymbolEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_set_effect(
         self,
         *,
@@ -1564,6 +2035,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSetEffect:
         date = validate_date(date) if date is not None else date
 
@@ -1575,10 +2047,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSetEffect,
         )
 
+    @async_typed_by_response_mode
     async def get_character_beauty_equipment(
         self,
         *,
@@ -1588,6 +2062,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterBeautyEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1599,10 +2074,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterBeautyEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_android_equipment(
         self,
         *,
@@ -1612,6 +2089,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterAndroidEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1623,10 +2101,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterAndroidEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_pet_equipment(
         self,
         *,
@@ -1636,6 +2116,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterPetEquipment:
         date = validate_date(date) if date is not None else date
 
@@ -1647,10 +2128,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterPetEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_skill(
         self,
         *,
@@ -1661,6 +2144,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterSkill:
         """
         character_skill_grade: string
@@ -1695,10 +2179,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterSkill,
         )
 
+    @async_typed_by_response_mode
     async def get_character_link_skill(
         self,
         *,
@@ -1708,6 +2194,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterLinkSkill:
         date = validate_date(date) if date is not None else date
 
@@ -1722,10 +2209,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterLinkSkill,
         )
 
+    @async_typed_by_response_mode
     async def get_character_vmatrix(
         self,
         *,
@@ -1735,6 +2224,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterVMatrix:
         date = validate_date(date) if date is not None else date
 
@@ -1749,10 +2239,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterVMatrix,
         )
 
+    @async_typed_by_response_mode
     async def get_character_hexa_matrix(
         self,
         *,
@@ -1762,6 +2254,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHexaMatrix:
         date = validate_date(date) if date is not None else date
 
@@ -1776,10 +2269,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHexaMatrix,
         )
 
+    @async_typed_by_response_mode
     async def get_character_hexa_matrix_stat(
         self,
         *,
@@ -1789,6 +2284,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterHexaMatrixStat:
         date = validate_date(date) if date is not None else date
 
@@ -1803,10 +2299,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterHexaMatrixStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_dojang(
         self,
         *,
@@ -1816,6 +2314,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryCharacterDojang:
         date = validate_date(date) if date is not None else date
 
@@ -1830,10 +2329,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryCharacterDojang,
         )
 
+    @async_typed_by_response_mode
     async def get_user_union(
         self,
         *,
@@ -1843,6 +2344,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnion:
         date = validate_date(date) if date is not None else date
 
@@ -1854,10 +2356,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnion,
         )
 
+    @async_typed_by_response_mode
     async def get_user_union_raider(
         self,
         *,
@@ -1867,6 +2371,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnionRaider:
         date = validate_date(date) if date is not None else date
 
@@ -1878,10 +2383,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnionRaider,
         )
 
+    @async_typed_by_response_mode
     async def get_user_union_artifact(
         self,
         *,
@@ -1891,6 +2398,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUserUnionArtifact:
         date = validate_date(date) if date is not None else date
 
@@ -1902,10 +2410,60 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUserUnionArtifact,
         )
 
+    async def get_character_snapshot(
+        self,
+        *,
+        ocid: str,
+        date: Optional[str] = None,
+        include: Optional[Iterable[CharacterSnapshotEndpoint]] = None,
+        concurrency: Optional[int] = None,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> MapleStoryCharacterSnapshot:
+        """
+        캐릭터 및 유니온 정보 조회 API를 동시에 호출하여 하나의 스냅샷으로 반환합니다.
+
+        include: 조회할 항목 (기본 값은 전체)
+            Available values : basic, popularity, stat, hyper_stat, propensity, ability, item_equipment,
+            cash_item_equipment, symbol_equipment, set_effect, beauty_equipment, android_equipment, pet_equipment,
+            skill, link_skill, vmatrix, hexa_matrix, hexa_matrix_stat, dojang, union, union_raider, union_artifact
+
+            skill 항목은 모든 전직 차수(character_skill_grade)의 스킬을 조회합니다.
+
+        concurrency: 동시에 호출할 최대 개수 (기본 값은 client.batch 와 같이 커넥션 풀 크기)
+        """
+        date = validate_date(date) if date is not None else date
+        calls = _character_snapshot_calls(include)
+
+        resource = self._model_resource()
+
+        async def fetch(call: Tuple[str, Optional[str]]) -> Any:
+            field, character_skill_grade = call
+            kwargs: Dict[str, Any] = dict(
+                ocid=ocid,
+                date=date,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+            if character_skill_grade is not None:
+                return await resource.get_character_skill(character_skill_grade=character_skill_grade, **kwargs)
+            return await getattr(resource, CHARACTER_SNAPSHOT_ENDPOINTS[field])(**kwargs)
+
+        return _build_character_snapshot(
+            [result async for result in self._client.batch(fetch, calls, concurrency=concurrency)]
+        )
+
     async def get_guild_id(
         self,
         *,
@@ -1916,6 +2474,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         date = validate_date(date) if date is not None else date
 
@@ -1928,11 +2487,14 @@ class MapleStoryAsync(AsyncAPIResource):
                     extra_query=extra_query,
                     extra_body=extra_body,
                     timeout=timeout,
+                    budget=budget,
+                    response_mode="model",
                 ),
                 cast_to=MapleStoryGuildId,
             )
         ).oguild_id
 
+    @async_typed_by_response_mode
     async def get_guild_basic(
         self,
         *,
@@ -1942,6 +2504,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryGuildBasic:
         date = validate_date(date) if date is not None else date
 
@@ -1953,10 +2516,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryGuildBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_overall_ranking(
         self,
         *,
@@ -1970,6 +2535,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryOverallRanking:
         """
         world_type: str
@@ -2113,10 +2679,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryOverallRanking,
         )
 
+    @async_typed_by_response_mode
     async def get_union_ranking(
         self,
         *,
@@ -2128,6 +2696,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryUnionRanking:
         """
         world_name: 월드 명
@@ -2167,10 +2736,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryUnionRanking,
         )
 
+    @async_typed_by_response_mode
     async def get_guild_ranking(
         self,
         *,
@@ -2183,6 +2754,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryGuildRanking:
         """
         ranking_type: str
@@ -2227,10 +2799,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryGuildRanking,
         )
 
+    @async_typed_by_response_mode
     async def get_dojang_ranking(
         self,
         *,
@@ -2244,6 +2818,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryDojangRanking:
         """
         difficulty: str
@@ -2387,10 +2962,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryDojangRanking,
         )
 
+    @async_typed_by_response_mode
     async def get_the_seed_ranking(
         self,
         *,
@@ -2402,6 +2979,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryTheSeedRanking:
         """
         world_name: 월드 명
@@ -2441,10 +3019,12 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryTheSeedRanking,
         )
 
+    @async_typed_by_response_mode
     async def get_achievement_ranking(
         self,
         *,
@@ -2455,6 +3035,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryAchievementRanking:
         date = validate_date(date) if date is not None else date
 
@@ -2473,10 +3054,274 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryAchievementRanking,
         )
 
+    async def iter_overall_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        world_type: Optional[str] = None,
+        class_: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryOverallRanking.Ranking]:
+        """
+        종합 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryOverallRanking:
+            return await resource.get_overall_ranking(
+                date=date,
+                world_name=world_name,
+                world_type=world_type,
+                class_=class_,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    async def iter_union_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryUnionRanking.Ranking]:
+        """
+        유니온 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryUnionRanking:
+            return await resource.get_union_ranking(
+                date=date,
+                world_name=world_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    async def iter_guild_ranking(
+        self,
+        *,
+        ranking_type: str,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        guild_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryGuildRanking.Ranking]:
+        """
+        길드 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryGuildRanking:
+            return await resource.get_guild_ranking(
+                ranking_type=ranking_type,
+                date=date,
+                world_name=world_name,
+                guild_name=guild_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    async def iter_dojang_ranking(
+        self,
+        *,
+        difficulty: str,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        class_: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryDojangRanking.Ranking]:
+        """
+        무릉도장 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryDojangRanking:
+            return await resource.get_dojang_ranking(
+                difficulty=difficulty,
+                date=date,
+                world_name=world_name,
+                class_=class_,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    async def iter_the_seed_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        world_name: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryTheSeedRanking.Ranking]:
+        """
+        더 시드 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryTheSeedRanking:
+            return await resource.get_the_seed_ranking(
+                date=date,
+                world_name=world_name,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    async def iter_achievement_ranking(
+        self,
+        *,
+        date: Optional[str] = None,
+        start_page: int = 1,
+        end_page: Optional[int] = None,
+        prefetch: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryAchievementRanking.Ranking]:
+        """
+        업적 랭킹을 start_page 부터 순서대로 순회합니다. 빈 페이지가 반환되거나 end_page (미포함)에 도달하면 종료됩니다.
+
+        prefetch: int
+            현재 페이지를 순회하는 동안 미리 동시에 조회할 페이지 수
+        """
+        date = validate_date(date) if date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(page: int) -> MapleStoryAchievementRanking:
+            return await resource.get_achievement_ranking(
+                date=date,
+                page=page,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for ranking in aiter_pages(
+            fetch_page, _is_empty_ranking, start=start_page, end=end_page, prefetch=prefetch
+        ):
+            for row in ranking.ranking:
+                yield row
+
+    @async_typed_by_response_mode
     async def get_starforce_history(
         self,
         *,
@@ -2487,6 +3332,7 @@ class MapleStoryAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryStartForceHistory:
         if date is not None and cursor is not None:
             raise ValueError("either 'date' or 'cursor' must be None")
@@ -2509,10 +3355,56 @@ class MapleStoryAsync(AsyncAPIResource):
                 extra_headers=extra_headers,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryStartForceHistory,
         )
 
+    async def iter_starforce_history(
+        self,
+        *,
+        start_date: str,
+        end_date: Optional[str] = None,
+        count: int = 1000,
+        concurrency: int = 4,
+        extra_headers: Optional[Headers] = None,
+        extra_query: Optional[Query] = None,
+        extra_body: Optional[Body] = None,
+        timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
+    ) -> AsyncIterator[MapleStoryStartForceHistory.StartForceHistory]:
+        """
+        start_date 부터 end_date 까지 (포함) 스타포스 강화 결과를 날짜 순서대로 순회합니다.
+        하루 안에서는 next_cursor 를 따라 조회하고, 여러 날짜는 최대 concurrency 개를 동시에 조회합니다.
+
+        end_date: str
+            생략 시 조회 가능한 최신 날짜
+        count: int
+            한 번에 조회할 결과 건 수 (10~1000)
+        """
+        start_date = validate_date(start_date)
+        end_date = validate_date(end_date) if end_date is not None else get_latest_date_available()
+
+        resource = self._model_resource()
+
+        async def fetch_page(date: str, cursor: Optional[str]) -> MapleStoryStartForceHistory:
+            return await resource.get_starforce_history(
+                count=count,
+                date=date if cursor is None else None,
+                cursor=cursor,
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+                budget=budget,
+            )
+
+        async for history in aiter_cursor_chains(
+            fetch_page, _next_cursor, _date_range(start_date, end_date), concurrency=concurrency
+        ):
+            for event in history.starforce_history:
+                yield event
+
 
 def validate_date(date: str) -> str:
     try:
@@ -2522,13 +3414,119 @@ def validate_date(date: str) -> str:
         raise ValueError("date must be in YYYY-mm-dd format")
 
 
-def get_latest_date_available() -> str:
-    now = datetime.now(KST_TIMEZONE)
-
-    if now.hour == 0:  # data is being updated between 0:00 ~ 1:00, we have to look up the day before yesterday
-        return (now - TWO_DAY).strftime("%Y-%m-%d")
-
-    return (now - ONE_DAY).strftime("%Y-%m-%d")
+def _date_range(start_date: str, end_date: str) -> Iterator[str]:
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    if start > end:
+        raise ValueError("start_date must not be after end_date")
+
+    for days in range((end - start).days + 1):
+        yield (start + timedelta(days=days)).strftime("%Y-%m-%d")
+
+
+CHARACTER_SKILL_GRADES: Tuple[str, ...] = (
+    "0",
+    "1",
+    "1.5",
+    "2",
+    "2.5",
+    "3",
+    "4",
+    "hyperpassive",
+    "hyperactive",
+    "5",
+    "6",
+)
+
+CharacterSnapshotEndpoint = Literal[
+    "basic",
+    "popularity",
+    "stat",
+    "hyper_stat",
+    "propensity",
+    "ability",
+    "item_equipment",
+    "cash_item_equipment",
+    "symbol_equipment",
+    "set_effect",
+    "beauty_equipment",
+    "android_equipment",
+    "pet_equipment",
+    "skill",
+    "link_skill",
+    "vmatrix",
+    "hexa_matrix",
+    "hexa_matrix_stat",
+    "dojang",
+    "union",
+    "union_raider",
+    "union_artifact",
+]
+
+# field of `MapleStoryCharacterSnapshot` -> resource method which fetches it
+CHARACTER_SNAPSHOT_ENDPOINTS: Dict[str, str] = {
+    "basic": "get_character_basic",
+    "popularity": "get_character_popularity",
+    "stat": "get_character_stat",
+    "hyper_stat": "get_character_hyper_stat",
+    "propensity": "get_character_propensity",
+    "ability": "get_character_ability",
+    "item_equipment": "get_character_item_equipment",
+    "cash_item_equipment": "get_character_cash_item_equipment",
+    "symbol_equipment": "get_character_symbol_equipment",
+    "set_effect": "get_character_set_effect",
+    "beauty_equipment": "get_character_beauty_equipment",
+    "android_equipment": "get_character_android_equipment",
+    "pet_equipment": "get_character_pet_equipment",
+    "skill": "get_character_skill",
+    "link_skill": "get_character_link_skill",
+    "vmatrix": "get_character_vmatrix",
+    "hexa_matrix": "get_character_hexa_matrix",
+    "hexa_matrix_stat": "get_character_hexa_matrix_stat",
+    "dojang": "get_character_dojang",
+    "union": "get_user_union",
+    "union_raider": "get_user_union_raider",
+    "union_artifact": "get_user_union_artifact",
+}
+
+
+def _is_empty_ranking(page: Any) -> bool:
+    return not page.ranking
+
+
+def _next_cursor(history: MapleStoryStartForceHistory) -> Optional[str]:
+    return history.next_cursor or None
+
+
+def _character_snapshot_calls(include: Optional[Iterable[str]]) -> List[Tuple[str, Optional[str]]]:
+    """Return a `(field, character_skill_grade)` pair for every API call needed to build a snapshot."""
+    fields = list(CHARACTER_SNAPSHOT_ENDPOINTS) if include is None else list(dict.fromkeys(include))
+
+    unknown = [field for field in fields if field not in CHARACTER_SNAPSHOT_ENDPOINTS]
+    if unknown:
+        raise ValueError(f"unknown snapshot fields: {', '.join(unknown)}")
+
+    calls: List[Tuple[str, Optional[str]]] = []
+    for field in fields:
+        if field == "skill":
+            calls.extend((field, character_skill_grade) for character_skill_grade in CHARACTER_SKILL_GRADES)
+        else:
+            calls.append((field, None))
+    return calls
+
+
+def _build_character_snapshot(
+    results: List[BatchResult[Tuple[str, Optional[str]], Any]],
+) -> MapleStoryCharacterSnapshot:
+    values: Dict[str, Any] = {}
+    for result in results:
+        field, character_skill_grade = result.item
+        if character_skill_grade is None:
+            values[field] = result.unwrap()
+        else:
+            values.setdefault(field, {})[character_skill_grade] = result.unwrap()
+
+    return MapleStoryCharacterSnapshot.construct(**values)
 
 
 class CashItemEquipment(BaseModel):
@@ -3894,6 +4892,36 @@ class MapleStoryUserUnionArtifact(BaseModel):
         """ 아티팩트 크리스탈 세 번째 옵션 명 """
 
 
+class MapleStoryCharacterSnapshot(BaseModel):
+    """ 캐릭터 및 유니온 정보 스냅샷 (조회하지 않은 항목은 None) """
+
+    basic: Optional[MapleStoryCharacterBasic] = None
+    popularity: Optional[MapleStoryCharacterPopularity] = None
+    stat: Optional[MapleStoryCharacterStat] = None
+    hyper_stat: Optional[MapleStoryCharacterHyperStat] = None
+    propensity: Optional[MapleStoryCharacterPropensity] = None
+    ability: Optional[MapleStoryCharacterAbility] = None
+    item_equipment: Optional[MapleStoryCharacterItemEquipment] = None
+    cash_item_equipment: Optional[MapleStoryCharacterCashItemEquipment] = None
+    symbol_equipment: Optional[MapleStoryCharacterSymbolEquipment] = None
+    set_effect: Optional[MapleStoryCharacterSetEffect] = None
+    beauty_equipment: Optional[MapleStoryCharacterBeautyEquipment] = None
+    android_equipment: Optional[MapleStoryCharacterAndroidEquipment] = None
+    pet_equipment: Optional[MapleStoryCharacterPetEquipment] = None
+
+    skill: Optional[Dict[str, MapleStoryCharacterSkill]] = None
+    """ 전직 차수(character_skill_grade) 별 스킬 정보 """
+
+    link_skill: Optional[MapleStoryCharacterLinkSkill] = None
+    vmatrix: Optional[MapleStoryCharacterVMatrix] = None
+    hexa_matrix: Optional[MapleStoryCharacterHexaMatrix] = None
+    hexa_matrix_stat: Optional[MapleStoryCharacterHexaMatrixStat] = None
+    dojang: Optional[MapleStoryCharacterDojang] = None
+    union: Optional[MapleStoryUserUnion] = None
+    union_raider: Optional[MapleStoryUserUnionRaider] = None
+    union_artifact: Optional[MapleStoryUserUnionArtifact] = None
+
+
 class GetGuildIdRequestParam(TypedDict, total=False):
     world_name: Required[str]
     guild_name: Required[str]
@@ -4470,7 +5498,7 @@ class MapleStoryStartForceHistory(BaseModel):
     count: int
     """ 결과 건 수 """
 
-    next_cursor: str
+    next_cursor: Optional[str]
     """ 페이징 처리를 위한 cursor """
 
     starforce_history: List[StartForceHistory]
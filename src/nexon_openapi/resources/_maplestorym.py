@@ -1,24 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
 from ._types import Ocid
-from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class MapleStoryM(SyncAPIResource):
-    def __init__(self, client: NexonOpenAPI) -> None:
+class MapleStoryM(SyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
     def get_ocid(
@@ -30,6 +30,7 @@ class MapleStoryM(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = self._get(
             "maplestorym/v1/id",
@@ -42,12 +43,15 @@ class MapleStoryM(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @typed_by_response_mode
     def get_character_basic(
         self,
         *,
@@ -56,6 +60,7 @@ class MapleStoryM(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterBasic:
         return self._get(
             path="maplestorym/v1/character/basic",
@@ -65,10 +70,12 @@ class MapleStoryM(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterBasic,
         )
 
+    @typed_by_response_mode
     def get_character_item_equipment(
         self,
         *,
@@ -77,6 +84,7 @@ class MapleStoryM(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterItemEquipment:
         return self._get(
             path="maplestorym/v1/character/item-equipment",
@@ -86,10 +94,12 @@ class MapleStoryM(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterItemEquipment,
         )
 
+    @typed_by_response_mode
     def get_character_stat(
         self,
         *,
@@ -98,6 +108,7 @@ class MapleStoryM(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterStat:
         return self._get(
             path="maplestorym/v1/character/stat",
@@ -107,10 +118,12 @@ class MapleStoryM(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterStat,
         )
 
+    @typed_by_response_mode
     def get_character_guild(
         self,
         *,
@@ -119,6 +132,7 @@ class MapleStoryM(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterGuild:
         return self._get(
             path="maplestorym/v1/character/guild",
@@ -128,13 +142,14 @@ class MapleStoryM(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterGuild,
         )
 
 
-class MapleStoryMAsync(AsyncAPIResource):
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+class MapleStoryMAsync(AsyncAPIResource[ResponseModeT]):
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
     async def get_ocid(
@@ -146,6 +161,7 @@ class MapleStoryMAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> str:
         response = await self._get(
             "maplestorym/v1/id",
@@ -158,12 +174,15 @@ class MapleStoryMAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
+                response_mode="model",
             ),
             cast_to=Ocid,
         )
 
         return response.ocid
 
+    @async_typed_by_response_mode
     async def get_character_basic(
         self,
         *,
@@ -172,6 +191,7 @@ class MapleStoryMAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterBasic:
         return await self._get(
             path="maplestorym/v1/character/basic",
@@ -181,10 +201,12 @@ class MapleStoryMAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_character_item_equipment(
         self,
         *,
@@ -193,6 +215,7 @@ class MapleStoryMAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterItemEquipment:
         return await self._get(
             path="maplestorym/v1/character/item-equipment",
@@ -202,10 +225,12 @@ class MapleStoryMAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterItemEquipment,
         )
 
+    @async_typed_by_response_mode
     async def get_character_stat(
         self,
         *,
@@ -214,6 +239,7 @@ class MapleStoryMAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterStat:
         return await self._get(
             path="maplestorym/v1/character/stat",
@@ -223,10 +249,12 @@ class MapleStoryMAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterStat,
         )
 
+    @async_typed_by_response_mode
     async def get_character_guild(
         self,
         *,
@@ -235,6 +263,7 @@ class MapleStoryMAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> MapleStoryMCharacterGuild:
         return await self._get(
             path="maplestorym/v1/character/guild",
@@ -244,6 +273,7 @@ class MapleStoryMAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=MapleStoryMCharacterGuild,
         )
@@ -1,22 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 from typing_extensions import Required, TypedDict
 
 
 import httpx
 
-from .._types import NOT_GIVEN, Body, ModelBuilderProtocol, Query, Headers, NotGiven
+from .._types import NOT_GIVEN, Body, ModelBuilderProtocol, Query, Headers, NotGiven, ResponseModeT
 from .._models import BaseModel
 from ..utils import maybe_transform
-from .._resource import SyncAPIResource, AsyncAPIResource
+from .._resource import SyncAPIResource, AsyncAPIResource, typed_by_response_mode, async_typed_by_response_mode
 from .._base_client import make_request_options
 
 if TYPE_CHECKING:
     from .._client import NexonOpenAPI, NexonOpenAPIAsync
 
 
-class TFD(SyncAPIResource):
+class TFD(SyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/tfd/?id=20
 
@@ -26,9 +26,10 @@ class TFD(SyncAPIResource):
     - Nickname must distinguish between uppercase and lowercase letters.
     """
 
-    def __init__(self, client: NexonOpenAPI) -> None:
+    def __init__(self, client: NexonOpenAPI[Any]) -> None:
         super().__init__(client)
 
+    @typed_by_response_mode
     def get_ouid(
         self,
         *,
@@ -37,6 +38,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDOuid:
         """Retrieves the account identifier (OUID)"""
 
@@ -48,10 +50,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDOuid,
         )
 
+    @typed_by_response_mode
     def get_user_basic(
         self,
         *,
@@ -60,6 +64,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserBasic:
         """Retrieves basic information of the user"""
 
@@ -71,10 +76,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserBasic,
         )
 
+    @typed_by_response_mode
     def get_user_descendant(
         self,
         *,
@@ -83,6 +90,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserDescendant:
         """Retrieves information about the equipped descendant."""
 
@@ -94,10 +102,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserDescendant,
         )
 
+    @typed_by_response_mode
     def get_user_weapon(
         self,
         *,
@@ -107,6 +117,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserWeapon:
         """Retrieves information about the equipped weapon.
 
@@ -124,10 +135,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserWeapon,
         )
 
+    @typed_by_response_mode
     def get_user_reactor(
         self,
         *,
@@ -137,6 +150,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserReactor:
         """Retrieves information about the equipped reactor.
 
@@ -154,10 +168,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserReactor,
         )
 
+    @typed_by_response_mode
     def get_user_external_component(
         self,
         *,
@@ -167,6 +183,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserExternalComponent:
         """Retrieves information about external components equipped in all slots.
 
@@ -184,11 +201,13 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserExternalComponent,
         )
 
     # metadata
+    @typed_by_response_mode
     def get_descendant_metadata(
         self,
         *,
@@ -197,6 +216,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDDescendantMetadata]:
         """Retrieves descendant metadata.
 
@@ -211,10 +231,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDDescendantMetadata],
         )
 
+    @typed_by_response_mode
     def get_weapon_metadata(
         self,
         *,
@@ -223,6 +245,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDWeaponMetadata]:
         """Retrieves weapon metadata.
 
@@ -237,10 +260,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDWeaponMetadata],
         )
 
+    @typed_by_response_mode
     def get_module_metadata(
         self,
         *,
@@ -249,6 +274,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDModuleMetadata]:
         """Retrieves module metadata.
 
@@ -263,10 +289,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDModuleMetadata],
         )
 
+    @typed_by_response_mode
     def get_reactor_metadata(
         self,
         *,
@@ -275,6 +303,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDReactorMetadata]:
         """Retrieves reactor metadata.
 
@@ -289,10 +318,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDReactorMetadata],
         )
 
+    @typed_by_response_mode
     def get_external_component_metadata(
         self,
         *,
@@ -301,6 +332,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDExternalComponentMetadata]:
         """Retrieves external component metadata.
 
@@ -315,10 +347,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDExternalComponentMetadata],
         )
 
+    @typed_by_response_mode
     def get_reward_metadata(
         self,
         *,
@@ -327,6 +361,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDRewardMetadata]:
         """Retrieves reward metadata.
 
@@ -341,10 +376,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDRewardMetadata],
         )
 
+    @typed_by_response_mode
     def get_stat_metadata(
         self,
         *,
@@ -353,6 +390,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDStatMetadata]:
         """Retrieves stat metadata.
 
@@ -367,10 +405,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDStatMetadata],
         )
 
+    @typed_by_response_mode
     def get_void_battle_metadata(
         self,
         *,
@@ -379,6 +419,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDVoidBattleMetadata]:
         """Retrieves void battle metadata.
 
@@ -393,10 +434,12 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDVoidBattleMetadata],
         )
 
+    @typed_by_response_mode
     def get_title_metadata(
         self,
         *,
@@ -405,6 +448,7 @@ class TFD(SyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDTitleMetadata]:
         """Retrieves title metadata.
 
@@ -419,12 +463,13 @@ class TFD(SyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDTitleMetadata],
         )
 
 
-class TFDAsync(AsyncAPIResource):
+class TFDAsync(AsyncAPIResource[ResponseModeT]):
     """
     link: https://openapi.nexon.com/game/tfd/?id=20
 
@@ -434,9 +479,10 @@ class TFDAsync(AsyncAPIResource):
     - Nickname must distinguish between uppercase and lowercase letters.
     """
 
-    def __init__(self, client: NexonOpenAPIAsync) -> None:
+    def __init__(self, client: NexonOpenAPIAsync[Any]) -> None:
         super().__init__(client)
 
+    @async_typed_by_response_mode
     async def get_ouid(
         self,
         *,
@@ -445,6 +491,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDOuid:
         """Retrieves the account identifier (OUID)"""
         return await self._get(
@@ -455,10 +502,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDOuid,
         )
 
+    @async_typed_by_response_mode
     async def get_user_basic(
         self,
         *,
@@ -467,6 +516,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserBasic:
         """Retrieves basic information of the user"""
 
@@ -478,10 +528,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserBasic,
         )
 
+    @async_typed_by_response_mode
     async def get_user_descendant(
         self,
         *,
@@ -490,6 +542,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserDescendant:
         """Retrieves information about the equipped descendant."""
 
@@ -501,10 +554,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserDescendant,
         )
 
+    @async_typed_by_response_mode
     async def get_user_weapon(
         self,
         *,
@@ -514,6 +569,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserWeapon:
         """Retrieves information about the equipped weapon.
 
@@ -531,10 +587,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserWeapon,
         )
 
+    @async_typed_by_response_mode
     async def get_user_reactor(
         self,
         *,
@@ -544,6 +602,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserReactor:
         """Retrieves information about the equipped reactor.
 
@@ -561,10 +620,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserReactor,
         )
 
+    @async_typed_by_response_mode
     async def get_user_external_component(
         self,
         *,
@@ -574,6 +635,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> TFDUserExternalComponent:
         """Retrieves information about external components equipped in all slots.
 
@@ -591,11 +653,13 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=TFDUserExternalComponent,
         )
 
     # metadata
+    @async_typed_by_response_mode
     async def get_descendant_metadata(
         self,
         *,
@@ -604,6 +668,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDDescendantMetadata]:
         """Retrieves descendant metadata.
 
@@ -618,10 +683,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDDescendantMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_weapon_metadata(
         self,
         *,
@@ -630,6 +697,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDWeaponMetadata]:
         """Retrieves weapon metadata.
 
@@ -644,10 +712,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDWeaponMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_module_metadata(
         self,
         *,
@@ -656,6 +726,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDModuleMetadata]:
         """Retrieves module metadata.
 
@@ -670,10 +741,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDModuleMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_reactor_metadata(
         self,
         *,
@@ -682,6 +755,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDReactorMetadata]:
         """Retrieves reactor metadata.
 
@@ -696,10 +770,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDReactorMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_external_component_metadata(
         self,
         *,
@@ -708,6 +784,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDExternalComponentMetadata]:
         """Retrieves external component metadata.
 
@@ -722,10 +799,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDExternalComponentMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_reward_metadata(
         self,
         *,
@@ -734,6 +813,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDRewardMetadata]:
         """Retrieves reward metadata.
 
@@ -748,10 +828,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDRewardMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_stat_metadata(
         self,
         *,
@@ -760,6 +842,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDStatMetadata]:
         """Retrieves stat metadata.
 
@@ -774,10 +857,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDStatMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_void_battle_metadata(
         self,
         *,
@@ -786,6 +871,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDVoidBattleMetadata]:
         """Retrieves void battle metadata.
 
@@ -800,10 +886,12 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDVoidBattleMetadata],
         )
 
+    @async_typed_by_response_mode
     async def get_title_metadata(
         self,
         *,
@@ -812,6 +900,7 @@ class TFDAsync(AsyncAPIResource):
         extra_query: Optional[Query] = None,
         extra_body: Optional[Body] = None,
         timeout: Union[float, httpx.Timeout, None, NotGiven] = NOT_GIVEN,
+        budget: Union[float, None, NotGiven] = NOT_GIVEN,
     ) -> List[TFDTitleMetadata]:
         """Retrieves title metadata.
 
@@ -826,6 +915,7 @@ class TFDAsync(AsyncAPIResource):
                 extra_query=extra_query,
                 extra_body=extra_body,
                 timeout=timeout,
+                budget=budget,
             ),
             cast_to=List[TFDTitleMetadata],
         )
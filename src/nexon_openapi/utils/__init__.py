@@ -6,3 +6,6 @@ from ._utils import is_mapping as is_mapping
 from ._utils import strip_not_given as strip_not_given
 from ._utils import required_args as required_args
 from ._transform import maybe_transform as maybe_transform
+from ._datetime import KST_TIMEZONE as KST_TIMEZONE
+from ._datetime import get_latest_date_available as get_latest_date_available
+from ._datetime import seconds_until_data_refresh as seconds_until_data_refresh
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Optional
+from datetime import datetime, timezone, timedelta
+
+KST_TIMEZONE = timezone(timedelta(hours=9))
+ONE_DAY = timedelta(days=1)
+TWO_DAY = timedelta(days=2)
+
+# daily data is being updated between 0:00 ~ 1:00 (KST)
+DATA_REFRESH_HOUR = 1
+
+
+def get_latest_date_available(now: Optional[datetime] = None) -> str:
+    now = now.astimezone(KST_TIMEZONE) if now is not None else datetime.now(KST_TIMEZONE)
+
+    if now.hour < DATA_REFRESH_HOUR:  # data is being updated, we have to look up the day before yesterday
+        return (now - TWO_DAY).strftime("%Y-%m-%d")
+
+    return (now - ONE_DAY).strftime("%Y-%m-%d")
+
+
+def seconds_until_data_refresh(now: Optional[datetime] = None) -> float:
+    """Return the number of seconds until the next daily data update (1:00 KST) is completed."""
+    now = now.astimezone(KST_TIMEZONE) if now is not None else datetime.now(KST_TIMEZONE)
+
+    refresh_at = now.replace(hour=DATA_REFRESH_HOUR, minute=0, second=0, microsecond=0)
+    if refresh_at <= now:
+        refresh_at += ONE_DAY
+
+    return (refresh_at - now).total_seconds()
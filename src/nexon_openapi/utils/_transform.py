@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, Optional, TypeVar, Union, cast
+from typing import Any, Dict, Tuple, Mapping, Callable, Optional, TypeVar, Union, cast
 from datetime import date, datetime
 from typing_extensions import Literal, get_args, override, get_type_hints
 
@@ -20,6 +20,8 @@ from .._compat import model_dump, is_typeddict
 
 _T = TypeVar("_T")
 
+_Transformer = Callable[[object], object]
+
 
 PropertyFormat = Literal["iso8601", "custom"]
 
@@ -146,41 +148,108 @@ def _transform_recursive(
     if inner_type is None:
         inner_type = annotation
 
+    return _get_transformer(annotation, inner_type)(data)
+
+
+# every request transforms its params, so the type hints and metadata of each annotation are only
+# inspected once and compiled into a function that only looks at the data
+_transformers: Dict[Tuple[Any, Any], _Transformer] = {}
+
+
+def _get_transformer(annotation: type, inner_type: type) -> _Transformer:
+    key = (annotation, inner_type)
+    try:
+        return _transformers[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable types can't be cached
+        return _compile_transformer(annotation, inner_type)
+
+    transformer = _transformers[key] = _compile_transformer(annotation, inner_type)
+    return transformer
+
+
+def _compile_transformer(annotation: type, inner_type: type) -> _Transformer:
     stripped_type = strip_annotated_type(inner_type)
-    if is_typeddict(stripped_type) and is_mapping(data):
-        return _transform_typeddict(data, stripped_type)
 
-    if is_list_type(stripped_type) and is_list(data):
-        inner_type = extract_type_arg(stripped_type, 0)
-        return [_transform_recursive(d, annotation=annotation, inner_type=inner_type) for d in data]
+    transform_typeddict = _TypedDictTransformer(stripped_type) if is_typeddict(stripped_type) else None
+    transform_entry = (
+        _get_transformer(annotation, extract_type_arg(stripped_type, 0)) if is_list_type(stripped_type) else None
+    )
+    # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+    #
+    # TODO: there may be edge cases where the same normalized field name will transform to two different names
+    # in different subtypes.
+    transform_variants = (
+        [_get_transformer(annotation, subtype) for subtype in get_args(stripped_type)]
+        if is_union_type(stripped_type)
+        else None
+    )
+    format_value = _value_formatter(annotation)
+
+    def transform(data: object) -> object:
+        if transform_typeddict is not None and is_mapping(data):
+            return transform_typeddict(data)
+
+        if transform_entry is not None and is_list(data):
+            return [transform_entry(entry) for entry in data]
 
-    if is_union_type(stripped_type):
-        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
-        #
-        # TODO: there may be edge cases where the same normalized field name will transform to two different names
-        # in different subtypes.
-        for subtype in get_args(stripped_type):
-            data = _transform_recursive(data, annotation=annotation, inner_type=subtype)
-        return data
+        if transform_variants is not None:
+            for transform_variant in transform_variants:
+                data = transform_variant(data)
+            return data
 
-    if isinstance(data, pydantic.BaseModel):
-        return model_dump(data, exclude_unset=True)
+        if isinstance(data, pydantic.BaseModel):
+            return model_dump(data, exclude_unset=True)
 
-    return _transform_value(data, annotation)
+        return format_value(data) if format_value is not None else data
 
+    return transform
 
-def _transform_value(data: object, type_: type) -> object:
+
+class _TypedDictTransformer:
+    """Renames and transforms the keys of a mapping in a single pass, following the fields of a `TypedDict`.
+
+    The fields are resolved on first use so that self-referencing `TypedDict`s can be compiled.
+    """
+
+    def __init__(self, expected_type: type) -> None:
+        self._expected_type = expected_type
+        self._fields: Optional[Dict[str, Tuple[str, _Transformer]]] = None
+
+    def __call__(self, data: Mapping[str, object]) -> Mapping[str, object]:
+        fields = self._fields
+        if fields is None:
+            fields = self._fields = {
+                key: (_maybe_transform_key(key, type_), _get_transformer(type_, type_))
+                for key, type_ in get_type_hints(self._expected_type, include_extras=True).items()
+            }
+
+        result: dict[str, object] = {}
+        for key, value in data.items():
+            field = fields.get(key)
+            if field is None:
+                # we do not have a type annotation for this field, leave it as is
+                result[key] = value
+            else:
+                alias, transform = field
+                result[alias] = transform(value)
+        return result
+
+
+def _value_formatter(type_: type) -> Optional[_Transformer]:
     annotated_type = _get_annotated_type(type_)
     if annotated_type is None:
-        return data
+        return None
 
     # ignore the first argument as it is the actual type
     annotations = get_args(annotated_type)[1:]
     for annotation in annotations:
         if isinstance(annotation, PropertyInfo) and annotation.format is not None:
-            return _format_data(data, annotation.format, annotation.format_template)
+            format_, format_template = annotation.format, annotation.format_template
+            return lambda data: _format_data(data, format_, format_template)
 
-    return data
+    return None
 
 
 def _format_data(data: object, format_: PropertyFormat, format_template: Optional[str]) -> object:
@@ -192,19 +261,3 @@ def _format_data(data: object, format_: PropertyFormat, format_template: Optiona
             return data.strftime(format_template)
 
     return data
-
-
-def _transform_typeddict(
-    data: Mapping[str, object],
-    expected_type: type,
-) -> Mapping[str, object]:
-    result: dict[str, object] = {}
-    annotations = get_type_hints(expected_type, include_extras=True)
-    for key, value in data.items():
-        type_ = annotations.get(key)
-        if type_ is None:
-            # we do not have a type annotation for this field, leave it as is
-            result[key] = value
-        else:
-            result[_maybe_transform_key(key, type_)] = _transform_recursive(value, annotation=type_)
-    return result
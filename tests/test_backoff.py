@@ -0,0 +1,108 @@
+import time
+import random
+import email.utils
+from typing import Optional
+
+import httpx
+import pytest
+from typing_extensions import override
+
+from nexon_openapi import Backoff, NexonOpenAPI, ExponentialBackoff, DecorrelatedJitterBackoff
+from nexon_openapi._models import FinalRequestOptions
+
+
+@pytest.fixture(autouse=True)
+def seeded() -> None:
+    random.seed(20240101)
+
+
+def test_exponential_backoff_jitter_bounds_and_cap() -> None:
+    backoff = ExponentialBackoff(initial=0.5, maximum=8.0, jitter=0.25)
+
+    for attempt, full in [(0, 0.5), (1, 1.0), (2, 2.0), (3, 4.0), (4, 8.0), (5, 8.0), (10, 8.0)]:
+        delays = [backoff.delay(attempt, None) for _ in range(200)]
+        assert all(full * 0.75 <= delay <= full for delay in delays)
+        # the jitter spreads the delays out
+        assert max(delays) - min(delays) > full * 0.2
+
+
+def test_exponential_backoff_is_reproducible_with_a_seed() -> None:
+    backoff = ExponentialBackoff(initial=1, maximum=4, jitter=0.5)
+
+    delays = [backoff.delay(attempt, None) for attempt in range(4)]
+
+    expected = random.Random(20240101)
+    assert delays == [min(1 * 2.0**attempt, 4) * (1 - 0.5 * expected.random()) for attempt in range(4)]
+
+
+def test_exponential_backoff_without_jitter() -> None:
+    backoff = ExponentialBackoff(initial=0.5, maximum=3, jitter=0)
+
+    assert [backoff.delay(attempt, None) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_decorrelated_jitter_bounds_and_cap() -> None:
+    backoff = DecorrelatedJitterBackoff(base=0.5, maximum=8.0)
+
+    previous: Optional[float] = None
+    for attempt in range(200):
+        delay = backoff.delay(attempt, previous)
+        assert 0.5 <= delay <= min(8.0, max(previous or 0.5, 0.5) * 3)
+        previous = delay
+
+    delays = [backoff.delay(1, 8.0) for _ in range(200)]
+    assert all(0.5 <= delay <= 8.0 for delay in delays)
+    assert delays.count(8.0) > 0
+
+
+def test_backoff_validation() -> None:
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial=-1)
+    with pytest.raises(ValueError):
+        ExponentialBackoff(initial=2, maximum=1)
+    with pytest.raises(ValueError):
+        ExponentialBackoff(jitter=1.5)
+    with pytest.raises(ValueError):
+        DecorrelatedJitterBackoff(base=0)
+    with pytest.raises(ValueError):
+        DecorrelatedJitterBackoff(base=2, maximum=1)
+
+
+class FixedBackoff(Backoff):
+    @override
+    def delay(self, attempt: int, previous: Optional[float]) -> float:
+        return 5.0 + attempt
+
+
+def retry_timeout(headers: Optional[httpx.Headers], previous: Optional[float] = None) -> float:
+    client = NexonOpenAPI(api_key="test", max_retries=3, backoff=FixedBackoff())
+    options = FinalRequestOptions.construct(method="get", url="/maplestory/v1/id")
+    # the first retry
+    return client._calculate_retry_timeout(3, options, headers, previous)
+
+
+def test_retry_after_takes_precedence_over_the_backoff() -> None:
+    assert retry_timeout(None) == 5.0
+    assert retry_timeout(httpx.Headers({"retry-after": "2"})) == 2.0
+    assert retry_timeout(httpx.Headers({"retry-after": "0.5"})) == 0.5
+    assert retry_timeout(httpx.Headers({"retry-after": "60"})) == 60.0
+
+    date = email.utils.formatdate(time.time() + 30, usegmt=True)
+    assert 28 <= retry_timeout(httpx.Headers({"retry-after": date})) <= 30
+
+
+@pytest.mark.parametrize("retry_after", ["0", "-1", "61", "3600", "soon"])
+def test_unreasonable_retry_after_falls_back_to_the_backoff(retry_after: str) -> None:
+    assert retry_timeout(httpx.Headers({"retry-after": retry_after})) == 5.0
+
+
+def test_default_backoff() -> None:
+    client = NexonOpenAPI(api_key="test", max_retries=3)
+    options = FinalRequestOptions.construct(method="get", url="/maplestory/v1/id")
+
+    delays = [client._calculate_retry_timeout(remaining, options) for remaining in (3, 2, 1)]
+
+    # 0.5, 1 and 2 seconds, shortened by up to a quarter
+    assert 0.375 <= delays[0] <= 0.5
+    assert 0.75 <= delays[1] <= 1.0
+    assert 1.5 <= delays[2] <= 2.0
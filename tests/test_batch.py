@@ -0,0 +1,169 @@
+import time
+import threading
+from typing import Any, List, Iterator
+
+import anyio
+import httpx
+import pytest
+
+from nexon_openapi import BatchResult, NexonOpenAPI, NexonOpenAPIAsync
+from nexon_openapi._batch import run_batch, arun_batch
+from nexon_openapi._exceptions import NotFoundError
+
+
+class InFlight:
+    """Counts the calls in flight and the most that were in flight at once."""
+
+    def __init__(self) -> None:
+        self.current = 0
+        self.most = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> None:
+        with self._lock:
+            self.current += 1
+            self.most = max(self.most, self.current)
+
+    def exit(self) -> None:
+        with self._lock:
+            self.current -= 1
+
+
+def test_results_are_yielded_as_the_calls_complete() -> None:
+    def fn(delay: float) -> float:
+        time.sleep(delay)
+        return delay * 2
+
+    results = list(run_batch(fn, [0.2, 0.0, 0.1], concurrency=3))
+
+    assert [result.item for result in results] == [0.0, 0.1, 0.2]
+    # every result belongs to its own item
+    assert [result.unwrap() for result in results] == [0.0, 0.2, 0.4]
+
+
+def test_results_keep_the_order_of_the_items_one_at_a_time() -> None:
+    results = list(run_batch(lambda item: item * 2, range(20), concurrency=1))
+
+    assert [result.item for result in results] == list(range(20))
+    assert [result.result for result in results] == [item * 2 for item in range(20)]
+
+
+def test_concurrency_limit() -> None:
+    in_flight = InFlight()
+    consumed: List[int] = []
+
+    def items() -> Iterator[int]:
+        for item in range(30):
+            consumed.append(item)
+            yield item
+
+    def fn(item: int) -> int:
+        in_flight.enter()
+        time.sleep(0.005)
+        in_flight.exit()
+        return item
+
+    batch = run_batch(fn, items(), concurrency=4)
+    first = next(batch)
+    # the items are consumed lazily
+    assert len(consumed) <= 5
+    rest = list(batch)
+
+    assert in_flight.most == 4
+    assert sorted(result.unwrap() for result in [first, *rest]) == list(range(30))
+
+
+def test_errors_are_captured_per_item() -> None:
+    def fn(item: int) -> int:
+        if item % 3 == 0:
+            raise ValueError(item)
+        return item
+
+    results = {result.item: result for result in run_batch(fn, range(9), concurrency=3)}
+
+    assert sorted(item for item, result in results.items() if not result.ok) == [0, 3, 6]
+    assert all(result.result == item for item, result in results.items() if result.ok)
+    error = results[3].error
+    assert isinstance(error, ValueError)
+    assert error.args == (3,)
+    with pytest.raises(ValueError):
+        results[6].unwrap()
+
+
+def test_non_exceptions_are_not_captured() -> None:
+    def fn(item: int) -> int:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        list(run_batch(fn, range(3), concurrency=1))
+
+
+def test_concurrency_validation() -> None:
+    with pytest.raises(ValueError):
+        list(run_batch(lambda item: item, range(3), concurrency=0))
+
+
+@pytest.mark.anyio
+async def test_async_batch() -> None:
+    in_flight = InFlight()
+
+    async def fn(item: int) -> int:
+        in_flight.enter()
+        await anyio.sleep(0.01 if item == 0 else 0)
+        in_flight.exit()
+        if item == 5:
+            raise ValueError(item)
+        return item * 2
+
+    results = [result async for result in arun_batch(fn, range(10), concurrency=3)]
+
+    assert in_flight.most == 3
+    # the slow first item completes after the others
+    assert results[-1].item == 0
+    assert sorted(result.item for result in results) == list(range(10))
+    assert [result.item for result in results if not result.ok] == [5]
+    assert all(result.result == result.item * 2 for result in results if result.ok)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    ocid = request.url.params["ocid"]
+    if ocid == "missing":
+        return httpx.Response(404, json={"error": {"name": "OPENAPI00004", "message": "not found"}})
+    return httpx.Response(200, json={"character_name": ocid})
+
+
+async def async_handler(request: httpx.Request) -> httpx.Response:
+    return handler(request)
+
+
+def check_character_results(results: List[BatchResult[str, Any]]) -> None:
+    by_ocid = {result.item: result for result in results}
+    assert sorted(by_ocid) == ["a", "b", "c", "missing"]
+    assert isinstance(by_ocid["missing"].error, NotFoundError)
+    assert [by_ocid[ocid].unwrap().character_name for ocid in ("a", "b", "c")] == ["a", "b", "c"]
+
+
+def test_client_batch() -> None:
+    client = NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+    results = list(
+        client.batch(lambda ocid: client.maplestory.get_character_basic(ocid=ocid), ["a", "missing", "b", "c"])
+    )
+
+    check_character_results(results)
+
+
+@pytest.mark.anyio
+async def test_async_client_batch() -> None:
+    client = NexonOpenAPIAsync(
+        api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+    )
+
+    results = [
+        result
+        async for result in client.batch(
+            lambda ocid: client.maplestory.get_character_basic(ocid=ocid), ["a", "missing", "b", "c"], concurrency=2
+        )
+    ]
+
+    check_character_results(results)
@@ -0,0 +1,178 @@
+import time
+from typing import Any, Dict, List, cast
+
+import httpx
+import pytest
+
+from nexon_openapi import APIKeyPool, RateLimiter, NexonOpenAPI, NexonOpenAPIAsync, ExponentialBackoff
+from nexon_openapi._exceptions import APITimeoutError, InternalServerError
+
+BUDGET = 0.5
+LATENCY = 0.05
+MAX_RETRIES = 20
+
+
+class FailingServer:
+    """Answers every attempt with a `500` after `LATENCY` seconds, recording when it started and its timeout."""
+
+    def __init__(self) -> None:
+        self.started: List[float] = []
+        self.timeouts: List[Dict[str, float]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.started.append(time.monotonic())
+        extensions = cast(Dict[str, Any], request.extensions)  # pyright: ignore[reportUnknownMemberType]
+        self.timeouts.append(extensions["timeout"])
+        time.sleep(LATENCY)
+        return httpx.Response(500, json={"error": {"name": "OPENAPI00001", "message": "Internal server error"}})
+
+    def check(self, ended_at: float) -> None:
+        # the budget ended the retries long before `MAX_RETRIES`
+        assert 3 <= len(self.started) < MAX_RETRIES
+        # a mock transport does not enforce timeouts, the last attempt may run for its whole latency
+        assert ended_at - self.started[0] < BUDGET + LATENCY + 0.1
+
+        # every attempt is given the time left in the budget at most
+        reads: List[float] = [timeout["read"] for timeout in self.timeouts]
+        assert reads[0] <= BUDGET
+        for started, read in zip(self.started[1:], reads[1:]):
+            assert read <= reads[0] - (started - self.started[0]) + 0.01
+
+
+def backoff() -> ExponentialBackoff:
+    return ExponentialBackoff(initial=LATENCY, maximum=LATENCY, jitter=0)
+
+
+def test_budget_caps_retries_and_attempt_timeouts() -> None:
+    server = FailingServer()
+    client = NexonOpenAPI(
+        api_key="test",
+        max_retries=MAX_RETRIES,
+        backoff=backoff(),
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+    )
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_basic(ocid="ocid", budget=BUDGET)
+    server.check(time.monotonic())
+
+
+@pytest.mark.anyio
+async def test_async_budget_caps_retries_and_attempt_timeouts() -> None:
+    server = FailingServer()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        max_retries=MAX_RETRIES,
+        backoff=backoff(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+    )
+
+    with pytest.raises(InternalServerError):
+        await client.maplestory.get_character_basic(ocid="ocid", budget=BUDGET)
+    server.check(time.monotonic())
+
+
+def test_without_budget_attempts_use_the_client_timeout() -> None:
+    server = FailingServer()
+    client = NexonOpenAPI(
+        api_key="test",
+        max_retries=1,
+        timeout=7.0,
+        backoff=backoff(),
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+    )
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_basic(ocid="ocid")
+    assert [timeout["read"] for timeout in server.timeouts] == [7.0, 7.0]
+
+
+class OkServer:
+    """Answers every request at once, recording the read timeout it was sent with."""
+
+    def __init__(self) -> None:
+        self.reads: List[float] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        extensions = cast(Dict[str, Any], request.extensions)  # pyright: ignore[reportUnknownMemberType]
+        self.reads.append(extensions["timeout"]["read"])
+        return httpx.Response(200, json={"character_name": "아델"})
+
+    async def async_handler(self, request: httpx.Request) -> httpx.Response:
+        return self.handler(request)
+
+
+def test_rate_limiter_waits_longer_than_the_budget_fail_fast() -> None:
+    server = OkServer()
+    limiter = RateLimiter(rate=10, burst=1)
+    client = NexonOpenAPI(
+        api_key="test", rate_limiter=limiter, http_client=httpx.Client(transport=httpx.MockTransport(server.handler))
+    )
+    client.maplestory.get_character_basic(ocid="ocid")
+
+    # the next token is 0.1 seconds away
+    started = time.monotonic()
+    with pytest.raises(APITimeoutError):
+        client.maplestory.get_character_basic(ocid="ocid", budget=0.05)
+    assert time.monotonic() - started < 0.05
+    assert len(server.reads) == 1
+    # the token reserved for the failed request was given back
+    assert limiter.reserve("maplestory/v1/character/basic") == pytest.approx(0.1, abs=0.02)
+
+
+@pytest.mark.anyio
+async def test_async_rate_limiter_waits_within_the_budget() -> None:
+    server = OkServer()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        rate_limiter=RateLimiter(rate=10, burst=1),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.async_handler)),
+    )
+    await client.maplestory.get_character_basic(ocid="ocid")
+
+    with pytest.raises(APITimeoutError):
+        await client.maplestory.get_character_basic(ocid="ocid", budget=0.05)
+    await client.maplestory.get_character_basic(ocid="ocid", budget=1.0)
+
+    # the second request waited about 0.1 seconds for its token, its timeout is what was left of the budget
+    assert len(server.reads) == 2
+    assert server.reads[1] <= 0.92
+
+
+def test_benched_keys_longer_than_the_budget_fail_fast() -> None:
+    server = OkServer()
+    pool = APIKeyPool(["a", "b"])
+    client = NexonOpenAPI(
+        key_pool=pool, max_retries=0, http_client=httpx.Client(transport=httpx.MockTransport(server.handler))
+    )
+    pool.bench("a", 10)
+    pool.bench("b", 10)
+
+    with pytest.raises(APITimeoutError):
+        client.maplestory.get_character_basic(ocid="ocid", budget=1.0)
+    assert server.reads == []
+
+
+def test_composite_methods_pass_the_budget_on() -> None:
+    server = FailingServer()
+    client = NexonOpenAPI(
+        api_key="test",
+        max_retries=MAX_RETRIES,
+        backoff=backoff(),
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+    )
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_snapshot(ocid="ocid", include=["basic"], budget=BUDGET)
+    server.check(time.monotonic())
+
+    server = FailingServer()
+    client = NexonOpenAPI(
+        api_key="test",
+        max_retries=MAX_RETRIES,
+        backoff=backoff(),
+        http_client=httpx.Client(transport=httpx.MockTransport(server.handler)),
+    )
+    with pytest.raises(InternalServerError):
+        next(client.maplestory.iter_overall_ranking(date="2024-01-01", prefetch=1, budget=BUDGET))
+    server.check(time.monotonic())
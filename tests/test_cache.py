@@ -0,0 +1,215 @@
+import threading
+from types import SimpleNamespace
+from typing import List, Optional, cast
+from pathlib import Path
+
+import httpx
+import pytest
+from typing_extensions import override
+
+from nexon_openapi import CachePolicy, SQLiteCache, InMemoryCache, ResponseCache, CachedResponse, NexonOpenAPIAsync
+from nexon_openapi import _cache
+from nexon_openapi._cache import FOREVER
+from nexon_openapi.utils import get_latest_date_available
+
+
+class ThreadRecordingCache(ResponseCache):
+    """Wraps `cache`, recording the thread of every `get` and `set`."""
+
+    def __init__(self, cache: ResponseCache) -> None:
+        super().__init__()
+        self.cache = cache
+        self.blocking = cache.blocking
+        self.threads: List[int] = []
+
+    @override
+    def get(self, key: str) -> Optional[CachedResponse]:
+        self.threads.append(threading.get_ident())
+        return self.cache.get(key)
+
+    @override
+    def set(self, key: str, value: CachedResponse, ttl: float) -> None:
+        self.threads.append(threading.get_ident())
+        self.cache.set(key, value, ttl)
+
+    @override
+    def delete(self, key: str) -> None:
+        self.cache.delete(key)
+
+    @override
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+async def fetch_twice(cache: ResponseCache) -> int:
+    """Fetches the same character twice and returns how many requests were sent."""
+    sent = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal sent
+        sent += 1
+        return httpx.Response(200, json={"character_name": "아델"})
+
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        cache=cache,
+        cache_policy=CachePolicy(default_ttl=60),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    for _ in range(2):
+        basic = await client.maplestory.get_character_basic(ocid="ocid", date="2024-01-01")
+        assert basic.character_name == "아델"
+    return sent
+
+
+@pytest.mark.anyio
+async def test_async_client_uses_a_worker_thread_for_blocking_caches(tmp_path: Path) -> None:
+    cache = ThreadRecordingCache(SQLiteCache(tmp_path / "cache.sqlite3"))
+
+    assert await fetch_twice(cache) == 1
+    # a miss, the stored response and a hit
+    assert len(cache.threads) == 3
+    assert threading.get_ident() not in cache.threads
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.anyio
+async def test_async_client_reads_in_memory_caches_on_the_event_loop() -> None:
+    cache = ThreadRecordingCache(InMemoryCache())
+
+    assert await fetch_twice(cache) == 1
+    assert cache.threads == [threading.get_ident()] * 3
+
+
+class FakeClock:
+    """Replaces `time` in `_cache`, the time only moves forward with `advance`."""
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(_cache, "time", SimpleNamespace(monotonic=clock.time, time=clock.time))
+    return clock
+
+
+def cached(content: str) -> CachedResponse:
+    return CachedResponse(status_code=200, headers=[("content-type", "application/json")], content=content.encode())
+
+
+def test_in_memory_cache_evicts_the_least_recently_used(clock: FakeClock) -> None:
+    cache = InMemoryCache(max_size=2)
+    cache.set("a", cached("a"), FOREVER)
+    cache.set("b", cached("b"), FOREVER)
+
+    # reading `a` makes `b` the least recently used
+    assert cache.get("a") is not None
+    cache.set("c", cached("c"), FOREVER)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in ("a", "c")] == [True, True]
+
+    # replacing an entry does not evict another one
+    cache.set("a", cached("a2"), FOREVER)
+    assert len(cache) == 2
+    assert cast(CachedResponse, cache.get("a")).content == b"a2"
+
+
+def test_in_memory_cache_expires_entries(clock: FakeClock) -> None:
+    cache = InMemoryCache()
+    cache.set("a", cached("a"), 10)
+    cache.set("b", cached("b"), FOREVER)
+
+    clock.advance(9.9)
+    assert cache.get("a") is not None
+
+    clock.advance(0.1)
+    assert cache.get("a") is None
+    assert len(cache) == 1
+    assert cache.get("b") is not None
+
+    cache.delete("b")
+    assert cache.get("b") is None
+
+
+def test_in_memory_cache_validation() -> None:
+    with pytest.raises(ValueError):
+        InMemoryCache(max_size=0)
+
+
+def test_sqlite_cache_round_trip(tmp_path: Path, clock: FakeClock) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    response = CachedResponse(
+        status_code=200,
+        headers=[("content-type", "application/json"), ("x-custom", "value")],
+        content='{"character_name": "아델"}'.encode(),
+    )
+    cache.set("a", response, FOREVER)
+    cache.close()
+
+    # a new connection reads what the previous one stored
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    stored = cache.get("a")
+    assert stored is not None
+    assert (stored.status_code, stored.headers, stored.content) == (200, response.headers, response.content)
+
+    replayed = stored.to_response(httpx.Request("GET", "https://open.api.nexon.com/maplestory/v1/id"))
+    assert replayed.json() == {"character_name": "아델"}
+    assert replayed.headers["x-custom"] == "value"
+
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.close()
+
+
+def test_sqlite_cache_expires_entries(tmp_path: Path, clock: FakeClock) -> None:
+    cache = SQLiteCache(tmp_path / "cache.sqlite3")
+    cache.set("a", cached("a"), 10)
+    cache.set("b", cached("b"), 20)
+    cache.set("forever", cached("forever"), FOREVER)
+
+    clock.advance(10)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.purge_expired() == 1
+
+    clock.advance(10)
+    assert cache.purge_expired() == 1
+    assert cache.get("forever") is not None
+
+    cache.clear()
+    assert cache.get("forever") is None
+    cache.close()
+
+
+def test_cache_policy_ttls() -> None:
+    policy = CachePolicy()
+    one_day = 24 * 60 * 60
+
+    assert policy.ttl("/tfd/v1/user/basic", {}) == 600
+    assert policy.ttl("/static/tfd/meta/ko/weapon.json", {}) == 600
+    assert CachePolicy(tfd_ttl=None).ttl("/tfd/v1/user/basic", {}) is None
+
+    # the data of past days does not change anymore
+    assert policy.ttl("/maplestory/v1/character/basic", {"date": "2024-01-01"}) == FOREVER
+    latest = get_latest_date_available()
+    assert policy.ttl("/maplestory/v1/character/basic", {"date": latest}) == FOREVER
+
+    # the data of today is refreshed with the next daily update
+    for params in ({}, {"date": None}, {"date": "9999-12-31"}):
+        ttl = policy.ttl("maplestory/v1/character/basic", params)
+        assert ttl is not None
+        assert 0 < ttl <= one_day
+
+    assert policy.ttl("/fconline/v1/user/basic", {}) is None
+    assert CachePolicy(default_ttl=30).ttl("/fconline/v1/user/basic", {}) == 30
@@ -0,0 +1,229 @@
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPI, RetryBudget, CircuitBreaker, CircuitOpenError, ExponentialBackoff, _circuit
+from nexon_openapi._exceptions import InternalServerError
+
+STAT = "/maplestory/v1/character/stat"
+BASIC = "/maplestory/v1/character/basic"
+RANKING = "/maplestory/v1/ranking/overall"
+
+
+class FakeClock:
+    """Replaces `time.monotonic()` in `_circuit`, the time only moves forward with `advance`."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(_circuit, "time", SimpleNamespace(monotonic=clock.monotonic))
+    return clock
+
+
+def test_circuit_opens_half_opens_and_closes(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=0.5, min_requests=4, reset_timeout=30)
+
+    breaker.record_success(STAT)
+    breaker.record_failure(STAT)
+    breaker.record_failure(STAT)
+    assert breaker.state(STAT) == "closed"
+    breaker.before_request(STAT)
+
+    # 3 of 4 attempts failed
+    breaker.record_failure(STAT)
+    assert breaker.state(STAT) == "open"
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request(STAT)
+    assert error.value.family == "maplestory/v1/character"
+    assert error.value.retry_after == 30
+
+    clock.advance(29)
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request(STAT)
+    assert error.value.retry_after == 1
+
+    clock.advance(1)
+    assert breaker.state(STAT) == "half_open"
+    # one probe is sent, the other requests wait for it
+    breaker.before_request(STAT)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(STAT)
+
+    breaker.record_success(STAT)
+    assert breaker.state(STAT) == "closed"
+    breaker.before_request(STAT)
+    # the failures from before the circuit opened are forgotten
+    breaker.record_failure(STAT)
+    breaker.record_failure(STAT)
+    assert breaker.state(STAT) == "closed"
+
+
+def test_failed_probe_reopens_the_circuit(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=1, min_requests=1, reset_timeout=10, half_open_probes=2)
+    breaker.record_failure(STAT)
+    clock.advance(10)
+
+    breaker.before_request(STAT)
+    breaker.before_request(STAT)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(STAT)
+
+    breaker.record_failure(STAT)
+    assert breaker.state(STAT) == "open"
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request(STAT)
+    assert error.value.retry_after == 10
+
+
+def test_probes_that_never_report_back_are_replaced(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=1, min_requests=1, reset_timeout=10)
+    breaker.record_failure(STAT)
+    clock.advance(10)
+
+    breaker.before_request(STAT)
+    clock.advance(9)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(STAT)
+
+    clock.advance(1)
+    breaker.before_request(STAT)
+    assert breaker.state(STAT) == "half_open"
+
+
+def test_failures_outside_the_window_are_forgotten(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=0.5, min_requests=2, window=10)
+
+    breaker.record_failure(STAT)
+    clock.advance(11)
+    breaker.record_failure(STAT)
+
+    assert breaker.state(STAT) == "closed"
+    breaker.record_failure(STAT)
+    assert breaker.state(STAT) == "open"
+
+
+def test_circuits_are_isolated_per_endpoint_family(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=1, min_requests=2)
+
+    breaker.record_failure(STAT)
+    breaker.record_failure(RANKING)
+    assert breaker.state(STAT) == "closed"
+
+    breaker.record_failure(BASIC)
+    # the stat and basic endpoints are one family
+    assert breaker.state(STAT) == "open"
+    assert breaker.state(BASIC) == "open"
+    assert breaker.state(RANKING) == "closed"
+    breaker.before_request(RANKING)
+    breaker.before_request("/tfd/v1/user/basic")
+
+    breaker.reset()
+    assert breaker.state(STAT) == "closed"
+
+
+def test_circuit_breaker_validation() -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_ratio=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_ratio=1.5)
+    with pytest.raises(ValueError):
+        CircuitBreaker(half_open_probes=0)
+
+
+def test_retry_budget_refuses_retries_once_exhausted(clock: FakeClock) -> None:
+    budget = RetryBudget(ratio=0.5, window=10, min_retries=1)
+
+    for _ in range(4):
+        budget.record_request()
+    # max(1, 0.5 * 4) retries
+    assert budget.try_retry()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+    # the requests and retries leave the window
+    clock.advance(11)
+    assert budget.try_retry()
+    assert not budget.try_retry()
+
+
+def test_retry_budget_validation() -> None:
+    with pytest.raises(ValueError):
+        RetryBudget(ratio=-1)
+    with pytest.raises(ValueError):
+        RetryBudget(window=0)
+
+
+def failing_client(**kwargs: Any) -> Tuple[NexonOpenAPI, List[httpx.Request]]:
+    sent: List[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(500, json={"error": {"name": "OPENAPI00001", "message": "server error"}})
+
+    client = NexonOpenAPI(
+        api_key="test",
+        backoff=ExponentialBackoff(initial=0, maximum=0),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+        **kwargs,
+    )
+    return client, sent
+
+
+def test_client_fails_fast_while_the_circuit_is_open(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(failure_ratio=1, min_requests=3, reset_timeout=30)
+    client, sent = failing_client(circuit_breaker=breaker, max_retries=0)
+
+    for _ in range(3):
+        with pytest.raises(InternalServerError):
+            client.maplestory.get_character_stat(ocid="ocid")
+    assert len(sent) == 3
+
+    with pytest.raises(CircuitOpenError):
+        client.maplestory.get_character_basic(ocid="ocid")
+    assert len(sent) == 3
+
+    # another family is still sent
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_overall_ranking(date="2024-01-01")
+    assert len(sent) == 4
+
+    # the probe fails and reopens the circuit
+    clock.advance(30)
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_basic(ocid="ocid")
+    assert len(sent) == 5
+    assert breaker.state(BASIC) == "open"
+
+
+def test_client_stops_retrying_once_the_budget_is_exhausted(clock: FakeClock) -> None:
+    client, sent = failing_client(retry_budget=RetryBudget(ratio=0, min_retries=3), max_retries=2)
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_stat(ocid="ocid")
+    assert len(sent) == 3
+
+    # one retry is left
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_stat(ocid="ocid")
+    assert len(sent) == 5
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_stat(ocid="ocid")
+    assert len(sent) == 6
@@ -0,0 +1,154 @@
+from typing import Any, List
+from functools import partial
+
+import anyio
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPIAsync
+from nexon_openapi._exceptions import InternalServerError
+
+
+class HeldServer:
+    """Holds every request until `release()`, then answers it with `status_code`."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.status_code = status_code
+        self.received: List[httpx.Request] = []
+        self.released = anyio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.received.append(request)
+        await self.released.wait()
+        if self.status_code != 200:
+            return httpx.Response(self.status_code, json={"error": {"name": "OPENAPI00001", "message": "error"}})
+        # answers with the ocid as the name, to tell the responses apart
+        return httpx.Response(200, json={"character_name": request.url.params["ocid"]})
+
+    def release(self) -> None:
+        self.released.set()
+
+
+def coalescing_client(server: HeldServer) -> NexonOpenAPIAsync:
+    return NexonOpenAPIAsync(
+        api_key="test",
+        coalesce_requests=True,
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+    )
+
+
+async def wait_for(condition: Any) -> None:
+    with anyio.fail_after(1):
+        while not condition():
+            await anyio.sleep(0)
+
+
+@pytest.mark.anyio
+async def test_identical_requests_share_one_call() -> None:
+    server = HeldServer()
+    client = coalescing_client(server)
+    results: List[Any] = []
+
+    async def fetch(ocid: str) -> None:
+        results.append(await client.maplestory.get_character_basic(ocid=ocid, date="2024-01-01"))
+
+    async with anyio.create_task_group() as group:
+        for _ in range(5):
+            group.start_soon(fetch, "a")
+        group.start_soon(fetch, "b")
+        await wait_for(lambda: len(server.received) == 2)
+        assert len(client._inflight) == 2
+        server.release()
+
+    assert len(server.received) == 2
+    assert sorted(result.character_name for result in results) == ["a", "a", "a", "a", "a", "b"]
+    # every caller of a request receives the same object
+    assert len({id(result) for result in results if result.character_name == "a"}) == 1
+    assert client._inflight == {}
+
+
+@pytest.mark.anyio
+async def test_an_error_reaches_every_caller() -> None:
+    server = HeldServer(status_code=500)
+    client = coalescing_client(server)
+    errors: List[BaseException] = []
+
+    async def fetch() -> None:
+        try:
+            await client.maplestory.get_character_basic(ocid="a")
+        except InternalServerError as err:
+            errors.append(err)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(fetch)
+        await wait_for(lambda: len(server.received) == 1)
+        server.release()
+
+    assert len(server.received) == 1
+    assert len(errors) == 3
+    assert client._inflight == {}
+
+    # the failed request is not reused by the next one
+    server.status_code = 200
+    assert (await client.maplestory.get_character_basic(ocid="a")).character_name == "a"
+    assert len(server.received) == 2
+
+
+@pytest.mark.anyio
+async def test_a_cancelled_caller_does_not_cancel_the_others() -> None:
+    server = HeldServer()
+    client = coalescing_client(server)
+    results: List[Any] = []
+
+    async def fetch() -> None:
+        results.append(await client.maplestory.get_character_basic(ocid="a"))
+
+    async with anyio.create_task_group() as group:
+        async with anyio.create_task_group() as cancelled:
+            cancelled.start_soon(fetch)
+            await wait_for(lambda: len(server.received) == 1)
+            cancelled.cancel_scope.cancel()
+
+        # the request stays in flight for the remaining callers
+        assert len(client._inflight) == 1
+        group.start_soon(fetch)
+        await anyio.sleep(0.01)
+        server.release()
+
+    assert len(server.received) == 1
+    assert [result.character_name for result in results] == ["a"]
+    assert client._inflight == {}
+
+
+@pytest.mark.anyio
+async def test_in_flight_request_is_discarded_once_every_caller_is_cancelled() -> None:
+    server = HeldServer()
+    client = coalescing_client(server)
+
+    async with anyio.create_task_group() as group:
+        group.start_soon(partial(client.maplestory.get_character_basic, ocid="a"))
+        await wait_for(lambda: len(server.received) == 1)
+        group.cancel_scope.cancel()
+
+    # the call finishes on its own, and its entry is removed then
+    assert len(client._inflight) == 1
+    server.release()
+    await wait_for(lambda: client._inflight == {})
+
+
+@pytest.mark.anyio
+async def test_requests_are_not_coalesced_by_default() -> None:
+    server = HeldServer()
+    server.release()
+    client = NexonOpenAPIAsync(
+        api_key="test", http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+    )
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(partial(client.maplestory.get_character_basic, ocid="a"))
+
+    assert len(server.received) == 3
+    assert client._inflight == {}
@@ -0,0 +1,222 @@
+import time
+import asyncio
+from typing import List, Optional
+
+import anyio
+import httpx
+import pytest
+from typing_extensions import override
+
+from nexon_openapi import Hooks, RetryBudget, RateLimiter, HedgingPolicy, NexonOpenAPIAsync, ExponentialBackoff
+from nexon_openapi._exceptions import InternalServerError
+from nexon_openapi._hedging import _percentile
+
+PATH = "maplestory/v1/character/basic"
+FAST = 0.005
+SLOW = 0.1
+REQUESTS = 50
+
+
+class SlowTailServer:
+    """Answers after `FAST` seconds, except every `slow_every`th request which takes `SLOW` seconds."""
+
+    def __init__(self, slow_every: int = 10) -> None:
+        self.slow_every = slow_every
+        self.received = 0
+        self.cancelled = 0
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.received += 1
+        try:
+            await asyncio.sleep(SLOW if self.received % self.slow_every == 0 else FAST)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return httpx.Response(200, json={"character_name": "캐릭터"})
+
+    def client(self, hedging: Optional[HedgingPolicy], rate_limiter: Optional[RateLimiter] = None) -> NexonOpenAPIAsync:
+        return NexonOpenAPIAsync(
+            api_key="test",
+            hedging=hedging,
+            rate_limiter=rate_limiter,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.handler)),
+        )
+
+
+async def latencies(client: NexonOpenAPIAsync) -> List[float]:
+    samples: List[float] = []
+    for _ in range(REQUESTS):
+        started = time.monotonic()
+        await client.maplestory.get_character_basic(ocid="ocid")
+        samples.append(time.monotonic() - started)
+    return sorted(samples)
+
+
+def test_delay_is_the_percentile_of_the_recorded_latencies() -> None:
+    hedging = HedgingPolicy(percentile=95, initial_delay=1.0, min_samples=20)
+
+    for latency in range(1, 20):
+        hedging.record(PATH, latency / 1000)
+    assert hedging.delay(PATH) == 1.0
+
+    for latency in range(20, 101):
+        hedging.record(PATH, latency / 1000)
+    assert hedging.delay(PATH) == pytest.approx(0.095, abs=0.005)
+    # the delay is shared by the endpoint family
+    assert hedging.delay("maplestory/v1/character/stat") == hedging.delay(PATH)
+    assert hedging.delay("maplestory/v1/ranking/overall") == 1.0
+
+
+def test_percentile() -> None:
+    ordered = [float(value) for value in range(1, 101)]
+    assert _percentile(ordered, 50) == 50
+    assert _percentile(ordered, 99) == 99
+    assert _percentile([1.0], 99) == 1
+
+
+@pytest.mark.anyio
+async def test_hedging_cuts_the_tail_latency() -> None:
+    unhedged = await latencies(SlowTailServer().client(None))
+
+    server = SlowTailServer()
+    hedging = HedgingPolicy(percentile=80, initial_delay=2 * FAST, min_samples=5)
+    hedged = await latencies(server.client(hedging))
+
+    # the delay converged to the latency of the fast responses
+    assert hedging.delay(PATH) < SLOW / 2
+    # the slow requests were hedged and the slower of the two requests cancelled
+    assert server.received > REQUESTS
+    assert server.cancelled >= 1
+    # every tenth request is slow without hedging, the hedges answer after about twice the fast latency
+    assert unhedged[int(0.99 * REQUESTS)] >= SLOW
+    assert hedged[int(0.99 * REQUESTS)] < SLOW / 2
+    assert hedged[REQUESTS // 2] < SLOW / 2
+
+
+@pytest.mark.anyio
+async def test_no_hedge_without_rate_limiter_capacity() -> None:
+    server = SlowTailServer(slow_every=1)
+    hedging = HedgingPolicy(initial_delay=FAST)
+    # the only token is taken by the first request, the limiter has no capacity for a hedge
+    limiter = RateLimiter(rate=0.001, burst=1)
+
+    await server.client(hedging, limiter).maplestory.get_character_basic(ocid="ocid")
+
+    assert server.received == 1
+
+
+class BlockedServer:
+    """Blocks the first request until it is cancelled and answers the others at once."""
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.cancelled = anyio.Event()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.received += 1
+        if self.received == 1:
+            try:
+                await anyio.sleep_forever()
+            except asyncio.CancelledError:
+                self.cancelled.set()
+                raise
+        return httpx.Response(200, json={"character_name": "캐릭터"})
+
+
+@pytest.mark.anyio
+async def test_hedge_with_rate_limiter_capacity() -> None:
+    server = BlockedServer()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        hedging=HedgingPolicy(initial_delay=FAST),
+        rate_limiter=RateLimiter(rate=0.001, burst=2),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+    )
+
+    await client.maplestory.get_character_basic(ocid="ocid")
+
+    # the hedge answered, the blocked request is cancelled once the event loop runs it again
+    with anyio.fail_after(1):
+        await server.cancelled.wait()
+    assert server.received == 2
+
+
+class CountingRetryBudget(RetryBudget):
+    def __init__(self) -> None:
+        super().__init__()
+        self.requests = 0
+
+    @override
+    def record_request(self) -> None:
+        self.requests += 1
+        super().record_request()
+
+
+@pytest.mark.anyio
+async def test_hedge_is_one_request_of_the_retry_budget() -> None:
+    server = BlockedServer()
+    retry_budget = CountingRetryBudget()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        hedging=HedgingPolicy(initial_delay=FAST),
+        retry_budget=retry_budget,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server.handler)),
+    )
+
+    await client.maplestory.get_character_basic(ocid="ocid")
+
+    assert server.received == 2
+    assert retry_budget.requests == 1
+
+
+class AttemptHooks(Hooks):
+    def __init__(self) -> None:
+        self.attempts: List[int] = []
+        self.retries: List[int] = []
+
+    @override
+    def on_request(self, path: str, request: httpx.Request, *, attempt: int) -> None:
+        self.attempts.append(attempt)
+
+    @override
+    def on_retry(
+        self,
+        path: str,
+        request: httpx.Request,
+        *,
+        attempt: int,
+        delay: float,
+        response: Optional[httpx.Response],
+    ) -> None:
+        self.retries.append(attempt)
+
+
+@pytest.mark.anyio
+async def test_hedged_attempts_are_retried_together() -> None:
+    received = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal received
+        received += 1
+        # the first request of every round fails slowly enough to be hedged, its hedge fails at once
+        if received % 2 == 1:
+            await asyncio.sleep(SLOW)
+        return httpx.Response(500, json={"error": {"name": "OPENAPI00001", "message": "Internal server error"}})
+
+    hooks = AttemptHooks()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        max_retries=2,
+        hedging=HedgingPolicy(initial_delay=FAST),
+        backoff=ExponentialBackoff(initial=0, maximum=0, jitter=0),
+        hooks=[hooks],
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+    with pytest.raises(InternalServerError):
+        await client.maplestory.get_character_basic(ocid="ocid")
+
+    # the request and its hedge are sent once per round, the pair is retried twice
+    assert received == 6
+    assert hooks.attempts == [1, 1, 2, 2, 3, 3]
+    assert hooks.retries == [1, 2]
@@ -0,0 +1,200 @@
+import threading
+from typing import Any, List, Optional
+from typing_extensions import override
+
+import httpx
+import pytest
+
+from nexon_openapi import Name, IdIndex, NexonOpenAPI, NexonOpenAPIAsync
+
+
+def ocid_handler(requests: List[httpx.Request]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"ocid": "ocid-" + request.url.params["character_name"]})
+
+    return handler
+
+
+class ThreadRecordingIndex(IdIndex):
+    """Records the threads the database is queried on."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: List[threading.Thread] = []
+
+    @override
+    def get(self, game: str, name: str, world: Optional[str] = None) -> Optional[str]:
+        self.threads.append(threading.current_thread())
+        return super().get(game, name, world)
+
+
+def test_get_ocid_is_served_from_the_index() -> None:
+    requests: List[httpx.Request] = []
+    index = IdIndex()
+    client = NexonOpenAPI(
+        api_key="test", id_index=index, http_client=httpx.Client(transport=httpx.MockTransport(ocid_handler(requests)))
+    )
+
+    assert client.maplestory.get_ocid(character_name="a") == "ocid-a"
+    assert client.maplestory.get_ocid(character_name="a") == "ocid-a"
+
+    assert len(requests) == 1
+    assert index.get("maplestory", "a") == "ocid-a"
+    assert (index.stats.hits, index.stats.misses) == (1, 1)
+
+
+@pytest.mark.anyio
+async def test_async_index_is_queried_off_the_event_loop() -> None:
+    requests: List[httpx.Request] = []
+    index = ThreadRecordingIndex()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        id_index=index,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(ocid_handler(requests))),
+    )
+
+    assert await client.maplestory.get_ocid(character_name="a") == "ocid-a"
+    assert await client.maplestory.get_ocid(character_name="a") == "ocid-a"
+
+    assert len(requests) == 1
+    assert len(index.threads) == 2
+    assert threading.current_thread() not in index.threads
+
+
+@pytest.mark.anyio
+async def test_async_resolve_ids_yields_indexed_names_first() -> None:
+    requests: List[httpx.Request] = []
+    index = IdIndex()
+    index.set("maplestory", "b", "ocid-b")
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        id_index=index,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(ocid_handler(requests))),
+    )
+
+    results = [(result.item, result.result) async for result in client.resolve_ids("maplestory", ["a", "b", "c"])]
+
+    assert results[0] == ("b", "ocid-b")
+    assert sorted(results) == [("a", "ocid-a"), ("b", "ocid-b"), ("c", "ocid-c")]
+    assert sorted(request.url.params["character_name"] for request in requests) == ["a", "c"]
+    assert index.get_many("maplestory", ["a", "c"]) == {"a": "ocid-a", "c": "ocid-c"}
+
+
+def name_handler(requests: List[httpx.Request]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/id"):
+            return httpx.Response(200, json={"ocid": "ocid-" + request.url.params["character_name"]})
+        return httpx.Response(200, json={"character_name": request.url.params["ocid"]})
+
+    return handler
+
+
+def test_names_are_resolved_through_the_index() -> None:
+    requests: List[httpx.Request] = []
+    client = NexonOpenAPI(
+        api_key="test",
+        id_index=IdIndex(),
+        http_client=httpx.Client(transport=httpx.MockTransport(name_handler(requests))),
+    )
+
+    assert client.maplestory.get_character_basic(ocid=Name("a")).character_name == "ocid-a"
+    assert client.maplestory.get_character_basic(ocid=Name("a")).character_name == "ocid-a"
+
+    assert [request.url.path for request in requests] == [
+        "/maplestory/v1/id",
+        "/maplestory/v1/character/basic",
+        "/maplestory/v1/character/basic",
+    ]
+    assert requests[1].url.params["ocid"] == "ocid-a"
+
+
+def test_names_need_the_world_of_games_with_worlds() -> None:
+    client = NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=httpx.MockTransport(name_handler([]))))
+
+    with pytest.raises(ValueError, match="world"):
+        client.maplestorym.get_character_basic(ocid=Name("a"))
+
+    requests: List[httpx.Request] = []
+    client = NexonOpenAPI(
+        api_key="test", http_client=httpx.Client(transport=httpx.MockTransport(name_handler(requests)))
+    )
+    client.maplestorym.get_character_basic(ocid=Name("a", world="아케인"))
+    assert dict(requests[0].url.params) == {"character_name": "a", "world_name": "아케인"}
+    assert requests[1].url.params["ocid"] == "ocid-a"
+
+
+@pytest.mark.anyio
+async def test_async_names_are_resolved_through_the_index() -> None:
+    requests: List[httpx.Request] = []
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        id_index=IdIndex(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(name_handler(requests))),
+    )
+
+    assert (await client.maplestory.get_character_basic(ocid=Name("a"))).character_name == "ocid-a"
+    assert (await client.maplestory.get_character_basic(ocid=Name("a"))).character_name == "ocid-a"
+
+    assert [request.url.path for request in requests] == [
+        "/maplestory/v1/id",
+        "/maplestory/v1/character/basic",
+        "/maplestory/v1/character/basic",
+    ]
+
+
+def kartrush_handler(requests: List[httpx.Request]) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path.endswith("/id"):
+            ouid = "ouid-" + request.url.params["racer_name"]
+            return httpx.Response(
+                200, json={"ouid_info": [{"ouid": ouid, "racer_date_create": "2024-01-01", "racer_level": "100"}]}
+            )
+        return httpx.Response(200, json={"racer_name": request.url.params["ouid"]})
+
+    return handler
+
+
+def test_kartrush_names_read_the_nested_ouid() -> None:
+    requests: List[httpx.Request] = []
+    index = IdIndex()
+    client = NexonOpenAPI(
+        api_key="test",
+        id_index=index,
+        http_client=httpx.Client(transport=httpx.MockTransport(kartrush_handler(requests))),
+    )
+
+    assert client.kartrush.get_user_basic(ouid=Name("racer")).racer_name == "ouid-racer"
+    assert client.kartrush.get_user_basic(ouid=Name("racer")).racer_name == "ouid-racer"
+
+    assert [request.url.path for request in requests] == [
+        "/kartrush/v1/id",
+        "/kartrush/v1/user/basic",
+        "/kartrush/v1/user/basic",
+    ]
+    assert index.get("kartrush", "racer") == "ouid-racer"
+    assert (index.stats.hits, index.stats.misses) == (1, 1)
+
+    # the whole response of `get_ouid` is not in the index, it is always requested
+    assert client.kartrush.get_ouid(racer_name="racer").ouid_info[0].racer_level == "100"
+    assert len(requests) == 4
+
+
+@pytest.mark.anyio
+async def test_async_kartrush_resolve_ids() -> None:
+    requests: List[httpx.Request] = []
+    index = IdIndex()
+    index.set("kartrush", "b", "ouid-b")
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        id_index=index,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(kartrush_handler(requests))),
+    )
+
+    results = [(result.item, result.result) async for result in client.resolve_ids("kartrush", ["a", "b"])]
+
+    assert sorted(results) == [("a", "ouid-a"), ("b", "ouid-b")]
+    assert [request.url.params["racer_name"] for request in requests] == ["a"]
+    assert index.get("kartrush", "a") == "ouid-a"
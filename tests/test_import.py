@@ -0,0 +1,51 @@
+import os
+import sys
+import json
+import subprocess
+from typing import List
+
+import nexon_openapi
+
+# modules that only some users need, `import nexon_openapi` must not pay for them
+LAZY_MODULES = [
+    "nexon_openapi.resources",
+    "nexon_openapi.resources._maplestory",
+    "nexon_openapi.resources._the_first_descendant",
+    "nexon_openapi._replay",
+    "nexon_openapi._metrics",
+    "nexon_openapi._tracing",
+    "nexon_openapi._key_pool",
+    "nexon_openapi._hedging",
+    "sqlite3",
+    "concurrent.futures.thread",
+    "opentelemetry",
+]
+
+
+def imported_modules(code: str) -> List[str]:
+    """The modules of `LAZY_MODULES` imported after running `code` in a new interpreter."""
+    script = f"import sys, json\n{code}\nprint(json.dumps([name for name in {LAZY_MODULES!r} if name in sys.modules]))"
+    # the directory the package is imported from here, e.g. `src/`
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(nexon_openapi.__file__))}
+    output = subprocess.run([sys.executable, "-c", script], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+def test_import_does_not_load_the_optional_features() -> None:
+    assert imported_modules("import nexon_openapi") == []
+
+
+def test_client_construction_does_not_load_the_resources() -> None:
+    assert imported_modules("import nexon_openapi\nnexon_openapi.NexonOpenAPI(api_key='test')") == []
+    assert imported_modules("import nexon_openapi\nnexon_openapi.NexonOpenAPIAsync(api_key='test')") == []
+
+
+def test_resources_are_loaded_on_first_access() -> None:
+    code = "import nexon_openapi\nnexon_openapi.NexonOpenAPI(api_key='test').tfd"
+    assert imported_modules(code) == ["nexon_openapi.resources", "nexon_openapi.resources._the_first_descendant"]
+
+
+def test_lazy_names_are_importable() -> None:
+    for name in nexon_openapi._LAZY_IMPORTS:
+        assert getattr(nexon_openapi, name) is not None
+    assert "SQLiteCache" in dir(nexon_openapi)
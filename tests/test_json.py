@@ -0,0 +1,57 @@
+import json
+from typing import Any, List
+
+import pytest
+
+from nexon_openapi._json import JSONDecoder, stdlib_json_loads, default_json_decoder
+
+SAMPLES: List[Any] = [
+    {"ocid": "e0a4f439e53c369866b55297d2f5f4eb"},
+    {
+        "date": "2024-01-01T00:00+09:00",
+        "character_name": "캐릭터",
+        "world_name": "스카니아",
+        "character_level": 280,
+        "character_exp": 9_223_372_036_854_775_807,
+        "character_exp_rate": "10.000",
+        "character_guild_name": None,
+        "access_flag": "true",
+    },
+    {"final_stat": [{"stat_name": "최소 스탯공격력", "stat_value": "1234567"}], "remain_ap": 0},
+    {"ranking": [{"ranking": index + 1, "character_level": 300 - index, "rate": index / 7} for index in range(200)]},
+    [{"tradeDate": "2024-01-01T00:00:00", "saleSn": "0123456789abcdef", "spid": 101000001, "value": 1.5e10}],
+    {"escapes": 'tab\t newline\n quote" backslash\\ é 😀', "empty": {}, "list": [], "flag": False},
+    {"numbers": [0, -1, 1.0, -0.5, 1e-7, 3.141592653589793, 123456789012345678]},
+]
+
+
+def decoders() -> List[Any]:
+    params: List[Any] = [pytest.param(stdlib_json_loads, id="stdlib")]
+    try:
+        import orjson
+    except ImportError:
+        params.append(pytest.param(None, id="orjson", marks=pytest.mark.skip(reason="orjson is not installed")))
+    else:
+        params.append(pytest.param(orjson.loads, id="orjson"))
+    try:
+        import msgspec
+    except ImportError:
+        params.append(pytest.param(None, id="msgspec", marks=pytest.mark.skip(reason="msgspec is not installed")))
+    else:
+        params.append(pytest.param(msgspec.json.decode, id="msgspec"))
+    return params
+
+
+@pytest.mark.parametrize("decode", decoders())
+@pytest.mark.parametrize("sample", SAMPLES)
+def test_decodes_like_json_loads(decode: JSONDecoder, sample: Any) -> None:
+    for content in (json.dumps(sample), json.dumps(sample, ensure_ascii=False)):
+        # repr() tells 1 from 1.0 and True from 1
+        assert repr(decode(content.encode())) == repr(json.loads(content))
+
+
+def test_default_decoder_decodes_like_json_loads() -> None:
+    decode = default_json_decoder()
+    for sample in SAMPLES:
+        content = json.dumps(sample, ensure_ascii=False).encode()
+        assert repr(decode(content)) == repr(json.loads(content))
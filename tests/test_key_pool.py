@@ -0,0 +1,183 @@
+from types import SimpleNamespace
+from typing import List, Tuple
+
+import httpx
+import pytest
+
+from nexon_openapi import (
+    APIKeyPool,
+    NexonOpenAPI,
+    TokenBucket,
+    ExponentialBackoff,
+    _key_pool,
+    _rate_limit,
+    _base_client,
+)
+from nexon_openapi._exceptions import RateLimitError
+
+
+class FakeClock:
+    """Replaces `time` in the key pool, its rate limiters and the client, the time only moves forward with
+    `advance` and `sleep`."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    fake = SimpleNamespace(monotonic=clock.monotonic, time=clock.time, sleep=clock.sleep)
+    for module in (_key_pool, _rate_limit, _base_client):
+        monkeypatch.setattr(module, "time", fake)
+    return clock
+
+
+def test_keys_take_turns(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b", "c"])
+
+    keys: List[str] = []
+    for _ in range(6):
+        key, delay = pool.checkout()
+        assert delay == 0
+        keys.append(key)
+        clock.advance(0.01)
+
+    assert keys == ["a", "b", "c", "a", "b", "c"]
+    assert pool.requests() == {"a": 2, "b": 2, "c": 2}
+
+
+def test_key_with_the_most_tokens_left_is_picked(clock: FakeClock) -> None:
+    pool = APIKeyPool({"a": TokenBucket(rate=10, burst=1), "b": TokenBucket(rate=10, burst=3)})
+
+    assert [pool.checkout()[0] for _ in range(3)] == ["b", "b", "a"]
+    # every key waits for its own quota
+    assert pool.checkout() == ("b", 0)
+    assert pool.checkout() == ("a", pytest.approx(0.1))
+
+
+def test_benched_key_is_skipped_until_its_bench_is_over(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b"])
+
+    pool.bench("a", 30)
+    assert pool.benched_keys() == ["a"]
+    assert pool.has_active_key()
+    assert [pool.checkout()[0] for _ in range(3)] == ["b", "b", "b"]
+
+    clock.advance(30)
+    assert pool.benched_keys() == []
+    assert pool.checkout()[0] == "a"
+
+
+def test_every_key_benched_waits_for_the_first_one_back(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b"])
+
+    pool.bench("a", 20)
+    pool.bench("b", 5)
+    assert not pool.has_active_key()
+    assert pool.checkout() == ("b", 5)
+
+    # a shorter bench does not end a longer one
+    pool.bench("a", 1)
+    clock.advance(5)
+    assert pool.checkout() == ("b", 0)
+    assert pool.benched_keys() == ["a"]
+
+
+def test_key_pool_validation() -> None:
+    with pytest.raises(ValueError):
+        APIKeyPool([])
+
+
+def pooled_client(pool: APIKeyPool, limited: Tuple[str, ...]) -> Tuple[NexonOpenAPI, List[str]]:
+    """A client whose requests with the keys in `limited` receive a `429` response."""
+    used: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = request.headers["x-nxopen-api-key"]
+        used.append(key)
+        if key in limited:
+            return httpx.Response(
+                429,
+                headers={"retry-after": "30"},
+                json={"error": {"name": "OPENAPI00007", "message": "rate limited"}},
+            )
+        return httpx.Response(200, json={"character_name": key})
+
+    client = NexonOpenAPI(
+        key_pool=pool,
+        max_retries=2,
+        backoff=ExponentialBackoff(initial=1, maximum=1, jitter=0),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+    return client, used
+
+
+def get_character(client: NexonOpenAPI) -> str:
+    return client.maplestory.get_character_basic(ocid="ocid").character_name or ""
+
+
+def test_client_rotates_the_keys(clock: FakeClock) -> None:
+    client, used = pooled_client(APIKeyPool(["a", "b", "c"]), limited=())
+
+    for _ in range(3):
+        get_character(client)
+        clock.advance(0.01)
+
+    assert used == ["a", "b", "c"]
+
+
+def test_client_retries_with_another_key_after_a_429(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b"])
+    client, used = pooled_client(pool, limited=("a",))
+
+    assert get_character(client) == "b"
+    assert used == ["a", "b"]
+    # another key has quota left, the retry is not delayed
+    assert clock.slept == [0]
+
+    # the key cools down for Retry-After seconds
+    assert pool.benched_keys() == ["a"]
+    clock.advance(29)
+    assert get_character(client) == "b"
+    clock.advance(1)
+    assert pool.benched_keys() == []
+
+
+def test_client_waits_for_a_key_when_every_key_is_cooling_down(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b"])
+    pool.bench("a", 10)
+    pool.bench("b", 5)
+    client, used = pooled_client(pool, limited=())
+
+    assert get_character(client) == "b"
+    assert clock.slept == [5]
+    assert used == ["b"]
+
+
+def test_client_backs_off_once_every_key_is_rate_limited(clock: FakeClock) -> None:
+    pool = APIKeyPool(["a", "b"])
+    client, used = pooled_client(pool, limited=("a", "b"))
+
+    with pytest.raises(RateLimitError):
+        get_character(client)
+
+    # the first 429 rotates to the other key, the second one waits for Retry-After
+    assert used == ["a", "b", "a"]
+    assert clock.slept == [0, 30]
+    # the bench of the other key was over by the last attempt
+    assert pool.benched_keys() == ["a"]
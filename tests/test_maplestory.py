@@ -0,0 +1,82 @@
+import json
+import time
+import threading
+from typing import Any, List
+
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPI, NexonOpenAPIAsync
+
+BASIC = {
+    "date": "2024-01-01T00:00+09:00",
+    "character_name": "캐릭터",
+    "world_name": "스카니아",
+    "character_gender": "남",
+    "character_class": "히어로",
+    "character_class_level": "6",
+    "character_level": 280,
+    "character_exp": 1_000_000,
+    "character_exp_rate": "10.000",
+    "character_guild_name": None,
+    "character_image": "https://open.api.nexon.com/static/maplestory/character/look/example",
+    "character_date_create": "2020-01-01T00:00+09:00",
+    "access_flag": "true",
+    "liberation_quest_clear_flag": "true",
+}
+
+
+def recording_handler(requests: List[httpx.Request], body: Any) -> Any:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=json.dumps(body).encode(), headers={"content-type": "application/json"})
+
+    return handler
+
+
+def test_get_character_basic_sends_date() -> None:
+    requests: List[httpx.Request] = []
+    transport = httpx.MockTransport(recording_handler(requests, BASIC))
+    client = NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=transport))
+
+    basic = client.maplestory.get_character_basic(ocid="ocid", date="2024-01-01")
+
+    assert basic.character_name == "캐릭터"
+    assert dict(requests[0].url.params) == {"ocid": "ocid", "date": "2024-01-01"}
+
+
+@pytest.mark.anyio
+async def test_async_get_character_basic_sends_date() -> None:
+    requests: List[httpx.Request] = []
+    transport = httpx.MockTransport(recording_handler(requests, BASIC))
+    client = NexonOpenAPIAsync(api_key="test", http_client=httpx.AsyncClient(transport=transport))
+
+    basic = await client.maplestory.get_character_basic(ocid="ocid", date="2024-01-01")
+
+    assert basic.character_name == "캐릭터"
+    assert dict(requests[0].url.params) == {"ocid": "ocid", "date": "2024-01-01"}
+
+
+def test_get_character_snapshot_limits_concurrency() -> None:
+    lock = threading.Lock()
+    in_flight: List[int] = [0]
+    peak: List[int] = [0]
+    paths: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            paths.append(request.url.path)
+        time.sleep(0.01)
+        with lock:
+            in_flight[0] -= 1
+        return httpx.Response(200, content=json.dumps(BASIC).encode(), headers={"content-type": "application/json"})
+
+    client = NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    include: List[Any] = ["basic", "popularity", "stat", "hyper_stat", "propensity", "ability"]
+    snapshot = client.maplestory.get_character_snapshot(ocid="ocid", include=include, concurrency=2)
+
+    assert snapshot.basic is not None and snapshot.basic.character_name == "캐릭터"
+    assert len(paths) == len(include)
+    assert peak[0] == 2
@@ -0,0 +1,155 @@
+import math
+import random
+from typing import List
+
+import httpx
+import pytest
+
+from nexon_openapi import (
+    NexonOpenAPI,
+    EndpointMetrics,
+    LatencyHistogram,
+    MetricsCollector,
+    ExponentialBackoff,
+    route_family,
+)
+from nexon_openapi._exceptions import InternalServerError
+
+
+def exact_percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(percentile / 100 * len(ordered))) - 1]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_percentiles_are_accurate_to_one_sixty_fourth(seed: int) -> None:
+    rng = random.Random(seed)
+    # from microseconds to minutes, in whole microseconds
+    samples = [round(rng.lognormvariate(-3, 2.5), 6) for _ in range(20_000)]
+    histogram = LatencyHistogram()
+    for sample in samples:
+        histogram.record(sample)
+
+    for percentile in (1, 10, 25, 50, 75, 90, 95, 99, 99.9, 100):
+        exact = exact_percentile(samples, percentile)
+        assert histogram.percentile(percentile) == pytest.approx(exact, rel=1 / 64, abs=1e-6)
+
+    assert histogram.count == len(samples)
+    assert histogram.max == pytest.approx(max(samples), abs=1e-6)
+    assert histogram.mean == pytest.approx(sum(samples) / len(samples))
+
+
+def test_small_durations_are_exact() -> None:
+    histogram = LatencyHistogram()
+    for micros in range(1, 101):
+        histogram.record(micros / 1_000_000 + 1e-9)
+
+    assert histogram.percentile(50) == 50 / 1_000_000
+    assert histogram.percentile(99) == 99 / 1_000_000
+
+
+def test_empty_histogram() -> None:
+    histogram = LatencyHistogram()
+
+    assert histogram.percentile(99) == 0
+    assert histogram.max == 0
+    assert histogram.mean == 0
+
+
+def test_merge_is_the_same_as_recording_everything_once() -> None:
+    rng = random.Random(7)
+    samples = [rng.uniform(0.001, 2) for _ in range(1_000)]
+    first, second, everything = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for index, sample in enumerate(samples):
+        (first if index % 3 else second).record(sample)
+        everything.record(sample)
+
+    merged = first.copy()
+    merged.merge(second)
+
+    assert merged.count == everything.count
+    assert merged.total == pytest.approx(everything.total)
+    assert merged.max == everything.max
+    for percentile in (50, 90, 99):
+        assert merged.percentile(percentile) == everything.percentile(percentile)
+    # the copy is independent of the histogram it was made from
+    assert first.count == len(samples) - len(samples[::3])
+
+
+def test_endpoint_metrics_merge() -> None:
+    first, second = EndpointMetrics(), EndpointMetrics()
+    first.requests, first.retries, first.status_codes, first.errors = 2, 1, {200: 1, 500: 1}, {"E": 1}
+    second.requests, second.cache_hits, second.status_codes, second.errors = 3, 4, {200: 3}, {"E": 2, "F": 1}
+    second.latency.record(0.5)
+
+    first.merge(second)
+
+    assert (first.requests, first.retries, first.cache_hits) == (5, 1, 4)
+    assert first.status_codes == {200: 4, 500: 1}
+    assert first.errors == {"E": 3, "F": 1}
+    assert first.latency.count == 1
+
+
+def metrics_client(metrics: MetricsCollector) -> NexonOpenAPI:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/stat"):
+            return httpx.Response(500, json={"error": {"name": "OPENAPI00001", "message": "server error"}})
+        return httpx.Response(200, json={"character_name": "name"})
+
+    return NexonOpenAPI(
+        api_key="test",
+        hooks=[metrics],
+        max_retries=1,
+        backoff=ExponentialBackoff(initial=0, maximum=0),
+        http_client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_collector_records_every_endpoint() -> None:
+    metrics = MetricsCollector()
+    client = metrics_client(metrics)
+
+    client.maplestory.get_character_basic(ocid="ocid")
+    client.maplestory.get_character_basic(ocid="ocid")
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_stat(ocid="ocid")
+    client.maplestory.get_overall_ranking(date="2024-01-01")
+
+    endpoints = metrics.endpoints()
+    basic = endpoints["maplestory/v1/character/basic"]
+    assert (basic.requests, basic.retries, basic.status_codes) == (2, 0, {200: 2})
+    assert basic.latency.count == 2
+    assert basic.parse.count == 2
+
+    stat = endpoints["maplestory/v1/character/stat"]
+    assert (stat.requests, stat.retries, stat.status_codes) == (2, 1, {500: 2})
+    assert stat.errors == {"InternalServerError": 1}
+
+    # the endpoints are a snapshot
+    basic.requests = 100
+    assert metrics.endpoints()["maplestory/v1/character/basic"].requests == 2
+
+
+def test_endpoints_are_merged_per_family() -> None:
+    metrics = MetricsCollector()
+    client = metrics_client(metrics)
+
+    client.maplestory.get_character_basic(ocid="ocid")
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_stat(ocid="ocid")
+    client.maplestory.get_overall_ranking(date="2024-01-01")
+
+    families = metrics.endpoints(family=route_family)
+
+    assert sorted(families) == ["maplestory/v1/character", "maplestory/v1/ranking"]
+    character = families["maplestory/v1/character"]
+    assert (character.requests, character.retries) == (3, 1)
+    assert character.status_codes == {200: 1, 500: 2}
+    assert character.latency.count == 3
+    assert families["maplestory/v1/ranking"].requests == 1
+    # merging does not change the endpoints
+    assert metrics.endpoints()["maplestory/v1/character/basic"].requests == 1
+
+    assert "maplestory/v1/character" in metrics.report(family=route_family)
+    metrics.reset()
+    assert metrics.endpoints() == {}
@@ -0,0 +1,307 @@
+import datetime
+from typing import Any, Dict, List, Tuple, Union, Mapping, Optional
+
+import pytest
+import pydantic
+from pydantic import Field
+
+from nexon_openapi import _models
+from nexon_openapi._compat import (
+    PYDANTIC_V2,
+    get_args,
+    is_union,
+    get_origin,
+    is_literal_type,
+    get_model_config,
+    get_model_fields,
+    field_get_default,
+    field_outer_type,
+)
+from nexon_openapi._models import BaseModel, validate_type, construct_type
+from nexon_openapi.utils import is_list, is_mapping
+from nexon_openapi.resources._maplestory import MapleStoryCharacterItemEquipment
+from nexon_openapi.resources._the_first_descendant import TFDWeaponMetadata
+
+# a constructed model, described by its class, field values, set fields and extra keys
+Described = Tuple[type, Dict[str, Any], List[str], Dict[str, Any]]
+
+
+def describe(value: object) -> Any:
+    """`value` with every model replaced by its `Described` tuple, so that constructions can be compared."""
+    if isinstance(value, pydantic.BaseModel):
+        names = get_model_fields(type(value))
+        fields = {name: describe(value.__dict__[name]) for name in names}
+        extra = value.__pydantic_extra__ if PYDANTIC_V2 else {k: v for k, v in value.__dict__.items() if k not in names}
+        return (type(value), fields, sorted(set(value.model_fields_set) & set(names)), describe(extra or {}))
+    if is_list(value):
+        return [describe(entry) for entry in value]
+    if is_mapping(value):
+        return {key: describe(item) for key, item in value.items()}
+    return value
+
+
+def baseline_construct(model: Any, values: Mapping[str, object]) -> Described:
+    """`BaseModel.construct` before the plans were compiled, reflecting on the model for every call."""
+    config = get_model_config(model)
+    populate_by_name = config.get("populate_by_name") if PYDANTIC_V2 else config.allow_population_by_field_name
+
+    fields: Dict[str, Any] = {}
+    fields_set: List[str] = []
+    model_fields = get_model_fields(model)
+    for name, field in model_fields.items():
+        key = field.alias
+        if key is None or (key not in values and populate_by_name):
+            key = name
+
+        if key in values:
+            value = values[key]
+            fields[name] = field_get_default(field) if value is None else baseline(value, field_outer_type(field))
+            fields_set.append(name)
+        else:
+            fields[name] = field_get_default(field)
+
+    extra = {key: value for key, value in values.items() if key not in model_fields}
+    return (model, fields, sorted(fields_set), extra)
+
+
+def baseline(value: object, type_: Any) -> Any:
+    """`construct_type` before the constructors were compiled, introspecting `type_` for every value."""
+    origin = get_origin(type_) or type_
+    args = get_args(type_)
+
+    if is_union(origin):
+        try:
+            return describe(validate_type(type_=type_, value=value))
+        except Exception:
+            pass
+
+        for variant in args:
+            try:
+                return baseline(value, variant)
+            except Exception:
+                continue
+
+        raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
+
+    if origin == dict:
+        if not is_mapping(value):
+            return value
+        return {key: baseline(item, args[1]) for key, item in value.items()}
+
+    if not is_literal_type(type_) and issubclass(origin, pydantic.BaseModel):
+        if is_list(value):
+            return [baseline_construct(type_, entry) if is_mapping(entry) else entry for entry in value]
+        if is_mapping(value):
+            return baseline_construct(type_, value)
+
+    if origin == list:
+        if not is_list(value):
+            return value
+        return [baseline(entry, args[0]) for entry in value]
+
+    if origin == float:
+        if isinstance(value, int) and float(value) == value:
+            return float(value)
+        return value
+
+    # the date branches of the old implementation never parsed anything, the strings were returned as-is
+    return value
+
+
+def assert_constructs_like_the_baseline(value: object, type_: Any) -> None:
+    assert describe(construct_type(value=value, type_=type_)) == baseline(value, type_)
+    # again, from the cached constructors and plans
+    assert describe(construct_type(value=value, type_=type_)) == baseline(value, type_)
+
+
+class Stat(BaseModel):
+    stat_type: str
+    stat_value: float
+
+
+class Weapon(BaseModel):
+    weapon_name: str
+    stats: List[Stat]
+    stats_by_level: Dict[str, List[Stat]] = {}
+    perk: Optional[Stat] = None
+    tier: Union[int, str] = 0
+
+
+class Aliased(BaseModel):
+    if PYDANTIC_V2:
+        model_config = pydantic.ConfigDict(extra="allow", populate_by_name=True)
+    else:
+
+        class Config(pydantic.BaseConfig):  # pyright: ignore[reportDeprecated, reportIncompatibleVariableOverride]
+            extra: Any = pydantic.Extra.allow  # type: ignore
+            allow_population_by_field_name: bool = True
+
+    weapon_id: str = Field(alias="weaponId")
+    weapon_tier: Optional[str] = Field(None, alias="weaponTier")
+
+
+class Dated(BaseModel):
+    date: datetime.date
+    date_create: datetime.datetime
+    date_expire: Optional[datetime.datetime] = None
+
+
+def item_equipment(index: int) -> Dict[str, Any]:
+    option = {"str": "10", "dex": "0", "int": "0", "luk": "0", "max_hp": "0", "max_mp": "0"}
+    option.update(attack_power=str(index), magic_power="0", armor="0", speed="0", jump="0")
+    return {
+        "item_equipment_part": "무기",
+        "equipment_slot": "무기",
+        "item_name": f"item{index}",
+        "item_icon": "",
+        "item_description": None,
+        "item_shape_name": f"item{index}",
+        "item_shape_icon": "",
+        "item_gender": None,
+        "potential_option_grade": "레전드리",
+        "equipment_level_increase": 0,
+        "growth_exp": 0,
+        "growth_level": 0,
+        "starforce": "22",
+        "special_ring_level": 0,
+        "date_expire": None,
+        "item_total_option": {**option, "boss_damage": "30", "ignore_monster_armor": "10", "all_stat": "6"},
+        "item_base_option": {**option, "base_equipment_level": 200},
+        "item_exceptional_option": option,
+        "item_add_option": {**option, "equipment_level_decrease": 0},
+        "item_etc_option": option,
+        "item_starforce_option": option,
+        "not_documented": [index],
+    }
+
+
+def test_item_equipment_constructs_like_the_baseline() -> None:
+    equipment = [item_equipment(index) for index in range(3)]
+    payload = {
+        "date": None,
+        "character_gender": "남",
+        "character_class": "히어로",
+        "preset_no": 1,
+        "item_equipment": equipment,
+        "item_equipment_preset1": equipment[:1],
+        "title": {"title_name": "칭호", "title_icon": "", "title_description": ["설명"], "date_expire": None},
+        "dragon_equipment": [],
+        "mechanic_equipment": "not a list",
+    }
+
+    assert_constructs_like_the_baseline(payload, MapleStoryCharacterItemEquipment)
+    assert_constructs_like_the_baseline([payload, payload], List[MapleStoryCharacterItemEquipment])
+
+
+def test_weapon_metadata_constructs_like_the_baseline() -> None:
+    weapons = [
+        {
+            "weapon_name": f"weapon{index}",
+            "weapon_id": str(index),
+            "base_stat": [{"stat_type": "105000026", "stat_value": index}],
+            "firearm_atk": [
+                {"level": 1, "firearm": [{"firearm_atk_type": "105000026", "firearm_atk_value": 100}]},
+                {"level": 2, "firearm": None},
+            ],
+            "weapon_perk_ability_name": None,
+        }
+        for index in range(5)
+    ]
+
+    assert_constructs_like_the_baseline(weapons, List[TFDWeaponMetadata])
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"weapon_name": "a", "stats": [{"stat_type": "atk", "stat_value": 1}], "perk": {"stat_type": "crit"}},
+        {"weapon_name": "a", "stats": [], "perk": None, "tier": "ultimate"},
+        {"weapon_name": "a", "stats": [], "perk": "not a stat", "tier": ["invalid"]},
+        {"weapon_name": "a", "stats": {"not": "a list"}, "stats_by_level": {"1": [{"stat_value": 2}], "2": None}},
+        {"stats_by_level": "not a dict", "unknown": {"extra": 1}},
+    ],
+)
+def test_nested_optional_and_union_fields_construct_like_the_baseline(value: Dict[str, Any]) -> None:
+    assert_constructs_like_the_baseline(value, Weapon)
+
+
+@pytest.mark.parametrize(
+    "value, type_",
+    [
+        (1, float),
+        (1.5, float),
+        (2**53 + 1, float),
+        ({"a": 1, "b": 2.5}, Dict[str, float]),
+        ({"a": [{"stat_value": 1}]}, Dict[str, List[Stat]]),
+        ([[1], [2, None]], List[List[Optional[float]]]),
+        ([{"stat_type": "atk"}, "not a stat"], List[Stat]),
+        ("not a list", List[Stat]),
+        ({"stat_type": "atk"}, Optional[Stat]),
+        ("1", Union[int, str]),
+        ({"unknown": 1}, Union[Stat, List[Stat]]),
+        ([{"unknown": 1}], Union[Stat, List[Stat]]),
+    ],
+)
+def test_values_construct_like_the_baseline(value: object, type_: Any) -> None:
+    assert_constructs_like_the_baseline(value, type_)
+
+
+def test_aliases_construct_like_the_baseline() -> None:
+    for value in (
+        {"weaponId": "1", "weaponTier": "궁극"},
+        {"weapon_id": "1", "weapon_tier": "궁극"},
+        {"weaponId": "1", "weapon_id": "2"},
+        {"weaponId": "1", "weaponTier": None, "unknown": "extra"},
+    ):
+        assert_constructs_like_the_baseline(value, Aliased)
+
+    aliased = construct_type(value={"weaponId": "1", "unknown": "extra"}, type_=Aliased)
+    assert isinstance(aliased, Aliased)
+    assert aliased.weapon_id == "1"
+    assert aliased.model_fields_set == {"weapon_id"}
+    assert getattr(aliased, "unknown") == "extra"
+
+
+def test_datetime_strings_are_kept_like_the_baseline() -> None:
+    value = {"date": "2024-01-01", "date_create": "2024-01-01T00:00:00+09:00", "date_expire": "2024-02-01T00:00:00"}
+    assert_constructs_like_the_baseline(value, Dated)
+
+    dated = construct_type(value=value, type_=Dated)
+    assert isinstance(dated, Dated)
+    assert dated.date == "2024-01-01"  # type: ignore[comparison-overlap]
+    assert dated.date_create == "2024-01-01T00:00:00+09:00"  # type: ignore[comparison-overlap]
+    # union values are validated, which parses them
+    assert dated.date_expire == datetime.datetime(2024, 2, 1)
+
+
+def test_constructors_and_plans_are_cached_per_type() -> None:
+    construct_type(value=[{"stat_type": "atk"}], type_=List[Stat])
+    constructor = _models._get_constructor(List[Stat])
+    plan = _models._model_plan(Stat)
+
+    construct_type(value=[{"stat_type": "atk"}], type_=List[Stat])
+    assert _models._get_constructor(List[Stat]) is constructor
+    assert _models._model_plan(Stat) is plan
+    assert _models._get_constructor(Dict[str, Stat]) is not constructor
+
+    # subclasses have plans of their own, with the fields they add
+    option = MapleStoryCharacterItemEquipment.ItemExceptionalOption
+    etc_option = MapleStoryCharacterItemEquipment.ItemEtcOption
+    assert _models._model_plan(option) is not _models._model_plan(etc_option)
+    assert "armor" not in _models._model_plan(option).field_names
+    assert "armor" in _models._model_plan(etc_option).field_names
+
+
+def test_union_constructors_keep_the_order_of_the_variants() -> None:
+    class First(BaseModel):
+        first: int
+
+    class Second(BaseModel):
+        second: int
+
+    # `Union[First, Second] == Union[Second, First]`, the cache must not mix them up
+    first_or_second: Any = Union[First, Second]
+    second_or_first: Any = Union[Second, First]
+    assert isinstance(construct_type(value={"unknown": 1}, type_=first_or_second), First)
+    assert isinstance(construct_type(value={"unknown": 1}, type_=second_or_first), Second)
+    assert_constructs_like_the_baseline({"unknown": 1}, second_or_first)
@@ -0,0 +1,221 @@
+import time
+import random
+import asyncio
+import threading
+from typing import Dict, List, Tuple, Optional, Generator, AsyncGenerator, cast
+
+import pytest
+
+from nexon_openapi._pagination import iter_pages, aiter_pages, iter_cursor_chains, aiter_cursor_chains
+
+
+def _is_empty(page: List[int]) -> bool:
+    return not page
+
+
+# a page of a cursor chain is `(key, index)`, its cursor is the index of the next page
+_Page = Tuple[str, int]
+
+# the number of pages of the chain of each key
+_CHAINS = {"a": 3, "b": 1, "c": 5, "d": 2, "e": 4}
+_ALL_PAGES = [(key, index) for key, length in _CHAINS.items() for index in range(length)]
+
+
+def _next_cursor(page: _Page) -> Optional[str]:
+    key, index = page
+    return str(index + 1) if index + 1 < _CHAINS.get(key, 1_000_000) else None
+
+
+class TestIterPages:
+    def test_yields_pages_in_order(self) -> None:
+        def fetch_page(page: int) -> List[int]:
+            # later pages often finish first
+            time.sleep(random.uniform(0, 0.005))
+            return [page]
+
+        pages = list(iter_pages(fetch_page, _is_empty, start=3, end=40, prefetch=8))
+        assert pages == [[page] for page in range(3, 40)]
+
+    def test_stops_at_first_empty_page(self) -> None:
+        fetched: List[int] = []
+
+        def fetch_page(page: int) -> List[int]:
+            fetched.append(page)
+            return [] if page == 4 else [page]
+
+        pages = list(iter_pages(fetch_page, _is_empty, prefetch=3))
+        assert pages == [[1], [2], [3]]
+        # the pages fetched ahead of the empty page are discarded, no more are requested
+        assert max(fetched) <= 4 + 3
+
+    def test_consumer_breaking_stops_prefetching(self) -> None:
+        fetched: List[int] = []
+        lock = threading.Lock()
+
+        def fetch_page(page: int) -> List[int]:
+            with lock:
+                fetched.append(page)
+            return [page]
+
+        iterator = cast(Generator[List[int], None, None], iter_pages(fetch_page, _is_empty, prefetch=4))
+        assert next(iterator) == [1]
+        iterator.close()
+
+        count = len(fetched)
+        time.sleep(0.01)
+        assert len(fetched) == count
+        assert max(fetched) <= 1 + 4
+
+    def test_rejects_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_pages(lambda page: [page], _is_empty, prefetch=0))
+        with pytest.raises(ValueError):
+            list(iter_pages(lambda page: [page], _is_empty, start=0))
+
+
+class TestAsyncIterPages:
+    @pytest.mark.anyio
+    async def test_yields_pages_in_order(self) -> None:
+        async def fetch_page(page: int) -> List[int]:
+            await asyncio.sleep(random.uniform(0, 0.005))
+            return [page]
+
+        pages = [page async for page in aiter_pages(fetch_page, _is_empty, start=3, end=40, prefetch=8)]
+        assert pages == [[page] for page in range(3, 40)]
+
+    @pytest.mark.anyio
+    async def test_stops_at_first_empty_page(self) -> None:
+        async def fetch_page(page: int) -> List[int]:
+            return [] if page == 4 else [page]
+
+        pages = [page async for page in aiter_pages(fetch_page, _is_empty, prefetch=3)]
+        assert pages == [[1], [2], [3]]
+
+    @pytest.mark.anyio
+    async def test_consumer_breaking_cancels_prefetched_pages(self) -> None:
+        started: List[int] = []
+        cancelled: List[int] = []
+
+        async def fetch_page(page: int) -> List[int]:
+            started.append(page)
+            if page == 1:
+                return [page]
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(page)
+                raise
+            return [page]
+
+        iterator = cast(AsyncGenerator[List[int], None], aiter_pages(fetch_page, _is_empty, prefetch=4))
+        async for page in iterator:
+            assert page == [1]
+            break
+        await iterator.aclose()
+        # let the cancelled tasks run
+        await asyncio.sleep(0)
+
+        # page 5 was requested right before page 1 was yielded, its task is cancelled before it starts
+        assert sorted(cancelled) == [2, 3, 4]
+        assert sorted(started) == [1, 2, 3, 4]
+
+
+class TestIterCursorChains:
+    def test_yields_chains_in_key_order(self) -> None:
+        def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            time.sleep(random.uniform(0, 0.005))
+            return key, int(cursor or 0)
+
+        pages = list(iter_cursor_chains(fetch_page, _next_cursor, _CHAINS, concurrency=3, buffer=1))
+        assert pages == _ALL_PAGES
+
+    def test_raises_the_error_of_a_chain_in_order(self) -> None:
+        def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            if key == "c" and cursor == "2":
+                raise RuntimeError("page c2")
+            return key, int(cursor or 0)
+
+        pages: List[_Page] = []
+        with pytest.raises(RuntimeError, match="page c2"):
+            for page in iter_cursor_chains(fetch_page, _next_cursor, _CHAINS, concurrency=4):
+                pages.append(page)
+        assert pages == [("a", 0), ("a", 1), ("a", 2), ("b", 0), ("c", 0), ("c", 1)]
+
+    def test_consumer_breaking_stops_and_drains_the_crawlers(self) -> None:
+        fetched: Dict[str, int] = {}
+        lock = threading.Lock()
+
+        def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            with lock:
+                fetched[key] = fetched.get(key, 0) + 1
+            return key, int(cursor or 0)
+
+        # endless chains, the crawlers are blocked on their full queues when the consumer stops
+        iterator = cast(
+            Generator[_Page, None, None],
+            iter_cursor_chains(fetch_page, _next_cursor, ["x", "y", "z"], concurrency=2, buffer=1),
+        )
+        assert [next(iterator) for _ in range(3)] == [("x", 0), ("x", 1), ("x", 2)]
+
+        started = time.monotonic()
+        iterator.close()
+        assert time.monotonic() - started < 1
+
+        total = sum(fetched.values())
+        time.sleep(0.01)
+        assert sum(fetched.values()) == total
+        # only the chains within `concurrency` were started, each a few pages ahead at most
+        assert set(fetched) == {"x", "y"}
+        assert fetched["y"] <= 3
+
+    def test_rejects_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            list(iter_cursor_chains(lambda key, cursor: (key, 0), _next_cursor, _CHAINS, concurrency=0))
+        with pytest.raises(ValueError):
+            list(iter_cursor_chains(lambda key, cursor: (key, 0), _next_cursor, _CHAINS, buffer=0))
+
+
+class TestAsyncIterCursorChains:
+    @pytest.mark.anyio
+    async def test_yields_chains_in_key_order(self) -> None:
+        async def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            await asyncio.sleep(random.uniform(0, 0.005))
+            return key, int(cursor or 0)
+
+        pages = [page async for page in aiter_cursor_chains(fetch_page, _next_cursor, _CHAINS, concurrency=3, buffer=1)]
+        assert pages == _ALL_PAGES
+
+    @pytest.mark.anyio
+    async def test_raises_the_error_of_a_chain_in_order(self) -> None:
+        async def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            if key == "c" and cursor == "2":
+                raise RuntimeError("page c2")
+            return key, int(cursor or 0)
+
+        pages: List[_Page] = []
+        with pytest.raises(RuntimeError, match="page c2"):
+            async for page in aiter_cursor_chains(fetch_page, _next_cursor, _CHAINS, concurrency=4):
+                pages.append(page)
+        assert pages == [("a", 0), ("a", 1), ("a", 2), ("b", 0), ("c", 0), ("c", 1)]
+
+    @pytest.mark.anyio
+    async def test_consumer_breaking_cancels_the_crawlers(self) -> None:
+        fetched: Dict[str, int] = {}
+
+        async def fetch_page(key: str, cursor: Optional[str]) -> _Page:
+            fetched[key] = fetched.get(key, 0) + 1
+            await asyncio.sleep(0)
+            return key, int(cursor or 0)
+
+        iterator = cast(
+            AsyncGenerator[_Page, None],
+            aiter_cursor_chains(fetch_page, _next_cursor, ["x", "y", "z"], concurrency=2, buffer=1),
+        )
+        assert [await iterator.__anext__() for _ in range(3)] == [("x", 0), ("x", 1), ("x", 2)]
+        await iterator.aclose()
+
+        total = sum(fetched.values())
+        await asyncio.sleep(0.01)
+        assert sum(fetched.values()) == total
+        assert set(fetched) == {"x", "y"}
+        assert fetched["y"] <= 3
@@ -0,0 +1,115 @@
+import json
+import threading
+from types import SimpleNamespace
+from typing import Any, Iterator, cast
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from typing_extensions import override
+
+from nexon_openapi import NexonOpenAPI, NexonOpenAPIAsync
+from nexon_openapi._pool import pool_stats
+
+
+class CharacterHandler(BaseHTTPRequestHandler):
+    # keeps the connection alive between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps({"character_name": "아델"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    @override
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def base_url() -> Iterator[str]:
+    # kept alive connections are served by their own threads, which do not hold up `shutdown()`
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CharacterHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_pool_stats_of_a_kept_alive_connection(base_url: str) -> None:
+    client = NexonOpenAPI(api_key="test", base_url=base_url)
+    stats = client.pool_stats()
+    assert stats is not None
+    assert (stats.connections, stats.idle, stats.active, stats.waiting, stats.http2) == (0, 0, 0, 0, 0)
+
+    client.maplestory.get_character_basic(ocid="ocid")
+
+    stats = client.pool_stats()
+    assert stats is not None
+    assert (stats.connections, stats.idle, stats.active, stats.waiting, stats.http2) == (1, 1, 0, 0, 0)
+
+
+def test_warmup_opens_connections(base_url: str) -> None:
+    client = NexonOpenAPI(api_key="test", base_url=base_url)
+
+    client.warmup()
+
+    stats = client.pool_stats()
+    assert stats is not None
+    assert stats.connections == 1
+
+
+def test_no_pool_stats_without_a_connection_pool() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200))
+    assert NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=transport)).pool_stats() is None
+
+
+def fake_client(*requests: object) -> Any:
+    connection = SimpleNamespace(is_closed=lambda: False, is_idle=lambda: False, info=lambda: "'x', HTTP/2, ACTIVE")
+    return cast(
+        Any,
+        SimpleNamespace(
+            _transport=SimpleNamespace(_pool=SimpleNamespace(connections=[connection], _requests=list(requests)))
+        ),
+    )
+
+
+def test_pool_stats_count_the_queued_requests() -> None:
+    queued = SimpleNamespace(is_queued=lambda: True)
+    sent = SimpleNamespace(is_queued=lambda: False)
+
+    stats = pool_stats(fake_client(queued, queued, sent))
+
+    assert stats is not None
+    assert (stats.connections, stats.active, stats.waiting, stats.http2) == (1, 1, 2, 1)
+
+
+def test_pool_stats_without_queued_requests_of_older_httpcore() -> None:
+    # httpcore before 1.0 keeps a `RequestStatus` per request, which does not tell whether it is queued
+    stats = pool_stats(fake_client(SimpleNamespace(request=None, connection=None)))
+
+    assert stats is not None
+    assert stats.waiting is None
+    assert stats.connections == 1
+
+
+def test_http2_is_opt_in() -> None:
+    pool: Any = getattr(NexonOpenAPI(api_key="test")._client, "_transport")._pool
+    assert pool._http2 is False
+
+    client = NexonOpenAPIAsync(api_key="test", http2=True, keepalive_expiry=30)
+    pool = getattr(client._client, "_transport")._pool
+    assert pool._http2 is True
+    assert pool._keepalive_expiry == 30
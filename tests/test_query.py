@@ -0,0 +1,63 @@
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPI
+from nexon_openapi._models import FinalRequestOptions
+from nexon_openapi._base_client import _merge_mappings
+
+PARAMS = [
+    {"character_name": "아델"},
+    {"character_name": "아 델", "world_name": "스카니아"},
+    {"character_name": "a+b", "guild_name": "a b+c"},
+    {"character_name": "&=?#/%:;,@!$'()*~[]"},
+    {"character_name": "%20%2B", "date": "2024-01-01"},
+    {"skill_name": ["보스 킬러", "a+b", None, "c,d"], "ocid": "ocid"},
+    {"date": None, "ocid": "ocid", "page": 1, "ranked": True, "score": 1.5},
+    {"date": None},
+    {"dotted": {"key": "a b", "list": ["1", "2"]}},
+]
+
+
+def httpx_url(client: NexonOpenAPI, options: FinalRequestOptions) -> httpx.URL:
+    """The URL of `options` with the query merged by httpx, as `_build_request` did before it appended it itself."""
+    params: Any = _merge_mappings(client._custom_query, options.params)
+    query = client.qs.stringify(params) if params else None
+    return httpx.Client().build_request(options.method, client._prepare_url(options.url), params=query).url
+
+
+@pytest.mark.parametrize("params", PARAMS)
+@pytest.mark.parametrize(
+    "client",
+    [
+        NexonOpenAPI(api_key="test"),
+        NexonOpenAPI(api_key="test", base_url="https://example.com/proxy/"),
+        NexonOpenAPI(api_key="test", default_query={"lang": "ko kr", "page": None}),
+    ],
+    ids=["default", "base url with a path", "default query"],
+)
+def test_query_is_encoded_like_httpx(client: NexonOpenAPI, params: Dict[str, Any]) -> None:
+    options = FinalRequestOptions.construct(method="get", url="/maplestory/v1/id", params=params)
+
+    url = client._build_request(options).url
+
+    expected = httpx_url(client, options)
+    assert url == expected
+    assert url.raw_path == expected.raw_path
+
+
+def test_query_encoding() -> None:
+    client = NexonOpenAPI(api_key="test")
+    options = FinalRequestOptions.construct(
+        method="get",
+        url="/maplestory/v1/id",
+        params={"character_name": "아 델+", "skill_name": ["a b", None, "c"], "date": None},
+    )
+
+    url = client._build_request(options).url
+
+    assert url.raw_path == b"/maplestory/v1/id?character_name=%EC%95%84%20%EB%8D%B8%2B&skill_name=a%20b%2Cc"
+    assert url.params["character_name"] == "아 델+"
+    assert url.params["skill_name"] == "a b,c"
+    assert "date" not in url.params
@@ -0,0 +1,270 @@
+import os
+import sys
+import threading
+import subprocess
+from types import SimpleNamespace
+from typing import List, Tuple, Callable
+from pathlib import Path
+
+import pytest
+
+import nexon_openapi
+from nexon_openapi import RateLimiter, TokenBucket, RedisTokenBucket, SharedTokenBucket, _rate_limit
+
+
+class FakeClock:
+    """Replaces `time` in `_rate_limit`, the time only moves forward with `advance` and `sleep`."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(_rate_limit, "time", SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+
+def test_bucket_refills_at_its_rate_up_to_its_burst(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=10, burst=5)
+    assert bucket.balance == 5
+
+    for _ in range(5):
+        assert bucket.reserve() == 0
+    assert bucket.available == 0
+
+    clock.advance(0.25)
+    assert bucket.balance == pytest.approx(2.5)
+    assert bucket.reserve(2) == 0
+    assert bucket.balance == pytest.approx(0.5)
+
+    clock.advance(60)
+    assert bucket.balance == 5
+
+
+def test_reservations_queue_behind_each_other(clock: FakeClock) -> None:
+    bucket = TokenBucket(rate=10, burst=1)
+
+    assert bucket.reserve() == 0
+    # every caller is told to wait until its own token is refilled
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+    assert bucket.balance == pytest.approx(-2)
+    assert bucket.available == 0
+
+    clock.advance(0.2)
+    assert bucket.balance == pytest.approx(0)
+    assert bucket.reserve() == pytest.approx(0.1)
+
+    # a caller that gives up hands its token to the next one
+    bucket.refund()
+    assert bucket.reserve() == pytest.approx(0.1)
+
+
+def test_default_burst() -> None:
+    assert TokenBucket(rate=450).burst == 450
+    assert TokenBucket(rate=0.5).burst == 1
+
+
+def test_bucket_validation() -> None:
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0.5)
+
+
+def test_limiter_validation() -> None:
+    with pytest.raises(ValueError):
+        RateLimiter()
+    with pytest.raises(ValueError):
+        RateLimiter(rate=1, bucket=TokenBucket(rate=1))
+
+    assert RateLimiter(routes={"maplestory/*": TokenBucket(rate=1)}).reserve("/maplestory/v1/id") == 0
+    # paths matching no route are not limited
+    assert RateLimiter(routes={"maplestory/*": TokenBucket(rate=1)}).reserve("/tfd/v1/id") == 0
+
+
+def test_longest_route_prefix_wins(clock: FakeClock) -> None:
+    character = TokenBucket(rate=1, burst=1)
+    stat = TokenBucket(rate=1, burst=1)
+    limiter = RateLimiter(
+        rate=100,
+        routes={"maplestory/v1/character/*": character, "/maplestory/v1/character/stat": stat},
+    )
+
+    assert limiter.reserve("/maplestory/v1/character/stat") == 0
+    assert stat.available == 0
+    assert character.available == 1
+
+    assert limiter.reserve("/maplestory/v1/character/basic") == 0
+    assert character.available == 0
+    assert limiter.reserve("/maplestory/v1/character/basic") == pytest.approx(1)
+    assert limiter.reserve("/maplestory/v1/character/stat") == pytest.approx(1)
+
+
+def test_shared_bucket_limits_every_route(clock: FakeClock) -> None:
+    ranking = TokenBucket(rate=100, burst=100)
+    limiter = RateLimiter(rate=1, burst=2, routes={"maplestory/v1/ranking/*": ranking})
+
+    assert limiter.reserve("/maplestory/v1/ranking/overall") == 0
+    assert limiter.reserve("/maplestory/v1/id") == 0
+    # the route bucket has tokens left, the shared one does not
+    assert limiter.reserve("/maplestory/v1/ranking/overall") == pytest.approx(1)
+
+
+def test_has_capacity_takes_no_token(clock: FakeClock) -> None:
+    ranking = TokenBucket(rate=1, burst=1)
+    limiter = RateLimiter(rate=10, burst=2, routes={"maplestory/v1/ranking/*": ranking})
+
+    assert limiter.has_capacity("/maplestory/v1/ranking/overall")
+    assert limiter.has_capacity("/maplestory/v1/ranking/overall")
+    limiter.reserve("/maplestory/v1/ranking/overall")
+
+    assert not limiter.has_capacity("/maplestory/v1/ranking/overall")
+    assert limiter.has_capacity("/maplestory/v1/id")
+    limiter.reserve("/maplestory/v1/id")
+    assert not limiter.has_capacity("/maplestory/v1/id")
+
+    clock.advance(1)
+    assert limiter.has_capacity("/maplestory/v1/ranking/overall")
+
+
+def test_acquire_waits_for_the_token(clock: FakeClock) -> None:
+    limiter = RateLimiter(rate=10, burst=1)
+
+    assert limiter.acquire("/maplestory/v1/id")
+    assert limiter.acquire("/maplestory/v1/id")
+    assert clock.slept == [pytest.approx(0.1)]
+
+
+def test_acquire_gives_up_without_taking_a_token(clock: FakeClock) -> None:
+    route = TokenBucket(rate=10, burst=1)
+    limiter = RateLimiter(rate=10, burst=1, routes={"maplestory/*": route})
+    assert limiter.acquire("/maplestory/v1/id")
+
+    assert not limiter.acquire("/maplestory/v1/id", timeout=0.05)
+    assert clock.slept == []
+    # both tokens were refunded
+    assert limiter.reserve("/maplestory/v1/id") == pytest.approx(0.1)
+    assert route.balance == pytest.approx(-1)
+
+
+@pytest.mark.anyio
+async def test_aacquire_gives_up_without_taking_a_token() -> None:
+    limiter = RateLimiter(rate=1, burst=1)
+
+    assert await limiter.aacquire("/maplestory/v1/id", timeout=0)
+    assert not await limiter.aacquire("/maplestory/v1/id", timeout=0.5)
+    assert limiter.has_capacity("/maplestory/v1/id") is False
+    assert limiter.reserve("/maplestory/v1/id") == pytest.approx(1, abs=0.05)
+
+
+def reserve_in_processes(path: str, processes: int, tokens: int) -> None:
+    """Reserve `tokens` tokens one by one from the shared bucket at `path` in every one of `processes` new processes."""
+    script = (
+        "import sys\n"
+        "from nexon_openapi import SharedTokenBucket\n"
+        "bucket = SharedTokenBucket(sys.argv[1], rate=0.001, burst=10)\n"
+        f"for _ in range({tokens}):\n"
+        "    bucket.reserve()\n"
+        "bucket.close()\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(nexon_openapi.__file__))}
+    children = [subprocess.Popen([sys.executable, "-c", script, path], env=env) for _ in range(processes)]
+    assert [child.wait(timeout=30) for child in children] == [0] * processes
+
+
+def test_shared_bucket_is_shared_by_processes(tmp_path: Path) -> None:
+    path = str(tmp_path / "bucket")
+    bucket = SharedTokenBucket(path, rate=0.001, burst=10)
+    try:
+        reserve_in_processes(path, processes=2, tokens=100)
+
+        # no reservation was lost between the processes, and this one waits behind them
+        assert bucket.balance == pytest.approx(-190, abs=0.1)
+        assert bucket.reserve() == pytest.approx(191 / 0.001, rel=0.01)
+        bucket.refund()
+        assert not RateLimiter(bucket=bucket).has_capacity("/maplestory/v1/id")
+    finally:
+        bucket.close()
+
+
+def test_shared_bucket_keeps_the_state_of_the_file(tmp_path: Path) -> None:
+    first = SharedTokenBucket(tmp_path / "bucket", rate=0.001, burst=10)
+    first.reserve(4)
+    first.close()
+
+    second = SharedTokenBucket(tmp_path / "bucket", rate=0.001, burst=10)
+    try:
+        assert second.balance == pytest.approx(6, abs=0.1)
+    finally:
+        second.close()
+
+
+class FakeRedis:
+    """A `register_script()` whose scripts keep the balance of a single bucket that is never refilled."""
+
+    def __init__(self, balance: float) -> None:
+        self.balance = balance
+        self.scripts: List[str] = []
+        self.calls: List[Tuple[List[str], List[str]]] = []
+        self.threads: List[int] = []
+
+    def register_script(self, script: str) -> Callable[..., str]:
+        self.scripts.append(script)
+
+        def run(keys: List[str], args: List[str]) -> str:
+            self.calls.append((keys, args))
+            self.threads.append(threading.get_ident())
+            self.balance -= float(args[2])
+            return repr(self.balance)
+
+        return run
+
+
+def test_redis_bucket_runs_its_script() -> None:
+    redis = FakeRedis(balance=1.5)
+    bucket = RedisTokenBucket(redis, "nexon-openapi:bucket", rate=10, burst=2)
+
+    assert redis.scripts == [_rate_limit._REDIS_RESERVE]
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.05)
+    assert bucket.balance == pytest.approx(-0.5)
+    bucket.refund()
+
+    assert redis.calls == [
+        (["nexon-openapi:bucket"], ["10", "2", "1.0"]),
+        (["nexon-openapi:bucket"], ["10", "2", "1.0"]),
+        (["nexon-openapi:bucket"], ["10", "2", "0.0"]),
+        (["nexon-openapi:bucket"], ["10", "2", "-1.0"]),
+    ]
+    assert redis.balance == pytest.approx(0.5)
+
+
+@pytest.mark.anyio
+async def test_aacquire_reserves_io_buckets_on_a_worker_thread() -> None:
+    redis = FakeRedis(balance=1)
+    limiter = RateLimiter(rate=100, routes={"maplestory/*": RedisTokenBucket(redis, "bucket", rate=10, burst=1)})
+
+    assert await limiter.aacquire("/maplestory/v1/id", timeout=1)
+    assert await limiter.ahas_capacity("/maplestory/v1/id") is False
+    assert not await limiter.aacquire("/maplestory/v1/id", timeout=0)
+    # a reservation, a balance, and the reservation that is given back
+    assert len(redis.threads) == 4
+    assert threading.get_ident() not in redis.threads
+
+    # buckets without I/O are used on the event loop
+    assert await RateLimiter(rate=100).aacquire("/maplestory/v1/id")
+    assert await RateLimiter(rate=100).ahas_capacity("/maplestory/v1/id")
@@ -0,0 +1,176 @@
+import os
+from typing import Any, List
+from pathlib import Path
+
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPI, NexonOpenAPIAsync, ReplayTransport, RecordingTransport
+from nexon_openapi._exceptions import RateLimitError, BadRequestError, InternalServerError
+
+# recorded with a `RecordingTransport`
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures", "replay")
+OCID = "e0a4f439e53c369866b55297d2f5f4eb"
+OUID = "c8b3a6c7e2d94f1b9a0e5d7f3b2c1a40"
+
+
+def replay(**kwargs: Any) -> ReplayTransport:
+    return ReplayTransport(FIXTURES, **kwargs)
+
+
+def client(transport: ReplayTransport) -> NexonOpenAPI:
+    return NexonOpenAPI(api_key="offline", max_retries=0, http_client=httpx.Client(transport=transport))
+
+
+def async_client(transport: ReplayTransport) -> NexonOpenAPIAsync:
+    return NexonOpenAPIAsync(api_key="offline", max_retries=0, http_client=httpx.AsyncClient(transport=transport))
+
+
+def test_replays_maplestory_recordings() -> None:
+    maplestory = client(replay()).maplestory
+
+    ocid = maplestory.get_ocid(character_name="아델")
+    basic = maplestory.get_character_basic(ocid=ocid, date="2024-01-01")
+    stat = maplestory.get_character_stat(ocid=ocid, date="2024-01-01")
+    ranking = maplestory.get_overall_ranking(date="2024-01-01", page=1)
+
+    assert ocid == OCID
+    assert (basic.character_name, basic.character_level, basic.character_guild_name) == ("아델", 285, "리더")
+    assert stat.character_class == "아델"
+    assert [row.character_name for row in ranking.ranking] == ["아델", "칼리"]
+
+
+@pytest.mark.anyio
+async def test_async_replays_maplestory_recordings() -> None:
+    maplestory = async_client(replay()).maplestory
+
+    ocid = await maplestory.get_ocid(character_name="아델")
+    basic = await maplestory.get_character_basic(ocid=ocid, date="2024-01-01")
+    stat = await maplestory.get_character_stat(ocid=ocid, date="2024-01-01")
+
+    assert ocid == OCID
+    assert (basic.character_name, basic.character_level) == ("아델", 285)
+    assert stat.character_class == "아델"
+
+
+def test_replays_fc_online_recordings() -> None:
+    fc_online = client(replay()).fc_online
+
+    ouid = fc_online.get_ouid(nickname="감독")
+    basic = fc_online.get_user_basic(ouid=ouid)
+    history = fc_online.get_user_trade_history(ouid=ouid, tradetype="buy", offset=0, limit=2)
+
+    assert ouid == OUID
+    assert (basic.nickname, basic.level) == ("감독", 120)
+    assert [trade.saleSn for trade in history.trades] == ["a1", "a2"]
+
+
+@pytest.mark.anyio
+async def test_async_replays_fc_online_recordings() -> None:
+    fc_online = async_client(replay()).fc_online
+
+    ouid = await fc_online.get_ouid(nickname="감독")
+    basic = await fc_online.get_user_basic(ouid=ouid)
+
+    assert ouid == OUID
+    assert basic.nickname == "감독"
+
+
+def test_unrecorded_requests_are_rejected() -> None:
+    transport = replay()
+
+    with pytest.raises(BadRequestError):
+        client(transport).maplestory.get_character_basic(ocid="unknown", date="2024-01-01")
+    assert transport.status_counts() == {400: 1}
+
+
+def test_generated_ranking_pages_copy_the_recorded_rows() -> None:
+    transport = replay(ranking_size=500)
+
+    rows = list(client(transport).maplestory.iter_overall_ranking(date="2024-01-01", prefetch=2))
+
+    # the recorded first page, then 200 and 100 generated rows, then an empty page
+    assert len(rows) == 2 + 300
+    assert [row.ranking for row in rows[2:]] == list(range(201, 501))
+    assert {row.character_name for row in rows} == {"아델", "칼리"}
+
+
+@pytest.mark.anyio
+async def test_async_generated_ranking_pages_without_recordings() -> None:
+    transport = ReplayTransport(ranking_size=450)
+
+    rows = [row async for row in async_client(transport).maplestory.iter_overall_ranking(date="2024-01-01")]
+
+    assert [row.ranking for row in rows] == list(range(1, 451))
+    assert rows[0].character_name == "character0"
+
+
+def test_generated_starforce_history_follows_the_cursors() -> None:
+    transport = ReplayTransport(starforce_size=25)
+
+    history = client(transport).maplestory.iter_starforce_history(
+        start_date="2024-01-01", end_date="2024-01-03", count=10
+    )
+    ids: List[str] = [event.id for event in history]
+
+    # 3 pages of 10, 10 and 5 events per day, the days in order
+    assert ids == [f"{date}-{index}" for date in ("2024-01-01", "2024-01-02", "2024-01-03") for index in range(25)]
+    assert transport.status_counts() == {200: 9}
+
+
+@pytest.mark.anyio
+async def test_async_generated_starforce_history_follows_the_cursors() -> None:
+    transport = ReplayTransport(starforce_size=25)
+
+    history = async_client(transport).maplestory.iter_starforce_history(
+        start_date="2024-01-01", end_date="2024-01-02", count=10
+    )
+    ids: List[str] = [event.id async for event in history]
+
+    assert ids == [f"{date}-{index}" for date in ("2024-01-01", "2024-01-02") for index in range(25)]
+
+
+def test_generated_fc_online_history_pages() -> None:
+    fc_online = client(replay(history_size=30)).fc_online
+
+    trades = fc_online.get_user_trade_history(ouid=OUID, tradetype="buy", offset=20, limit=20).trades
+    matches = fc_online.get_user_match_history(ouid=OUID, matchtype=50, offset=0, limit=100).matches
+
+    # the generated trades copy the recorded ones, up to `history_size`
+    assert len(trades) == 10
+    assert {trade.spid for trade in trades} == {300158023, 101000251}
+    assert len(set(trade.saleSn for trade in trades)) == 10
+    assert len(matches) == 30
+
+
+def test_errors_and_rate_limits_are_injected() -> None:
+    transport = replay(error_rate=0.5, seed=0)
+    maplestory = client(transport).maplestory
+
+    for _ in range(20):
+        try:
+            maplestory.get_ocid(character_name="아델")
+        except InternalServerError:
+            pass
+
+    counts = transport.status_counts()
+    assert set(counts) == {200, 500}
+    assert counts[200] + counts[500] == 20
+
+    transport = replay(rate_limit=1)
+    maplestory = client(transport).maplestory
+    maplestory.get_ocid(character_name="아델")
+    for _ in range(2):
+        with pytest.raises(RateLimitError):
+            maplestory.get_ocid(character_name="아델")
+    assert transport.status_counts() == {200: 1, 429: 2}
+
+
+def test_recordings_are_replayed(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"ocid": "ocid-" + request.url.params["character_name"]})
+
+    recorder = RecordingTransport(tmp_path, httpx.MockTransport(handler))
+    NexonOpenAPI(api_key="test", http_client=httpx.Client(transport=recorder)).maplestory.get_ocid(character_name="a")
+
+    assert client(ReplayTransport(tmp_path)).maplestory.get_ocid(character_name="a") == "ocid-a"
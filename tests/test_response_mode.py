@@ -0,0 +1,148 @@
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from typing_extensions import Literal, assert_type
+
+from nexon_openapi import NexonOpenAPI, NexonOpenAPIAsync, RawResponse, ResponseMode
+from nexon_openapi.resources._fc_online import (
+    FCOnlineUserBasic,
+    FCOnlineUserMaxDivision,
+    FCOnlineUserMatchHistory,
+    FCOnlineUserTradeHistory,
+)
+
+OUID = "c8b3a6c7e2d94f1b9a0e5d7f3b2c1a40"
+MODES = ["model", "dict", "raw"]
+
+BASIC = {"ouid": OUID, "nickname": "감독", "level": 120}
+DIVISION = {"matchType": 50, "division": 800, "achievementDate": "2024-01-01T00:00:00"}
+TRADE = {"tradeDate": "2024-01-01T00:00:00", "saleSn": "a1", "grade": 5, "spid": 300158023, "value": 1000}
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path.endswith("/user/match"):
+        return httpx.Response(200, json=["match-1", "match-2"])
+    if request.url.path.endswith("/user/trade"):
+        return httpx.Response(200, json=[TRADE])
+    if request.url.path.endswith("/user/maxdivision"):
+        return httpx.Response(200, json=[DIVISION])
+    return httpx.Response(200, json=BASIC)
+
+
+async def async_handler(request: httpx.Request) -> httpx.Response:
+    return handler(request)
+
+
+def http_client() -> httpx.Client:
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def async_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(async_handler))
+
+
+def client(response_mode: ResponseMode) -> NexonOpenAPI[ResponseMode]:
+    return NexonOpenAPI(api_key="test", response_mode=response_mode, http_client=http_client())
+
+
+def async_client(response_mode: ResponseMode) -> NexonOpenAPIAsync[ResponseMode]:
+    return NexonOpenAPIAsync(api_key="test", response_mode=response_mode, http_client=async_http_client())
+
+
+@pytest.mark.parametrize("response_mode", MODES)
+def test_fc_online_histories_are_models_in_every_mode(response_mode: ResponseMode) -> None:
+    for fc_online in (
+        client(response_mode).fc_online,
+        client("model").with_options(response_mode=response_mode).fc_online,
+    ):
+        matches = fc_online.get_user_match_history(ouid=OUID, matchtype=50)
+        trades = fc_online.get_user_trade_history(ouid=OUID, tradetype="buy")
+
+        assert isinstance(matches, FCOnlineUserMatchHistory)
+        assert matches.matches == ["match-1", "match-2"]
+        assert isinstance(trades, FCOnlineUserTradeHistory)
+        assert [trade.saleSn for trade in trades.trades] == ["a1"]
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("response_mode", MODES)
+async def test_async_fc_online_histories_are_models_in_every_mode(response_mode: ResponseMode) -> None:
+    fc_online = async_client(response_mode).fc_online
+
+    matches = await fc_online.get_user_match_history(ouid=OUID, matchtype=50)
+    trades = await fc_online.get_user_trade_history(ouid=OUID, tradetype="buy")
+
+    assert isinstance(matches, FCOnlineUserMatchHistory)
+    assert matches.matches == ["match-1", "match-2"]
+    assert isinstance(trades, FCOnlineUserTradeHistory)
+    assert [trade.saleSn for trade in trades.trades] == ["a1"]
+
+
+def test_model_mode() -> None:
+    client = NexonOpenAPI(api_key="test", http_client=http_client())
+    assert_type(client, NexonOpenAPI[Literal["model"]])
+
+    basic = assert_type(client.fc_online.get_user_basic(ouid=OUID), FCOnlineUserBasic)
+    divisions = assert_type(client.fc_online.get_user_max_division(ouid=OUID), List[FCOnlineUserMaxDivision])
+
+    assert basic.nickname == "감독"
+    assert divisions[0].division == 800
+
+
+def test_dict_mode() -> None:
+    client = NexonOpenAPI(api_key="test", response_mode="dict", http_client=http_client())
+    assert_type(client, NexonOpenAPI[Literal["dict"]])
+
+    basic = assert_type(client.fc_online.get_user_basic(ouid=OUID), Dict[str, Any])
+    divisions = assert_type(client.fc_online.get_user_max_division(ouid=OUID), List[Any])
+
+    assert basic == BASIC
+    assert divisions == [DIVISION]
+
+
+def test_raw_mode() -> None:
+    client = NexonOpenAPI(api_key="test", response_mode="raw", http_client=http_client())
+    assert_type(client, NexonOpenAPI[Literal["raw"]])
+
+    basic = assert_type(client.fc_online.get_user_basic(ouid=OUID), RawResponse)
+    divisions = assert_type(client.fc_online.get_user_max_division(ouid=OUID), RawResponse)
+
+    assert isinstance(basic, RawResponse)
+    assert basic.status_code == 200
+    assert basic.json() == BASIC
+    assert isinstance(divisions, RawResponse)
+    assert divisions.json() == [DIVISION]
+
+
+def test_with_options_changes_the_mode() -> None:
+    client = NexonOpenAPI(api_key="test", http_client=http_client())
+
+    as_dict = assert_type(client.with_options(response_mode="dict"), NexonOpenAPI[Literal["dict"]])
+    as_raw = assert_type(as_dict.with_options(response_mode="raw"), NexonOpenAPI[Literal["raw"]])
+    with_budget = assert_type(as_dict.with_options(budget=1.0), NexonOpenAPI[Literal["dict"]])
+
+    assert assert_type(as_dict.fc_online.get_user_basic(ouid=OUID), Dict[str, Any]) == BASIC
+    assert isinstance(assert_type(as_raw.fc_online.get_user_basic(ouid=OUID), RawResponse), RawResponse)
+    assert with_budget.response_mode == "dict"
+    assert with_budget.budget == 1.0
+    # the copies do not change the client they were made from
+    assert isinstance(client.fc_online.get_user_basic(ouid=OUID), FCOnlineUserBasic)
+
+
+@pytest.mark.anyio
+async def test_async_modes() -> None:
+    client = NexonOpenAPIAsync(api_key="test", http_client=async_http_client())
+    as_dict = NexonOpenAPIAsync(api_key="test", response_mode="dict", http_client=async_http_client())
+    as_raw = client.with_options(response_mode="raw")
+
+    basic = assert_type(await client.fc_online.get_user_basic(ouid=OUID), FCOnlineUserBasic)
+    basic_dict = assert_type(await as_dict.fc_online.get_user_basic(ouid=OUID), Dict[str, Any])
+    divisions_dict = assert_type(await as_dict.fc_online.get_user_max_division(ouid=OUID), List[Any])
+    basic_raw = assert_type(await as_raw.fc_online.get_user_basic(ouid=OUID), RawResponse)
+
+    assert basic.nickname == "감독"
+    assert basic_dict == BASIC
+    assert divisions_dict == [DIVISION]
+    assert isinstance(basic_raw, RawResponse)
+    assert basic_raw.json() == BASIC
@@ -0,0 +1,162 @@
+from typing import Any, List, Tuple
+
+import httpx
+import pytest
+
+from nexon_openapi import NexonOpenAPI, NexonOpenAPIAsync, InMemoryCache, CachePolicy, OpenTelemetryTracing
+from nexon_openapi import ExponentialBackoff
+from nexon_openapi._exceptions import InternalServerError
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.trace import SpanKind, StatusCode  # noqa: E402
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+
+PATH = "maplestory/v1/character/basic"
+CALL = f"GET {PATH}"
+BODY = {"character_name": "캐릭터", "world_name": "스카니아", "character_level": 280}
+
+
+def tracing() -> Tuple[OpenTelemetryTracing, InMemorySpanExporter]:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return OpenTelemetryTracing(tracer_provider=provider), exporter
+
+
+def flaky_handler(statuses: List[int]) -> Any:
+    """Answers with the next status of `statuses`, then with `200`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status_code = statuses.pop(0) if statuses else 200
+        if status_code != 200:
+            return httpx.Response(status_code, json={"error": {"name": "OPENAPI00001", "message": "error"}})
+        return httpx.Response(200, json=BODY)
+
+    return handler
+
+
+def backoff() -> ExponentialBackoff:
+    return ExponentialBackoff(initial=0.01, maximum=0.01, jitter=0)
+
+
+def by_name(spans: Tuple[ReadableSpan, ...], name: str) -> List[ReadableSpan]:
+    return [span for span in spans if span.name == name]
+
+
+def check_retried_call(spans: Tuple[ReadableSpan, ...]) -> None:
+    (call,) = by_name(spans, CALL)
+    assert call.kind == SpanKind.CLIENT
+    assert call.status.status_code == StatusCode.UNSET
+    assert call.attributes is not None
+    assert dict(call.attributes) == {
+        "http.request.method": "GET",
+        "url.template": PATH,
+        "server.address": "open.api.nexon.com",
+        "http.response.status_code": 200,
+        "http.response.body.size": len(httpx.Response(200, json=BODY).content),
+        "nexon.retries": 1,
+    }
+
+    call_context = call.get_span_context()
+    assert call_context is not None
+    children = [span for span in spans if span is not call]
+    assert {span.name for span in children} == {"attempt", "retry sleep", "parse"}
+    for child in children:
+        assert child.parent is not None and child.parent.span_id == call_context.span_id
+        assert child.context is not None and child.context.trace_id == call_context.trace_id
+
+    failed, succeeded = sorted(by_name(spans, "attempt"), key=lambda span: span.start_time or 0)
+    assert failed.attributes is not None and succeeded.attributes is not None
+    assert failed.status.status_code == StatusCode.ERROR
+    assert failed.attributes["nexon.attempt"] == 1
+    assert failed.attributes["http.response.status_code"] == 500
+    assert failed.attributes["error.type"] == "500"
+    assert succeeded.status.status_code == StatusCode.UNSET
+    assert succeeded.attributes["nexon.attempt"] == 2
+    assert succeeded.attributes["http.request.resend_count"] == 1
+
+    (sleep,) = by_name(spans, "retry sleep")
+    assert sleep.attributes is not None and sleep.attributes["nexon.retry.delay"] == pytest.approx(0.01)
+    assert failed.end_time is not None and sleep.start_time is not None and sleep.end_time is not None
+    assert failed.end_time <= sleep.start_time
+    assert succeeded.start_time is not None and sleep.end_time <= succeeded.start_time
+
+    (parse,) = by_name(spans, "parse")
+    assert succeeded.end_time is not None and parse.start_time is not None
+    assert parse.start_time >= succeeded.start_time
+
+
+def test_traces_call_attempts_retry_sleep_and_parse() -> None:
+    tracer, exporter = tracing()
+    client = NexonOpenAPI(
+        api_key="test",
+        tracing=tracer,
+        backoff=backoff(),
+        http_client=httpx.Client(transport=httpx.MockTransport(flaky_handler([500]))),
+    )
+
+    basic = client.maplestory.get_character_basic(ocid="ocid")
+
+    assert basic.character_name == "캐릭터"
+    check_retried_call(exporter.get_finished_spans())
+
+
+@pytest.mark.anyio
+async def test_async_traces_call_attempts_retry_sleep_and_parse() -> None:
+    tracer, exporter = tracing()
+    client = NexonOpenAPIAsync(
+        api_key="test",
+        tracing=tracer,
+        backoff=backoff(),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(flaky_handler([500]))),
+    )
+
+    basic = await client.maplestory.get_character_basic(ocid="ocid")
+
+    assert basic.character_name == "캐릭터"
+    check_retried_call(exporter.get_finished_spans())
+
+
+def test_failed_call_records_the_error() -> None:
+    tracer, exporter = tracing()
+    client = NexonOpenAPI(
+        api_key="test",
+        tracing=tracer,
+        max_retries=0,
+        http_client=httpx.Client(transport=httpx.MockTransport(flaky_handler([500]))),
+    )
+
+    with pytest.raises(InternalServerError):
+        client.maplestory.get_character_basic(ocid="ocid")
+
+    spans = exporter.get_finished_spans()
+    (call,) = by_name(spans, CALL)
+    assert call.status.status_code == StatusCode.ERROR
+    assert call.attributes is not None and call.attributes["http.response.status_code"] == 500
+    assert any(event.name == "exception" for event in call.events)
+    (attempt,) = by_name(spans, "attempt")
+    assert attempt.status.status_code == StatusCode.ERROR
+    assert by_name(spans, "parse") == []
+
+
+def test_cache_hit_is_recorded_without_attempts() -> None:
+    tracer, exporter = tracing()
+    client = NexonOpenAPI(
+        api_key="test",
+        tracing=tracer,
+        cache=InMemoryCache(),
+        cache_policy=CachePolicy(default_ttl=60),
+        http_client=httpx.Client(transport=httpx.MockTransport(flaky_handler([]))),
+    )
+
+    client.maplestory.get_character_basic(ocid="ocid")
+    exporter.clear()
+    client.maplestory.get_character_basic(ocid="ocid")
+
+    spans = exporter.get_finished_spans()
+    (call,) = by_name(spans, CALL)
+    assert call.attributes is not None and call.attributes["nexon.cache_hit"] == "cache"
+    assert by_name(spans, "attempt") == []
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Union, Optional
+from datetime import date, datetime
+
+from typing_extensions import Required, Annotated, TypedDict
+
+from nexon_openapi._models import BaseModel
+from nexon_openapi.utils import maybe_transform
+from nexon_openapi.utils._transform import PropertyInfo, transform, _transformers, _get_transformer
+
+
+class Equipment(TypedDict, total=False):
+    item_name: Required[Annotated[str, PropertyInfo(alias="itemName")]]
+    starforce: int
+    date_expire: Annotated[Optional[datetime], PropertyInfo(alias="dateExpire", format="iso8601")]
+
+
+class Character(TypedDict, total=False):
+    character_name: Required[Annotated[str, PropertyInfo(alias="characterName")]]
+    date: Annotated[date, PropertyInfo(format="custom", format_template="%Y%m%d")]
+    equipment: List[Equipment]
+    preset: Optional[Equipment]
+    symbol: Union[Equipment, str]
+    guild: Annotated[Optional[Guild], PropertyInfo(alias="guildInfo")]
+
+
+class Guild(TypedDict, total=False):
+    guild_name: Annotated[str, PropertyInfo(alias="guildName")]
+    # self-referencing, the fields are resolved on first use
+    parent: Optional[Guild]
+
+
+class RenamedCharacter(TypedDict, total=False):
+    character_name: Annotated[str, PropertyInfo(alias="name")]
+
+
+class Stat(BaseModel):
+    stat_name: str
+    stat_value: Optional[str] = None
+
+
+def test_aliases_and_formats() -> None:
+    params: Dict[str, Any] = {
+        "character_name": "아델",
+        "date": date(2024, 1, 2),
+        "unknown": date(2024, 1, 2),
+    }
+
+    assert transform(params, Character) == {
+        "characterName": "아델",
+        "date": "20240102",
+        # keys without type information are kept as they are
+        "unknown": date(2024, 1, 2),
+    }
+
+
+def test_nested_and_optional_fields() -> None:
+    expire = datetime(2024, 1, 2, 3, 4, 5)
+    params: Dict[str, Any] = {
+        "character_name": "아델",
+        "equipment": [{"item_name": "a", "starforce": 22, "date_expire": expire}, {"item_name": "b"}],
+        "preset": {"item_name": "c", "date_expire": None},
+        "symbol": {"item_name": "d"},
+        "guild": {"guild_name": "길드", "parent": {"guild_name": "연합", "parent": None}},
+    }
+
+    assert transform(params, Character) == {
+        "characterName": "아델",
+        "equipment": [{"itemName": "a", "starforce": 22, "dateExpire": "2024-01-02T03:04:05"}, {"itemName": "b"}],
+        "preset": {"itemName": "c", "dateExpire": None},
+        "symbol": {"itemName": "d"},
+        "guildInfo": {"guildName": "길드", "parent": {"guildName": "연합", "parent": None}},
+    }
+
+
+def test_values_that_do_not_match_the_type_are_kept() -> None:
+    params: Dict[str, Any] = {"character_name": "아델", "equipment": "not a list", "preset": None, "symbol": "e"}
+
+    assert transform(params, Character) == {
+        "characterName": "아델",
+        "equipment": "not a list",
+        "preset": None,
+        "symbol": "e",
+    }
+    assert transform([{"item_name": "a"}, "b"], List[Equipment]) == [{"itemName": "a"}, "b"]
+    assert maybe_transform(None, Character) is None
+
+
+def test_models_are_dumped() -> None:
+    assert transform(Stat(stat_name="STR"), Stat) == {"stat_name": "STR"}
+    # the values of a plain dict are not transformed
+    assert transform({"stats": Stat(stat_name="STR")}, Dict[str, Any]) == {"stats": Stat(stat_name="STR")}
+
+
+def test_transformers_are_cached_per_type() -> None:
+    params: Dict[str, Any] = {"character_name": "아델"}
+
+    assert transform(params, Character) == {"characterName": "아델"}
+    transformer = _transformers[(Character, Character)]
+    assert transform(params, Character) == {"characterName": "아델"}
+    assert _get_transformer(Character, Character) is transformer
+
+    # the same field of another type is renamed by its own annotation
+    assert transform(params, RenamedCharacter) == {"name": "아델"}
+    assert _get_transformer(RenamedCharacter, RenamedCharacter) is not transformer
+    assert transform(params, Character) == {"characterName": "아델"}
+
+    # a list of a type has a transformer of its own
+    assert transform([params], List[RenamedCharacter]) == [{"name": "아델"}]
+    assert (List[RenamedCharacter], List[RenamedCharacter]) in _transformers